@@ -17,7 +17,8 @@ This module defines two central abstractions:
     - A set of class-level attribute defaults that subclasses override.
     - The ``execute()`` gate method, which enforces version, tool, and
       architecture requirements before delegating to ``run()``.
-    - The ``shell()`` helper for safe subprocess execution.
+    - The ``shell()`` helper for safe subprocess execution, and
+      ``shell_grep()`` for streaming large outputs through a line filter.
     - Convenience factory methods (``_pass``, ``_warning``, etc.) that
       return pre-populated ``CheckResult`` instances.
 
@@ -42,11 +43,13 @@ Note:
 """
 
 import os
+import re
 import shutil
 import subprocess
+import threading
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Any, Literal
+from typing import Any, Literal, Sequence
 
 from macaudit.constants import (
     CRITICAL_PENALTY,
@@ -116,8 +119,9 @@ class CheckResult:
             ``auto_sudo`` fixes.  Must never be constructed from user input.
         fix_url (str | None): System Settings deep-link URL for ``guided``
             fixes (e.g. ``"x-apple.systempreferences:com.apple.preference..."``)
-        fix_steps (list[str] | None): Numbered manual steps for
-            ``instructions`` fixes.
+        fix_steps (Sequence[str] | None): Numbered manual steps for
+            ``instructions`` fixes.  Normally the check class's immutable
+            tuple, shared by reference rather than copied per result.
         fix_reversible (bool): ``True`` if the fix can be undone.
             ``False`` for destructive or one-way changes (e.g. software
             updates, Rosetta installation).  Irreversible fixes are
@@ -167,7 +171,7 @@ class CheckResult:
     fix_description: str                  # One sentence describing what the fix does
     fix_command:     list[str] | None = None   # Arg list for auto/auto_sudo fixes
     fix_url:         str | None = None         # System Settings deep-link (guided)
-    fix_steps:       list[str] | None = None   # Manual steps (instructions)
+    fix_steps:       Sequence[str] | None = None  # Manual steps (instructions)
     fix_reversible:  bool = True               # Whether the fix can be undone
     fix_time_estimate: str = "~30 seconds"     # Human-readable duration estimate
     requires_sudo:   bool = False              # True if fix needs admin privileges
@@ -236,7 +240,8 @@ class BaseCheck(ABC):
         fix_description (str): One-line description of what the fix does.
         fix_command (list[str] | None): Shell command for auto fixes.
         fix_url (str | None): Deep-link URL for guided fixes.
-        fix_steps (list[str] | None): Manual steps for instruction fixes.
+        fix_steps (tuple[str, ...] | None): Manual steps for instruction
+            fixes.  A tuple so every result can share it safely.
         fix_reversible (bool): Whether the fix can be undone.
         fix_time_estimate (str): Human-readable fix duration.
         requires_sudo (bool): Whether the fix needs admin privileges.
@@ -280,7 +285,7 @@ class BaseCheck(ABC):
     fix_description:   str             = "No fix available"
     fix_command:       list[str] | None = None
     fix_url:           str | None       = None
-    fix_steps:         list[str] | None = None
+    fix_steps:         tuple[str, ...] | None = None
     fix_reversible:    bool = True
     fix_time_estimate: str  = "~30 seconds"
     requires_sudo:     bool = False
@@ -450,6 +455,86 @@ class BaseCheck(ABC):
         except Exception as e:
             return -1, "", str(e)
 
+    def shell_grep(
+        self,
+        cmd: list[str],
+        pattern: re.Pattern[str],
+        timeout: int = 10,
+        prefix: str = "",
+    ) -> tuple[int, list[re.Match[str]]]:
+        """Run a subprocess and keep only the stdout lines matching *pattern*.
+
+        Use this instead of ``shell()`` for commands whose output can run to
+        many kilobytes (``scutil --dns``, ``security find-certificate``) when
+        the check only needs a handful of lines.  Stdout is read line by line
+        from a pipe and each line is tested with ``pattern.search``; the full
+        output is never held in memory.  The same C-locale override as
+        ``shell()`` applies, and stderr is discarded.
+
+        Args:
+            cmd (list[str]): The command and its arguments as a list.  Must
+                never be constructed from user-supplied input.
+            pattern (re.Pattern[str]): Pre-compiled pattern applied to each
+                line with ``search()``.  Compile it once at module level.
+            timeout (int): Maximum seconds before the process is killed.
+                Defaults to 10.
+            prefix (str): Optional literal every wanted line starts with.
+                Lines without it are discarded by ``str.startswith`` before
+                the regex runs, which is far cheaper when most lines are
+                irrelevant.  Defaults to ``""`` (no prefilter).
+
+        Returns:
+            tuple[int, list[re.Match[str]]]: A two-element tuple of:
+                - ``returncode`` (int): The process exit code, or ``-1``
+                  on timeout, binary not found, or other execution error.
+                - ``matches`` (list[re.Match[str]]): Match objects for the
+                  matching lines, in output order.  Lines read before a
+                  timeout are still returned.
+
+        Example::
+
+            rc, matches = self.shell_grep(["scutil", "--dns"], _NS_RE)
+            servers = [m.group(1) for m in matches]
+        """
+        _env = {**os.environ, "LANG": "C", "LC_ALL": "C"}
+        try:
+            proc = subprocess.Popen(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                env=_env,
+            )
+        except Exception:
+            return -1, []
+
+        # A blocking readline cannot observe a deadline, so a timer kills
+        # the process instead; the loop then ends at EOF.
+        timer = threading.Timer(timeout, proc.kill)
+        timer.start()
+        matches: list[re.Match[str]] = []
+        try:
+            search = pattern.search
+            for line in proc.stdout or ():
+                if not line.startswith(prefix):
+                    continue
+                m = search(line)
+                if m:
+                    matches.append(m)
+            rc = proc.wait()
+        except Exception:
+            proc.kill()
+            proc.wait()
+            rc = -1
+        finally:
+            timer.cancel()
+            if proc.stdout is not None:
+                proc.stdout.close()
+
+        # A negative return code means the process died from a signal
+        # (our timeout kill included).
+        return (-1 if rc < 0 else rc), matches
+
     def _result(
         self,
         status: Literal["pass", "warning", "critical", "info", "skip", "error"],
@@ -75,11 +75,11 @@ class XcodeToolsCheck(BaseCheck):
 
     fix_level = "instructions"
     fix_description = "Install or update Xcode Command Line Tools."
-    fix_steps = [
+    fix_steps = (
         "To install: xcode-select --install",
         "To update:  softwareupdate --all --install --force",
         "Or: System Settings → Software Update",
-    ]
+    )
     fix_reversible = True
     fix_time_estimate = "~5 minutes"
 
@@ -152,12 +152,12 @@ class PythonConflictsCheck(BaseCheck):
 
     fix_level = "instructions"
     fix_description = "Use virtual environments to isolate project dependencies."
-    fix_steps = [
+    fix_steps = (
         "Run: which -a python3  (see all python3 in PATH)",
         "For each project: python3 -m venv .venv && source .venv/bin/activate",
         "To standardise: use pyenv to manage Python versions",
         "Homebrew users: avoid 'pip install' globally, prefer venvs",
-    ]
+    )
     fix_reversible = True
     fix_time_estimate = "~10 minutes"
 
@@ -228,11 +228,11 @@ class CondaCheck(BaseCheck):
     fix_level = "instructions"
     fix_description = "Disable conda auto-activation to prevent PATH conflicts."
     fix_command = ["conda", "config", "--set", "auto_activate_base", "false"]
-    fix_steps = [
+    fix_steps = (
         "Run: conda config --set auto_activate_base false",
         "Restart your terminal",
         "Use 'conda activate <env>' only when working in conda projects",
-    ]
+    )
     fix_reversible = True
     fix_time_estimate = "~1 minute"
 
@@ -336,11 +336,11 @@ class NodeManagerCheck(BaseCheck):
 
     fix_level = "instructions"
     fix_description = "Standardise on one Node version manager."
-    fix_steps = [
+    fix_steps = (
         "Run: which -a node  (see all node binaries in PATH)",
         "Remove unused manager init lines from ~/.zshrc / ~/.bashrc",
         "volta and fnm are fastest; nvm is most widely used",
-    ]
+    )
     fix_reversible = True
     fix_time_estimate = "~10 minutes"
 
@@ -436,13 +436,13 @@ class RubyConflictsCheck(BaseCheck):
 
     fix_level = "instructions"
     fix_description = "Ensure Homebrew or rbenv ruby comes before system ruby in PATH."
-    fix_steps = [
+    fix_steps = (
         "Run: which -a ruby  (see all ruby in PATH)",
         "If system ruby is first, add to ~/.zshrc:",
         "  export PATH=\"$(brew --prefix)/opt/ruby/bin:$PATH\"",
         "Or: eval \"$(rbenv init -)\"  (if using rbenv)",
         "Then: exec $SHELL  to reload",
-    ]
+    )
     fix_reversible = True
     fix_time_estimate = "~5 minutes"
 
@@ -531,11 +531,11 @@ class GitConfigCheck(BaseCheck):
 
     fix_level = "instructions"
     fix_description = "Configure git identity and use osxkeychain for secure credentials."
-    fix_steps = [
+    fix_steps = (
         "git config --global user.name 'Your Name'",
         "git config --global user.email 'your@email.com'",
         "git config --global credential.helper osxkeychain",
-    ]
+    )
     fix_reversible = True
     fix_time_estimate = "~2 minutes"
 
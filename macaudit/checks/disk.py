@@ -386,12 +386,12 @@ class APFSSnapshotsCheck(BaseCheck):
     )
     fix_level = "instructions"
     fix_description = "Thin local snapshots (let Time Machine decide what's safe)"
-    fix_steps = [
+    fix_steps = (
         "Only do this if you're very low on space",
         "Run: tmutil thinlocalsnapshots / 50000000000 4",
         "Time Machine will reclaim space from old snapshots safely",
         "Do NOT run tmutil deletelocalsnapshots — it's destructive",
-    ]
+    )
     fix_reversible = False
     fix_time_estimate = "~1 minute"
 
@@ -838,7 +838,7 @@ class AppCachesCheck(BaseCheck):
         fix_level (str): ``"instructions"`` — clearing caches requires
             manual review because some caches (e.g. Xcode, Safari) have
             in-app clearing workflows.
-        fix_steps (list[str]): Guidance to navigate to the directory in
+        fix_steps (tuple[str, ...]): Guidance to navigate to the directory in
             Finder and delete large sub-folders, or run ``rm -rf`` after
             logging out.
         fix_reversible (bool): ``True`` — apps rebuild caches automatically.
@@ -866,12 +866,12 @@ class AppCachesCheck(BaseCheck):
     )
     fix_level = "instructions"
     fix_description = "Clear app caches manually"
-    fix_steps = [
+    fix_steps = (
         "Open Finder, press Cmd+Shift+G, enter ~/Library/Caches",
         "Review the largest folders",
         "Delete caches for apps you use regularly (they'll rebuild)",
         "Or run: rm -rf ~/Library/Caches/* (log out and back in first)",
-    ]
+    )
     fix_reversible = True
     fix_time_estimate = "~5 minutes"
 
@@ -1061,7 +1061,7 @@ class iOSBackupsCheck(BaseCheck):
         fix_level (str): ``"instructions"`` — deletion is best done through
             Finder's "Manage Backups" UI to avoid accidentally removing a
             backup that is still needed.
-        fix_steps (list[str]): Step-by-step guide using Finder's device
+        fix_steps (tuple[str, ...]): Step-by-step guide using Finder's device
             management UI, plus the manual filesystem path as an alternative.
         fix_reversible (bool): ``False`` — deleted backups cannot be recovered.
         fix_time_estimate (str): About 5 minutes to review and delete.
@@ -1087,13 +1087,13 @@ class iOSBackupsCheck(BaseCheck):
     )
     fix_level = "instructions"
     fix_description = "Delete old device backups through Finder"
-    fix_steps = [
+    fix_steps = (
         "Connect any iOS device to your Mac",
         "In Finder's sidebar, select the device",
         "Click 'Manage Backups' to see all stored backups",
         "Right-click old/unknown device backups and delete them",
         "Or navigate to ~/Library/Application Support/MobileSync/Backup",
-    ]
+    )
     fix_reversible = False
     fix_time_estimate = "~5 minutes"
 
@@ -7,9 +7,9 @@ subclass of :class:`~macaudit.checks.base.BaseCheck` and exposes its findings
 as a :class:`~macaudit.checks.base.CheckResult`.
 
 Design decisions:
-    - ``_get_power_data()`` is decorated with ``@lru_cache(maxsize=1)`` so that
+    - ``_get_power_data()`` is decorated with ``@scan_cache()`` so that
       ``system_profiler SPPowerDataType`` (which takes ~1–3 s to run) is invoked
-      exactly once per process even though both ``BatteryCheck`` and future
+      exactly once per scan even though both ``BatteryCheck`` and future
       power-related checks may call it.
     - SMART status is queried via ``diskutil info /`` rather than ``diskutil info
       disk0`` to correctly handle external boot drives, Fusion Drives, and APFS
@@ -44,8 +44,8 @@ from __future__ import annotations
 
 import os
 import re
+import subprocess
 from datetime import datetime, timedelta
-from functools import lru_cache
 
 from macaudit.checks.base import BaseCheck, CheckResult
 from macaudit.constants import (
@@ -54,20 +54,20 @@ from macaudit.constants import (
     KERNEL_PANIC_CRITICAL,
     KERNEL_PANIC_WARNING,
 )
-from macaudit.system_info import IS_APPLE_SILICON
+from macaudit.system_info import IS_APPLE_SILICON, scan_cache
 
 
 # ── Shared data fetcher ────────────────────────────────────────────────────────
 
-@lru_cache(maxsize=1)
+@scan_cache()
 def _get_power_data() -> str:
     """Invoke ``system_profiler SPPowerDataType`` once and cache the result.
 
     ``system_profiler SPPowerDataType`` outputs detailed power and battery
     information in a human-readable property-list style text format. The call
     typically takes 1–3 seconds because the tool enumerates hardware via IOKit.
-    The ``@lru_cache`` decorator ensures this cost is paid only once per
-    process lifetime even when multiple checks request the same data.
+    The ``@scan_cache`` decorator ensures this cost is paid only once per
+    scan even when multiple checks request the same data.
 
     CLI command::
 
@@ -90,7 +90,6 @@ def _get_power_data() -> str:
         if "Battery Information" in raw:
             print("Battery present")
     """
-    import subprocess
     try:
         # Force the C locale so all system_profiler output is in English.
         # macOS system tools respect LANG/LC_ALL even when the GUI is set
@@ -151,7 +150,7 @@ class BatteryCheck(BaseCheck):
         fix_level (str): ``"instructions"`` — no automated fix is possible
             for battery replacement; only guidance is provided.
         fix_description (str): One-line summary of the manual guidance.
-        fix_steps (list[str]): Step-by-step instructions for the user.
+        fix_steps (tuple[str, ...]): Step-by-step instructions for the user.
         fix_reversible (bool): ``True`` — battery replacement is a physical
             repair, not a software change; this flag marks the check as
             fixable in principle.
@@ -180,11 +179,11 @@ class BatteryCheck(BaseCheck):
 
     fix_level = "instructions"
     fix_description = "Open System Settings → Battery to see detailed health info."
-    fix_steps = [
+    fix_steps = (
         "Open System Settings → Battery",
         "Click 'Battery Health…' for full details",
         "If 'Service Recommended', schedule a Genius Bar appointment",
-    ]
+    )
     fix_reversible = True
     fix_time_estimate = "N/A"
 
@@ -310,7 +309,7 @@ class SMARTStatusCheck(BaseCheck):
         fix_level (str): ``"instructions"`` — a failing SMART status requires
             immediate backup and hardware replacement; no automation is possible.
         fix_description (str): Brief description of the recommended manual steps.
-        fix_steps (list[str]): Step-by-step recovery instructions.
+        fix_steps (tuple[str, ...]): Step-by-step recovery instructions.
         fix_reversible (bool): ``False`` — drive failure is not reversible.
         fix_time_estimate (str): ``"N/A"`` — depends on hardware availability.
     """
@@ -337,11 +336,11 @@ class SMARTStatusCheck(BaseCheck):
 
     fix_level = "instructions"
     fix_description = "Immediate backup recommended if status is Failing."
-    fix_steps = [
+    fix_steps = (
         "Back up with Time Machine or another backup solution immediately",
         "Run Apple Diagnostics: restart and hold D key",
         "Schedule a Genius Bar appointment for drive replacement",
-    ]
+    )
     fix_reversible = False
     fix_time_estimate = "N/A"
 
@@ -459,7 +458,7 @@ class KernelPanicCheck(BaseCheck):
         fix_level (str): ``"instructions"`` — diagnosis requires manual steps;
             no automated resolution is possible.
         fix_description (str): Brief description of manual investigation steps.
-        fix_steps (list[str]): Step-by-step diagnostic instructions.
+        fix_steps (tuple[str, ...]): Step-by-step diagnostic instructions.
         fix_reversible (bool): ``True`` — investigating panics does not modify
             the system.
         fix_time_estimate (str): ``"~20 minutes"`` for Apple Diagnostics run.
@@ -490,11 +489,11 @@ class KernelPanicCheck(BaseCheck):
 
     fix_level = "instructions"
     fix_description = "Run Apple Diagnostics and check logs for panic cause."
-    fix_steps = [
+    fix_steps = (
         "Restart Mac, hold D to boot into Apple Diagnostics",
         "Check panic report: Console.app → Crash Reports → Kernel",
         "If third-party kexts listed, update or remove them",
-    ]
+    )
     fix_reversible = True
     fix_time_estimate = "~20 minutes"
 
@@ -627,7 +626,7 @@ class ThermalCheck(BaseCheck):
         fix_level (str): ``"instructions"`` — remediation requires physical
             actions (unblock vents, quit apps) that cannot be automated.
         fix_description (str): Brief summary of suggested manual steps.
-        fix_steps (list[str]): Ordered remediation instructions.
+        fix_steps (tuple[str, ...]): Ordered remediation instructions.
         fix_reversible (bool): ``True`` — all steps are reversible.
         fix_time_estimate (str): ``"~5 minutes"`` for basic remediation.
     """
@@ -654,12 +653,12 @@ class ThermalCheck(BaseCheck):
 
     fix_level = "instructions"
     fix_description = "Check Activity Monitor for CPU-intensive processes causing heat."
-    fix_steps = [
+    fix_steps = (
         "Open Activity Monitor → Energy tab",
         "Identify high-impact processes and quit unnecessary ones",
         "Ensure Mac is on a hard flat surface with vents unobstructed",
         "For Intel Macs: consider SMC reset if problem persists",
-    ]
+    )
     fix_reversible = True
     fix_time_estimate = "~5 minutes"
 
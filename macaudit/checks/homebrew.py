@@ -35,9 +35,8 @@ Design decisions:
       this deliberately limited scope.
     - Dry-run flags (``--dry-run``) are used wherever available to avoid
       side effects during an audit pass.
-    - The ``import re`` inside ``HomebrewCleanupCheck.run`` is intentional:
-      ``re`` is only needed in that one method, and keeping it local avoids
-      polluting the module namespace given that most other checks don't use it.
+    - All imports live at module scope, like every other check module, so
+      no ``run()`` pays the import-statement lookup on each call.
 
 Attributes:
     _BREW_MISSING_MSG (str): Standard skip message emitted by the base class
@@ -47,6 +46,8 @@ Attributes:
         to the main runner. Consumed by ``macaudit/main.py`` at startup.
 """
 
+import re
+
 from macaudit.checks.base import BaseCheck, CheckResult
 from macaudit.constants import BREW_CACHE_WARNING_MB
 
@@ -561,7 +562,6 @@ class HomebrewCleanupCheck(_HomebrewBase):
         output = stdout + stderr
 
         # Parse "This operation would free X.XGB of disk space."
-        import re
         match = re.search(
             r"would free (\d+(?:\.\d+)?)\s*(B|KB|MB|GB|TB)",
             output,
@@ -60,6 +60,7 @@ import time
 from pathlib import Path
 
 from macaudit.checks.base import BaseCheck, CheckResult
+from macaudit.system_info import stat_path
 
 HOME = Path.home()
 
@@ -164,7 +165,7 @@ class ClamAVCheck(BaseCheck):
         fix_level (str): ``"instructions"`` — multi-step terminal commands
             are required; no single automated command can handle the full setup.
         fix_description (str): Summary of the remediation goal.
-        fix_steps (list[str]): Ordered list of terminal commands to install
+        fix_steps (tuple[str, ...]): Ordered list of terminal commands to install
             ClamAV, configure freshclam, fetch initial signatures, and enable
             the auto-update service.
         fix_reversible (bool): ``True`` — ClamAV can be uninstalled via
@@ -200,12 +201,12 @@ class ClamAVCheck(BaseCheck):
     )
     fix_level = "instructions"
     fix_description = "Install ClamAV and configure automatic signature updates"
-    fix_steps = [
+    fix_steps = (
         "Install: brew install clamav",
         "Configure: cp $(brew --prefix)/etc/clamav/freshclam.conf.sample $(brew --prefix)/etc/clamav/freshclam.conf",
         "Fetch initial signatures: freshclam",
         "Enable auto-updates: brew services start clamav",
-    ]
+    )
     fix_reversible = True
     fix_time_estimate = "~10 minutes"
 
@@ -249,7 +250,7 @@ class ClamAVCheck(BaseCheck):
         if not clamscan_path:
             # No ClamAV — report whether macOS XProtect provides a baseline
             # so we don't overstate the Mac's exposure.
-            xprotect_present = _XPROTECT_BUNDLE.exists()
+            xprotect_present = stat_path(_XPROTECT_BUNDLE) is not None
             if xprotect_present:
                 return self._warning(
                     "No dedicated antivirus found — macOS XProtect provides a "
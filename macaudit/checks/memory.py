@@ -89,7 +89,7 @@ class MemoryPressureCheck(BaseCheck):
         fix_level (str): ``"instructions"`` — remediation requires quitting
             apps; no automation is possible without user decision-making.
         fix_description (str): Brief summary of manual remediation steps.
-        fix_steps (list[str]): Ordered Activity Monitor instructions.
+        fix_steps (tuple[str, ...]): Ordered Activity Monitor instructions.
         fix_reversible (bool): ``True`` — quitting apps is reversible.
         fix_time_estimate (str): ``"~2 minutes"`` to review and quit apps.
     """
@@ -116,12 +116,12 @@ class MemoryPressureCheck(BaseCheck):
 
     fix_level = "instructions"
     fix_description = "Quit RAM-heavy apps and check Activity Monitor → Memory tab."
-    fix_steps = [
+    fix_steps = (
         "Open Activity Monitor → Memory tab",
         "Sort by 'Memory' column to find top consumers",
         "Quit apps you don't need right now",
         "Check the Memory Pressure graph at the bottom for trend",
-    ]
+    )
     fix_reversible = True
     fix_time_estimate = "~2 minutes"
 
@@ -384,7 +384,7 @@ class TopCPUCheck(BaseCheck):
         fix_level (str): ``"instructions"`` — the user must decide which
             processes to quit; this cannot be automated safely.
         fix_description (str): Brief Activity Monitor guidance.
-        fix_steps (list[str]): Step-by-step Activity Monitor instructions.
+        fix_steps (tuple[str, ...]): Step-by-step Activity Monitor instructions.
         fix_reversible (bool): ``True`` — quitting processes is reversible.
         fix_time_estimate (str): ``"~2 minutes"`` to review and act.
     """
@@ -410,12 +410,12 @@ class TopCPUCheck(BaseCheck):
 
     fix_level = "instructions"
     fix_description = "Use Activity Monitor to identify and quit runaway processes."
-    fix_steps = [
+    fix_steps = (
         "Open Activity Monitor → CPU tab",
         "Sort by '%CPU' column",
         "Identify unexpected high-CPU processes",
         "Double-click → Quit or Force Quit if needed",
-    ]
+    )
     fix_reversible = True
     fix_time_estimate = "~2 minutes"
 
@@ -518,7 +518,7 @@ class TopMemoryCheck(BaseCheck):
         fix_level (str): ``"instructions"`` — quitting apps requires user
             decision; cannot be automated.
         fix_description (str): Brief Activity Monitor guidance.
-        fix_steps (list[str]): Step-by-step Activity Monitor instructions.
+        fix_steps (tuple[str, ...]): Step-by-step Activity Monitor instructions.
         fix_reversible (bool): ``True`` — quitting apps is reversible.
         fix_time_estimate (str): ``"~2 minutes"`` to review and act.
     """
@@ -545,11 +545,11 @@ class TopMemoryCheck(BaseCheck):
 
     fix_level = "instructions"
     fix_description = "Quit memory-heavy apps you don't need right now."
-    fix_steps = [
+    fix_steps = (
         "Open Activity Monitor → Memory tab",
         "Sort by 'Memory' column",
         "Quit apps consuming large memory that you don't need",
-    ]
+    )
     fix_reversible = True
     fix_time_estimate = "~2 minutes"
 
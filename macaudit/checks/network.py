@@ -7,11 +7,15 @@ configuration, proxy settings, listening ports, and Bluetooth exposure.
 
 Design decisions:
     - All service-detection checks (SSH, Screen Sharing, File Sharing, Internet
-      Sharing) use ``launchctl list <service-name>`` as the primary probe.
+      Sharing) use launchd job state as the primary probe.
       This is more reliable than reading plist files directly because launchctl
       reflects the *live* kernel service state, not just the stored preference.
       Plist files are read as a fallback when launchctl is unavailable (e.g.
       when macaudit runs in a non-standard user context).
+    - Screen Sharing and File Sharing share a single ``launchctl list``
+      snapshot (:func:`~macaudit.system_info.get_launchd_jobs`, cached with
+      ``@scan_cache``) so each service probe is a dictionary lookup instead of
+      a separate fork.
     - The DNS check targets only **public IPv4** addresses not in the
       known-safe set.  Private RFC-1918 ranges (10.x, 192.168.x, 172.16–31.x)
       and IPv6 addresses are unconditionally excluded; DHCP-assigned local
@@ -25,6 +29,10 @@ Design decisions:
     - Loopback-only listeners (127.0.0.1, ::1) are excluded from the
       ListeningPortsCheck because they are not reachable from the network and
       never represent an external exposure.
+    - Saved Wi-Fi networks are read in-process through ``CoreWLAN`` when the
+      optional ``pyobjc-framework-CoreWLAN`` package is installed.  This avoids
+      two ``networksetup`` forks and the BSD-interface-name heuristic.  When
+      pyobjc is absent the check falls back to ``networksetup``.
 
 Checks:
     - :class:`AirDropCheck`          — AirDrop discoverability setting.
@@ -45,6 +53,12 @@ Attributes:
     _PRIVATE_PREFIXES (tuple[str, ...]): Tuple of address prefixes that
         identify RFC-1918 private network ranges and loopback.  Used by
         DNSCheck to unconditionally skip private-range DNS addresses.
+    _NS_RE (re.Pattern): Matches a ``nameserver[N] : <addr>`` line of
+        ``scutil --dns`` output; group 1 is the address.
+    _SHARING_URL, _NETWORK_URL (str): System Settings deep links for the
+        Sharing and Network panes, shared by the guided fixes that open them.
+    _CoreWLAN (module | None): The pyobjc ``CoreWLAN`` bridge, or ``None``
+        when ``pyobjc-framework-CoreWLAN`` is not installed.
     ALL_CHECKS (list[type[BaseCheck]]): Ordered list of check classes
         exported to the scan orchestrator.
 
@@ -60,6 +74,28 @@ import re
 import shutil
 
 from macaudit.checks.base import BaseCheck, CheckResult
+from macaudit.system_info import (
+    AFP_LABEL,
+    SCREEN_SHARING_LABEL,
+    SMB_LABEL,
+    get_launchd_jobs,
+    get_remote_login,
+)
+
+# ── Optional CoreWLAN bridge (pyobjc) ─────────────────────────────────────────
+# pyobjc is not a hard dependency.  When it is installed, SavedWifiCheck reads
+# the preferred-network list in-process instead of forking networksetup.
+try:
+    import CoreWLAN as _CoreWLAN
+except ImportError:
+    _CoreWLAN = None
+
+
+# ── System Settings deep links ───────────────────────────────────────────────
+# Shared by every guided fix that lands on the same pane.
+
+_SHARING_URL = "x-apple.systempreferences:com.apple.preference.sharing"
+_NETWORK_URL = "x-apple.systempreferences:com.apple.Network-Settings.extension"
 
 
 # ── AirDrop mode values ───────────────────────────────────────────────────────
@@ -96,7 +132,7 @@ class AirDropCheck(BaseCheck):
 
     fix_level = "guided"
     fix_description = "Change AirDrop to Contacts Only in Control Center."
-    fix_url = "x-apple.systempreferences:com.apple.preference.sharing"
+    fix_url = _SHARING_URL
     fix_reversible = True
     fix_time_estimate = "~30 seconds"
 
@@ -138,7 +174,7 @@ class AirDropCheck(BaseCheck):
 # ── Remote Login (SSH) ────────────────────────────────────────────────────────
 
 class RemoteLoginCheck(BaseCheck):
-    """Check whether SSH remote login is enabled via systemsetup or launchctl."""
+    """Check whether SSH remote login is enabled via the shared SSH state lookup."""
 
     id = "remote_login"
     name = "Remote Login (SSH)"
@@ -161,37 +197,32 @@ class RemoteLoginCheck(BaseCheck):
 
     fix_level = "guided"
     fix_description = "Disable Remote Login in System Settings → Sharing."
-    fix_url = "x-apple.systempreferences:com.apple.preference.sharing"
+    fix_url = _SHARING_URL
     fix_reversible = True
     fix_time_estimate = "~30 seconds"
 
     def run(self) -> CheckResult:
-        """Detect SSH service state via ``systemsetup -getremotelogin`` with launchctl fallback.
+        """Detect SSH service state via the shared ``get_remote_login()`` lookup.
 
-        ``systemsetup -getremotelogin`` is the canonical query but requires the
-        user to be in the ``admin`` group.  When it returns a non-zero exit code
-        (permission denied or unavailable), the check falls back to querying
-        ``launchctl list com.openssh.sshd``: a zero exit code means the SSH
-        daemon is registered and running.
+        :func:`~macaudit.system_info.get_remote_login` reads launchd's
+        override plist (falling back to ``systemsetup -getremotelogin``) once
+        per scan for every SSH-related check.  The user-domain launchd
+        snapshot cannot stand in when it has no answer: the system daemon
+        ``com.openssh.sshd`` never appears there, so an unknown state is
+        reported as such rather than as Off.
 
         Returns:
             CheckResult: A result with one of the following statuses:
 
             - ``"warning"`` — remote login is on; SSH access is open.
             - ``"pass"`` — remote login is off (SSH daemon not running).
+            - ``"info"`` — the remote login state could not be determined.
         """
-        rc, out, _ = self.shell(["systemsetup", "-getremotelogin"])
-        if rc != 0:
-            # systemsetup may require sudo — try launchctl
-            rc2, out2, _ = self.shell(
-                ["launchctl", "list", "com.openssh.sshd"]
-            )
-            if rc2 == 0:
-                return self._warning("Remote Login (SSH) appears to be enabled")
-            return self._pass("Remote Login (SSH) is Off")
+        enabled = get_remote_login()
+        if enabled is None:
+            return self._info("Could not determine whether Remote Login (SSH) is enabled")
 
-        out_lower = out.lower()
-        if "on" in out_lower:
+        if enabled:
             return self._warning(
                 "Remote Login is On — SSH access is open"
             )
@@ -201,7 +232,7 @@ class RemoteLoginCheck(BaseCheck):
 # ── Screen Sharing ────────────────────────────────────────────────────────────
 
 class ScreenSharingCheck(BaseCheck):
-    """Check whether Screen Sharing (VNC) is enabled via launchctl."""
+    """Check whether Screen Sharing (VNC) is enabled via the launchd snapshot."""
 
     id = "screen_sharing"
     name = "Screen Sharing"
@@ -223,17 +254,16 @@ class ScreenSharingCheck(BaseCheck):
 
     fix_level = "guided"
     fix_description = "Disable Screen Sharing in System Settings → Sharing."
-    fix_url = "x-apple.systempreferences:com.apple.preference.sharing"
+    fix_url = _SHARING_URL
     fix_reversible = True
     fix_time_estimate = "~30 seconds"
 
     def run(self) -> CheckResult:
-        """Detect Screen Sharing service via ``launchctl`` with ``sharing -l`` as fallback.
+        """Detect the Screen Sharing service in the cached launchd snapshot.
 
-        Queries ``launchctl list com.apple.screensharing``: a zero exit code
-        indicates the VNC daemon is registered and running.  If launchctl
-        returns an error, the check falls back to ``sharing -l`` and scans
-        output for the word ``"screen"``.
+        The ``com.apple.screensharing`` label being loaded in
+        :func:`~macaudit.system_info.get_launchd_jobs` indicates the VNC
+        daemon is registered and running.
 
         Returns:
             CheckResult: A result with one of the following statuses:
@@ -241,17 +271,8 @@ class ScreenSharingCheck(BaseCheck):
             - ``"warning"`` — Screen Sharing (VNC) is enabled.
             - ``"pass"`` — Screen Sharing is off.
         """
-        rc, out, _ = self.shell(
-            ["launchctl", "list", "com.apple.screensharing"]
-        )
-        if rc == 0:
+        if SCREEN_SHARING_LABEL in get_launchd_jobs():
             return self._warning("Screen Sharing is enabled")
-
-        # Also check via sharing command
-        rc2, out2, _ = self.shell(["sharing", "-l"])
-        if rc2 == 0 and "screen" in out2.lower():
-            return self._warning("Screen Sharing appears to be enabled")
-
         return self._pass("Screen Sharing is Off")
 
 
@@ -281,14 +302,15 @@ class FileSharingCheck(BaseCheck):
 
     fix_level = "guided"
     fix_description = "Disable File Sharing in System Settings → Sharing."
-    fix_url = "x-apple.systempreferences:com.apple.preference.sharing"
+    fix_url = _SHARING_URL
     fix_reversible = True
     fix_time_estimate = "~30 seconds"
 
     def run(self) -> CheckResult:
-        """Detect active file sharing daemons via ``launchctl`` for both SMB and AFP.
+        """Detect active file sharing daemons in the cached launchd snapshot.
 
-        Probes two launchd service labels in order:
+        Looks up two launchd service labels in
+        :func:`~macaudit.system_info.get_launchd_jobs`, in order:
         1. ``com.apple.smbd`` — the SMB (Server Message Block) file sharing daemon
            used by modern macOS.
         2. ``com.apple.AppleFileServer`` — the legacy AFP (Apple Filing Protocol)
@@ -300,13 +322,10 @@ class FileSharingCheck(BaseCheck):
             - ``"warning"`` — SMB or AFP file sharing is enabled.
             - ``"pass"`` — both SMB and AFP are off.
         """
-        # Check if smbd is running
-        rc, out, _ = self.shell(["launchctl", "list", "com.apple.smbd"])
-        if rc == 0:
+        jobs = get_launchd_jobs()
+        if SMB_LABEL in jobs:
             return self._warning("File Sharing (SMB) is enabled")
-
-        rc2, out2, _ = self.shell(["launchctl", "list", "com.apple.AppleFileServer"])
-        if rc2 == 0:
+        if AFP_LABEL in jobs:
             return self._warning("File Sharing (AFP) is enabled")
 
         return self._pass("File Sharing is Off")
@@ -331,6 +350,11 @@ _KNOWN_GOOD_DNS = {
 _PRIVATE_PREFIXES = ("192.168.", "10.", "172.16.", "172.17.", "172.18.",
                      "172.19.", "172.2", "172.30.", "172.31.", "127.")
 
+# Applied per line while streaming ``scutil --dns``; only nameserver rows
+# survive the filter, so resolver flags, search domains, and reach
+# annotations are never materialised.
+_NS_RE = re.compile(r"nameserver\[\d+\]\s*:\s*([\d.a-f:]+)")
+
 
 class DNSCheck(BaseCheck):
     """Parse scutil --dns for configured nameservers and flag unfamiliar public IPv4 addresses."""
@@ -358,15 +382,16 @@ class DNSCheck(BaseCheck):
 
     fix_level = "guided"
     fix_description = "Review DNS servers in System Settings → Network."
-    fix_url = "x-apple.systempreferences:com.apple.Network-Settings.extension"
+    fix_url = _NETWORK_URL
     fix_reversible = True
     fix_time_estimate = "~2 minutes"
 
     def run(self) -> CheckResult:
         """Parse ``scutil --dns`` for nameservers and flag unrecognised public IPv4 addresses.
 
-        Runs ``scutil --dns`` and extracts all ``nameserver[N]: <addr>`` entries
-        using a regular expression.  Each unique IPv4 address is checked against
+        Streams ``scutil --dns`` through ``shell_grep()`` so only the
+        ``nameserver[N]: <addr>`` lines are kept; the multi-kilobyte resolver
+        dump is never buffered.  Each unique IPv4 address is checked against
         the ``_PRIVATE_PREFIXES`` tuple (RFC-1918 / loopback) and the
         ``_KNOWN_GOOD_DNS`` set.  Any address that passes neither filter is
         classified as ``"suspicious"`` and triggers a warning.
@@ -383,11 +408,11 @@ class DNSCheck(BaseCheck):
               known-good or private-range lists; user should verify them.
             - ``"info"`` — all nameservers are either private-range or known-safe.
         """
-        rc, out, _ = self.shell(["scutil", "--dns"])
-        if rc != 0 or not out:
+        rc, matches = self.shell_grep(["scutil", "--dns"], _NS_RE)
+        if rc != 0:
             return self._info("Could not read DNS configuration")
 
-        servers = re.findall(r"nameserver\[[\d]+\]\s*:\s*([\d.a-f:]+)", out)
+        servers = [m.group(1) for m in matches]
         if not servers:
             return self._info("No DNS servers found in scutil output")
 
@@ -443,7 +468,7 @@ class ProxyCheck(BaseCheck):
 
     fix_level = "guided"
     fix_description = "Review proxy settings in System Settings → Network."
-    fix_url = "x-apple.systempreferences:com.apple.Network-Settings.extension"
+    fix_url = _NETWORK_URL
     fix_reversible = True
     fix_time_estimate = "~2 minutes"
 
@@ -544,9 +569,13 @@ class SavedWifiCheck(BaseCheck):
     fix_time_estimate = "~5 minutes"
 
     def run(self) -> CheckResult:
-        """Enumerate saved Wi-Fi networks via ``networksetup`` and warn above the threshold.
+        """Enumerate saved Wi-Fi networks and warn above the threshold.
+
+        When the ``CoreWLAN`` bridge is available, the network profiles of the
+        default Wi-Fi interface are counted in-process (see
+        :meth:`_corewlan_profile_count`) and no subprocess is spawned.
 
-        The Wi-Fi interface name (e.g. ``en0``) is discovered dynamically via
+        Otherwise the Wi-Fi interface name (e.g. ``en0``) is discovered dynamically via
         ``networksetup -listallhardwareports`` rather than hardcoded, because on
         Macs with multiple adapters the Wi-Fi interface may not always be ``en0``.
         If discovery fails, ``en0`` and ``en1`` are tried as fallbacks.
@@ -568,6 +597,59 @@ class SavedWifiCheck(BaseCheck):
             - ``"warning"`` — 21–30 networks.
             - ``"warning"`` — 31+ networks; auto-join attack risk highlighted.
         """
+        count = self._corewlan_profile_count()
+        if count is None:
+            count = self._networksetup_profile_count()
+        if count is None:
+            return self._info("Could not list saved Wi-Fi networks")
+
+        if count == 0:
+            return self._info("No saved Wi-Fi networks found")
+        if count > 30:
+            return self._warning(
+                f"{count} saved Wi-Fi networks — prune old ones to reduce auto-join risk",
+                data={"count": count},
+            )
+        if count > 20:
+            return self._warning(
+                f"{count} saved networks — consider removing old ones",
+                data={"count": count},
+            )
+        return self._info(
+            f"{count} saved Wi-Fi network{'s' if count != 1 else ''}",
+            data={"count": count},
+        )
+
+    def _corewlan_profile_count(self) -> int | None:
+        """Count saved networks on the default Wi-Fi interface via ``CoreWLAN``.
+
+        Returns:
+            int | None: Number of network profiles in the interface's
+            configuration, or ``None`` when pyobjc is not installed, the Mac
+            has no Wi-Fi interface, or the framework call fails.
+        """
+        if _CoreWLAN is None:
+            return None
+        try:
+            iface = _CoreWLAN.CWWiFiClient.sharedWiFiClient().interface()
+            if iface is None:
+                return None
+            config = iface.configuration()
+            if config is None:
+                return None
+            return len(config.networkProfiles())
+        except Exception:
+            # Any bridge error falls through to the networksetup path.
+            return None
+
+    def _networksetup_profile_count(self) -> int | None:
+        """Count saved networks by parsing ``networksetup`` output.
+
+        Returns:
+            int | None: Number of preferred networks listed for the Wi-Fi
+            interface, or ``None`` when no candidate interface could be
+            queried successfully.
+        """
         # Find the actual Wi-Fi interface name rather than assuming en0/en1.
         # 'networksetup -listallhardwareports' reliably maps human names to BSDs.
         wifi_iface: str | None = None
@@ -592,30 +674,13 @@ class SavedWifiCheck(BaseCheck):
             if rc == 0 and out and "Error" not in out:
                 break
         else:
-            return self._info("Could not list saved Wi-Fi networks")
+            return None
 
         lines = [
             l.strip() for l in out.splitlines()
             if l.strip() and "Preferred networks" not in l
         ]
-        count = len(lines)
-
-        if count == 0:
-            return self._info("No saved Wi-Fi networks found")
-        if count > 30:
-            return self._warning(
-                f"{count} saved Wi-Fi networks — prune old ones to reduce auto-join risk",
-                data={"count": count},
-            )
-        if count > 20:
-            return self._warning(
-                f"{count} saved networks — consider removing old ones",
-                data={"count": count},
-            )
-        return self._info(
-            f"{count} saved Wi-Fi network{'s' if count != 1 else ''}",
-            data={"count": count},
-        )
+        return len(lines)
 
 
 # ── Bluetooth ─────────────────────────────────────────────────────────────────
@@ -716,13 +781,13 @@ class ListeningPortsCheck(BaseCheck):
     )
     fix_level = "instructions"
     fix_description = "Identify and disable unexpected listening services"
-    fix_steps = [
+    fix_steps = (
         "Run: lsof -i TCP -sTCP:LISTEN -n -P",
         "Run: lsof -i UDP -n -P",
         "Identify each process by name and port number",
         "Disable unexpected services in System Settings → General → Sharing",
         "Quit or uninstall software you don't recognize",
-    ]
+    )
     fix_reversible = True
     fix_time_estimate = "10–30 minutes"
 
@@ -902,7 +967,7 @@ class InternetSharingCheck(BaseCheck):
     )
     fix_level = "guided"
     fix_description = "Disable Internet Sharing in System Settings → Sharing"
-    fix_url = "x-apple.systempreferences:com.apple.preference.sharing"
+    fix_url = _SHARING_URL
     fix_reversible = True
     fix_time_estimate = "~30 seconds"
 
@@ -157,13 +157,13 @@ class ShellSecretsCheck(BaseCheck):
 
     fix_level = "instructions"
     fix_description = "Move hardcoded secrets to a gitignored ~/.secrets file."
-    fix_steps = [
+    fix_steps = (
         "Create ~/.secrets (touch ~/.secrets && chmod 600 ~/.secrets)",
         "Move any 'export SECRET=...' lines from ~/.zshrc to ~/.secrets",
         "Add to ~/.zshrc:  [ -f ~/.secrets ] && source ~/.secrets",
         "Add ~/.secrets to ~/.gitignore (echo '~/.secrets' >> ~/.gitignore)",
         "If any secret was ever committed to a public repo: rotate it now",
-    ]
+    )
     fix_reversible = True
     fix_time_estimate = "~10 minutes"
 
@@ -15,8 +15,8 @@ configuration surfaces on a macOS system. Checks are grouped thematically:
       non-Apple and structurally suspicious entries.
     - ``LoginHooksCheck`` — Detects legacy login/logout hooks that run
       arbitrary scripts as root.
-    - ``CronJobsCheck`` — Detects user cron jobs, a classic malware persistence
-      mechanism.
+    - ``CronJobsCheck`` — Detects user and system cron jobs, a classic
+      malware persistence mechanism.
 
 **Network & traffic**
     - ``EtcHostsCheck`` — Scans ``/etc/hosts`` for rogue DNS-redirect entries.
@@ -38,68 +38,372 @@ Design decisions:
     - All checks use ``self.shell(...)`` (the base class shell wrapper) rather
       than direct ``subprocess`` calls. This keeps shell invocations testable
       and consistently handles timeout, capture, and error propagation.
-    - The ``defaults read`` approach for login settings (AutoLogin, GuestEnabled,
-      LoginHook) is preferred over reading plist files directly because
-      ``defaults`` resolves the active value accounting for managed preferences
-      and caching layers.
-    - Launch agent scanning uses filename prefix heuristics (``com.apple.*``)
-      rather than signature verification because the goal is user awareness,
-      not forensic attribution.
+      Commands with very large output (``security find-certificate``) use the
+      streaming ``self.shell_grep(...)`` variant instead.
+    - Login-window settings (AutoLogin, GuestEnabled, LoginHook) are read
+      directly from the ``com.apple.loginwindow`` plist with ``plistlib``
+      rather than through ``defaults read``.  One cached parse
+      (``_loginwindow_prefs()``) serves all three checks, replacing four
+      fork/exec round trips of a Foundation-linked binary with dict lookups.
+    - Launch agent scanning classifies jobs by the plist's ``Label`` and
+      program path rather than the spoofable filename, but stops short of
+      signature verification because the goal is user awareness, not
+      forensic attribution.
     - ``SharingServicesCheck`` uses ``launchctl list`` rather than ``lsof`` or
       ``netstat`` because it gives a definitive "is this service registered?"
-      answer without requiring elevated privileges.
+      answer without requiring elevated privileges.  The listing is taken once
+      per scan by :func:`~macaudit.system_info.get_launchd_jobs` and shared
+      with the network checks.
 
 Attributes:
     HOME (Path): Resolved home directory of the running process.
-    _STANDARD_HOSTS (frozenset[str] | set[str]): Set of hostnames that are
+    _STANDARD_HOSTS (frozenset[str]): Set of hostnames that are
         normal in any ``/etc/hosts`` file and should not be flagged.
     _LOOPBACK_PREFIXES (tuple[str, ...]): IP address prefixes that indicate
         a loopback or reserved address. Entries with these IPs are always
         skipped during ``/etc/hosts`` analysis.
+    _ETC_HOSTS (Path): Path of the system hosts file.
+    _HOSTS_CACHE (tuple | None): ``(file identity, unusual entries)`` from
+        the last ``/etc/hosts`` parse, reused while the file is unchanged.
     _LAUNCH_AGENT_DIRS (list[Path]): Ordered list of directories scanned for
         ``.plist`` persistence entries. Ordered user-level first, then system-
         level.
+    _APPLE_PROGRAM_PREFIXES (tuple[str, ...]): Apple-owned executable
+        locations; a launch job running a program elsewhere is third-party.
+    _USER_LAUNCH_DAEMONS (Path): ``~/Library/LaunchDaemons``, which should
+        be empty on a normal account; any plist there is flagged critical.
     _SSH_DIR (Path): Path to the current user's ``.ssh`` directory.
     _AUTHORIZED_KEYS (Path): Full path to the current user's
         ``~/.ssh/authorized_keys`` file.
+    _MITM_INDICATORS (tuple[str, ...]): Lowercase name fragments identifying
+        certificates from known traffic-inspection and MITM proxy tools.
+    _MITM_RE (re.Pattern): ``_MITM_INDICATORS`` compiled into a single
+        case-insensitive alternation.
+    _ALIS_PREFIX (str): Literal start of every ``"alis"`` attribute line,
+        used to discard other lines before ``_ALIS_RE`` runs.
+    _ALIS_RE (re.Pattern): Extracts the certificate common name from an
+        ``"alis"<blob>="…"`` line of ``security find-certificate`` output.
+    _KEY_LINE_RE (re.Pattern): Matches the start of each non-blank,
+        non-comment line of ``authorized_keys``.
+    _LOGINWINDOW_PLIST (Path): System-wide ``com.apple.loginwindow`` plist.
+    _USER_LOGINWINDOW_PLIST (Path): Current user's ``com.apple.loginwindow``
+        plist (the domain ``defaults read com.apple.loginwindow`` resolves to).
+    _SSHD_CONFIG (Path): The OpenSSH server configuration file.
+    _SSHD_AUTH_RE (re.Pattern[bytes]): Matches an uncommented
+        ``PasswordAuthentication`` or ``PermitRootLogin`` line in raw
+        ``sshd_config`` bytes, case-insensitively; group ``value`` is the
+        setting.
+    _SSHD_MATCH_RE (re.Pattern[bytes]): Matches an uncommented ``Match``
+        line, where the global section of ``sshd_config`` ends.
+    _ACTIVE_EXT_RE (re.Pattern): Matches a ``systemextensionsctl list`` row
+        whose bracketed state includes ``activated`` or ``enabled``; group 1
+        is the stripped row.
+    _CRON_JOB_RE (re.Pattern): Matches a non-blank, non-comment crontab
+        line; group 1 is the stripped line.
+    _CRON_TABS (Path): Directory holding each user's crontab file, named by
+        login name.
+    _CRON_DIRS (tuple[Path, ...]): Directories scanned for system-level and
+        other users' cron tables.
+    _XPROTECT_RECEIPT (Path): Installer receipt of the XProtect signature
+        package, holding its ``PackageVersion`` and ``InstallDate``.
+    _XPROTECT_BUNDLE (Path): The XProtect bundle, whose ``Info.plist`` is the
+        fallback version/date source.
     ALL_CHECKS (list[type[BaseCheck]]): Ordered list of check classes exported
         to the main runner.
 """
 
+import os
 import plistlib
+import pwd
 import re
+import time
+from datetime import datetime, timezone
 from pathlib import Path
 
 from macaudit.checks.base import BaseCheck, CheckResult
+from macaudit.system_info import (
+    SCREEN_SHARING_LABEL,
+    SMB_LABEL,
+    get_launchd_jobs,
+    get_remote_login,
+    scan_cache,
+    stat_path,
+)
 
 HOME = Path.home()
 
 # Hostnames that are always legitimate in /etc/hosts and should never be flagged.
 # These represent the default macOS /etc/hosts entries and common loop-back aliases.
-_STANDARD_HOSTS = {
+_STANDARD_HOSTS = frozenset({
     "localhost", "broadcasthost", "ip6-localhost",
     "ip6-loopback", "local",
-}
+})
 
 # IP address prefixes that identify loopback, unspecified, or reserved addresses.
 # /etc/hosts entries pointing to these IPs are benign (e.g. 127.0.0.1 localhost)
-# and are skipped during non-standard entry detection.
+# and are skipped during non-standard entry detection.  Kept as a tuple so it
+# can be passed straight to ``str.startswith``, which loops over it in C.
 _LOOPBACK_PREFIXES = ("127.", "::1", "0.0.0.0", "255.")
 
+_ETC_HOSTS = Path("/etc/hosts")
+
+# Last /etc/hosts parse keyed by (st_dev, st_ino, st_mtime_ns, st_size).  The
+# file rarely changes, so repeated scans in one process pay an fstat instead
+# of re-parsing what may be a very large ad-blocker list.
+_HOSTS_CACHE: tuple[tuple[int, int, int, int], tuple[str, ...]] | None = None
+
 # Launch agent and daemon directories, ordered from least- to most-privileged.
 # ~/Library/LaunchDaemons is included because it should be empty for all normal
 # users; its non-empty state is a structural red flag flagged at critical severity.
+_USER_LAUNCH_DAEMONS = HOME / "Library" / "LaunchDaemons"
 _LAUNCH_AGENT_DIRS = [
     HOME / "Library" / "LaunchAgents",
-    HOME / "Library" / "LaunchDaemons",   # should be empty for normal users
+    _USER_LAUNCH_DAEMONS,   # should be empty for normal users
     Path("/Library/LaunchAgents"),
     Path("/Library/LaunchDaemons"),
 ]
 
+# Executable locations that only Apple can write to (SIP-protected or the
+# Apple-reserved /Library/Apple tree).  A launch job whose program lives
+# elsewhere is not an Apple job, whatever its Label says.  /bin, /usr/bin and
+# their sbin siblings are SIP-protected too but deliberately excluded: they
+# hold shells and interpreters, so a spoofed com.apple.* job running
+# ``/bin/sh -c …`` or ``/usr/bin/python3 ~/payload.py`` would otherwise pass.
+_APPLE_PROGRAM_PREFIXES = ("/System/", "/Library/Apple/", "/usr/libexec/")
+
 # SSH directory and authorized keys paths for the current user.
 _SSH_DIR = HOME / ".ssh"
 _AUTHORIZED_KEYS = _SSH_DIR / "authorized_keys"
 
+# Lowercase name fragments identifying known MITM and traffic-inspection tools.
+# Matched case-insensitively against certificate common names extracted from
+# the System keychain.
+_MITM_INDICATORS = (
+    "zscaler", "cisco umbrella", "palo alto", "forcepoint",
+    "charles proxy", "burp suite", "fiddler", "mitmproxy",
+    "netskope", "iboss", "lightspeed", "smoothwall", "squid",
+)
+
+# All indicators compiled into one case-insensitive alternation so each
+# certificate name is tested in a single C-level regex scan.
+_MITM_RE = re.compile(
+    "|".join(re.escape(i) for i in _MITM_INDICATORS), re.IGNORECASE
+)
+
+# Certificate common name in ``security find-certificate`` output, e.g.
+#     "alis"<blob>="Apple Root CA"
+# Greedy up to the last quote on the line so names containing quotes survive;
+# hex-encoded names (<blob>=0x…) are deliberately not matched.
+_ALIS_RE = re.compile(r'"alis"<blob>="(.*)"')
+
+# ``security`` indents each attribute by four spaces, so a plain startswith
+# rejects the ~95% of dump lines that are not names without entering the regex.
+_ALIS_PREFIX = '    "alis"<blob>='
+
+# A key entry in authorized_keys: a line whose first non-blank character is
+# neither whitespace nor a comment marker.  Counting ``finditer`` hits gives the
+# key count in one pass without building a list of stripped lines.
+_KEY_LINE_RE = re.compile(r"^[ \t]*[^#\s]", re.MULTILINE)
+
+# Login-window preference files: the system-wide plist holds autoLoginUser
+# and GuestEnabled; hooks may be set in either domain.
+_LOGINWINDOW_PLIST = Path("/Library/Preferences/com.apple.loginwindow.plist")
+_USER_LOGINWINDOW_PLIST = HOME / "Library" / "Preferences" / "com.apple.loginwindow.plist"
+
+_SSHD_CONFIG = Path("/etc/ssh/sshd_config")
+
+# Authentication directives in sshd_config, applied to the raw file bytes.
+# IGNORECASE replaces a lower-cased copy of the file, anchoring at the start
+# of a line (after indentation) excludes commented-out examples, and the
+# named directive group tells the caller which one matched.
+_SSHD_AUTH_RE = re.compile(
+    rb"^[ \t]*(?:(?P<password>passwordauthentication)|(?P<root>permitrootlogin))"
+    rb"[ \t=]+(?P<value>\S+)",
+    re.MULTILINE | re.IGNORECASE,
+)
+
+# The first ``Match`` line ends the global section; every directive after it
+# belongs to a conditional block that overrides the globals.
+_SSHD_MATCH_RE = re.compile(rb"^[ \t]*match[ \t]", re.MULTILINE | re.IGNORECASE)
+
+# An active row of ``systemextensionsctl list`` output, e.g.
+#     *  *  TEAMID  com.vendor.ext (1.0/1)  Name  [activated enabled]
+# The state word must sit inside the brackets, so an extension whose *name*
+# contains "enabled" is not mistaken for an active one.
+_ACTIVE_EXT_RE = re.compile(
+    r"^[ \t]*(\S+[ \t]+[^\n]*\[[^\]\n]*(?:activated|enabled)[^\n]*?)[ \t]*$",
+    re.IGNORECASE | re.MULTILINE,
+)
+
+# A crontab entry: any line whose first non-blank character is not ``#``.
+_CRON_JOB_RE = re.compile(r"^[ \t]*([^#\s][^\n]*?)[ \t]*$", re.MULTILINE)
+
+# Where ``crontab`` stores each user's table on macOS.  The directory is
+# normally root-only; ``crontab -l`` (setuid) is the fallback when it is.
+_CRON_TABS = Path("/var/at/tabs")
+_CRON_DIRS = (Path("/etc/cron.d"), _CRON_TABS)
+
+# XProtect signature package: the installer receipt records version and
+# install date directly; the bundle's Info.plist is the fallback.
+_XPROTECT_RECEIPT = Path("/var/db/receipts/com.apple.pkg.XProtectPlistConfigData.plist")
+_XPROTECT_BUNDLE = Path("/Library/Apple/System/Library/CoreServices/XProtect.bundle")
+
+
+# ── Shared data fetchers ──────────────────────────────────────────────────────
+
+@scan_cache(maxsize=2)
+def _loginwindow_prefs(user: bool = False) -> dict:
+    """Parse a ``com.apple.loginwindow`` plist once and cache the result.
+
+    Args:
+        user (bool): ``True`` for the current user's domain
+            (``~/Library/Preferences``), ``False`` (default) for the
+            system-wide file in ``/Library/Preferences``.
+
+    Returns:
+        dict: The top-level plist dictionary, or ``{}`` if the file is
+        missing, unreadable, or not a valid plist — the same outcome as
+        ``defaults read`` reporting the key as absent.
+    """
+    path = _USER_LOGINWINDOW_PLIST if user else _LOGINWINDOW_PLIST
+    try:
+        with open(path, "rb") as f:
+            prefs = plistlib.load(f)
+    except (OSError, plistlib.InvalidFileException, ValueError):
+        return {}
+    return prefs if isinstance(prefs, dict) else {}
+
+
+def _is_apple_launch_job(path: str, filename: str) -> bool:
+    """Classify a launch agent/daemon plist as Apple-owned from its contents.
+
+    Filenames are trivially spoofed (``com.apple.evil.plist``), so the plist
+    is parsed and its ``Label`` must carry the ``com.apple.`` prefix *and* its
+    program (``Program`` or ``ProgramArguments[0]``), when declared, must sit
+    under one of ``_APPLE_PROGRAM_PREFIXES``.
+
+    Args:
+        path (str): Full path of the plist file.
+        filename (str): The plist's file name, used as a fallback label.
+
+    Returns:
+        bool: ``True`` if the job is Apple's.  When the plist cannot be read
+        or parsed, falls back to the case-insensitive ``com.apple.``
+        filename prefix test.
+    """
+    try:
+        with open(path, "rb") as f:
+            job = plistlib.load(f)
+    except Exception:
+        job = None
+    if not isinstance(job, dict):
+        return filename[:10].lower() == "com.apple."
+
+    label = job.get("Label")
+    if not isinstance(label, str) or label[:10].lower() != "com.apple.":
+        return False
+
+    program = job.get("Program")
+    if not program:
+        args = job.get("ProgramArguments")
+        program = args[0] if isinstance(args, list) and args else None
+    if program is None:
+        return True
+    return isinstance(program, str) and program.startswith(_APPLE_PROGRAM_PREFIXES)
+
+
+@scan_cache()
+def _read_authorized_keys() -> tuple[bool, str]:
+    """Read ``~/.ssh/authorized_keys`` once per scan.
+
+    Both ``SSHAuthorizedKeysCheck`` and ``SSHKeyStrengthCheck`` inspect this
+    file; sharing one read avoids a second stat/open/read of the same path.
+
+    Returns:
+        tuple[bool, str]: ``(exists, content)``.  ``exists`` is ``False``
+        (with empty content) when the file is absent.
+
+    Raises:
+        OSError: The file exists but could not be read (e.g. permissions).
+            Not cached, so each caller sees the error and handles it.
+    """
+    try:
+        text = _AUTHORIZED_KEYS.read_text(errors="replace")
+    except FileNotFoundError:
+        return False, ""
+    return True, text
+
+
+@scan_cache()
+def _read_sshd_config() -> bytes | None:
+    """Read ``/etc/ssh/sshd_config`` once per scan.
+
+    Sits beside ``_read_authorized_keys()`` and ``get_remote_login()`` so
+    every SSH input is fetched at most once per scan.  A single open also
+    replaces the former ``exists()`` + ``read_bytes()`` pair.
+
+    Returns:
+        bytes | None: The raw file contents, or ``None`` when the file does
+        not exist.
+
+    Raises:
+        OSError: The file exists but could not be read (e.g. permissions).
+            Not cached, so each caller sees the error and handles it.
+    """
+    try:
+        return _SSHD_CONFIG.read_bytes()
+    except FileNotFoundError:
+        return None
+
+
+def _sshd_auth_issue(m: re.Match[bytes]) -> str | None:
+    """Describe the risk of one ``_SSHD_AUTH_RE`` match, or ``None`` if safe.
+
+    Args:
+        m (re.Match[bytes]): A ``PasswordAuthentication`` or
+            ``PermitRootLogin`` line matched in ``sshd_config``.
+
+    Returns:
+        str | None: The finding text for ``PasswordAuthentication yes`` or a
+        ``PermitRootLogin`` other than ``no`` / ``prohibit-*``; ``None``
+        for safe values.
+    """
+    value = m.group("value").lower()
+    if m.group("password"):
+        if value == b"yes":
+            return "PasswordAuthentication yes (enables password brute-force)"
+        return None
+    if value != b"no" and not value.startswith(b"prohibit"):
+        return "PermitRootLogin is not 'no' (root login permitted)"
+    return None
+
+
+def _cron_sources() -> list[Path]:
+    """List the non-empty cron tables under ``_CRON_DIRS``.
+
+    ``os.scandir`` caches each entry's ``stat`` result, so filtering out
+    directories and empty files costs no extra syscalls per entry.
+    Directories that are missing or unreadable (``/var/at/tabs`` is root-only)
+    are skipped.
+
+    Returns:
+        list[Path]: Regular, non-empty files in scan order.
+    """
+    sources: list[Path] = []
+    for directory in _CRON_DIRS:
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    try:
+                        if entry.is_file(follow_symlinks=False) and \
+                                entry.stat(follow_symlinks=False).st_size > 0:
+                            sources.append(Path(entry.path))
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+    return sources
+
 
 # ── Checks ────────────────────────────────────────────────────────────────────
 
@@ -115,9 +419,9 @@ class AutoLoginCheck(BaseCheck):
 
     Detection mechanism:
         Reads the ``autoLoginUser`` key from
-        ``/Library/Preferences/com.apple.loginwindow`` using the ``defaults``
-        command. A non-zero exit code from ``defaults read`` means the key does
-        not exist, which is the normal (safe) state.
+        ``/Library/Preferences/com.apple.loginwindow.plist`` via the cached
+        ``_loginwindow_prefs()`` parse. An absent key is the normal (safe)
+        state.
 
     Severity scale:
         - ``pass``: ``autoLoginUser`` key is absent (auto-login disabled).
@@ -163,9 +467,8 @@ class AutoLoginCheck(BaseCheck):
     def run(self) -> CheckResult:
         """Read ``autoLoginUser`` from com.apple.loginwindow; absent key means disabled.
 
-        Uses ``defaults read`` rather than plist parsing because ``defaults``
-        resolves managed preference overrides and handles the caching layer
-        that can make direct plist reads unreliable.
+        The system plist is parsed in-process with ``plistlib`` (see
+        ``_loginwindow_prefs()``) instead of spawning ``defaults read``.
 
         Returns:
             CheckResult: One of:
@@ -183,21 +486,12 @@ class AutoLoginCheck(BaseCheck):
             # pass: "Auto-login is disabled"
             # critical: "Auto-login is enabled for user 'alice'"
         """
-        rc, stdout, _ = self.shell(
-            [
-                "defaults",
-                "read",
-                "/Library/Preferences/com.apple.loginwindow",
-                "autoLoginUser",
-            ]
-        )
-
-        if rc != 0:
-            # Non-zero exit from defaults read means the key is missing,
-            # which is the desired (secure) state.
+        value = _loginwindow_prefs().get("autoLoginUser")
+        if value is None:
+            # Key missing is the desired (secure) state.
             return self._pass("Auto-login is disabled")
 
-        username = stdout.strip()
+        username = str(value).strip()
         if username:
             return self._critical(
                 f"Auto-login is enabled for user '{username}'",
@@ -217,10 +511,12 @@ class SSHAuthorizedKeysCheck(BaseCheck):
     with remain valid indefinitely unless explicitly removed.
 
     Detection mechanism:
-        1. Queries ``systemsetup -getremotelogin`` to determine if the SSH
-           server is currently running (contextual, not a blocker).
-        2. Reads ``~/.ssh/authorized_keys`` and counts non-comment, non-empty
-           lines. Each such line is one authorized key.
+        1. Asks the shared ``get_remote_login()`` lookup whether the SSH
+           server is enabled (contextual, not a blocker).  ``None`` means
+           the state could not be determined and is reported as unknown.
+        2. Reads ``~/.ssh/authorized_keys`` (shared with
+           ``SSHKeyStrengthCheck`` via ``_read_authorized_keys()``) and counts
+           non-comment, non-empty lines. Each such line is one authorized key.
 
     Severity scale:
         - ``pass``: File absent, empty, or SSH server is off and file is absent.
@@ -233,7 +529,7 @@ class SSHAuthorizedKeysCheck(BaseCheck):
         name (str): ``"SSH Authorized Keys"``
         fix_level (str): ``"instructions"`` — requires manual review of each key
             entry; no automated command can safely decide which keys to remove.
-        fix_steps (list[str]): Terminal commands to inspect keys and guidance on
+        fix_steps (tuple[str, ...]): Terminal commands to inspect keys and guidance on
             identifying each key's origin from its comment field.
         fix_reversible (bool): ``True`` — removed keys can be re-added from the
             corresponding public key file.
@@ -260,26 +556,29 @@ class SSHAuthorizedKeysCheck(BaseCheck):
     )
     fix_level = "instructions"
     fix_description = "Review and remove untrusted public keys"
-    fix_steps = [
+    fix_steps = (
         "Open Terminal and run: cat ~/.ssh/authorized_keys",
         "For each key, check the comment at the end (usually user@host)",
         "Remove lines for machines or people you no longer trust",
         "Save the file",
-    ]
+    )
     fix_reversible = True
     fix_time_estimate = "~5 minutes"
 
     def run(self) -> CheckResult:
         """Check SSH server state, then read and count authorized key entries.
 
-        Queries ``systemsetup -getremotelogin`` first for context: if SSH is
-        off, an absent authorized_keys file is less urgent than if SSH is on.
+        Determines SSH server state first for context: if SSH is off, an
+        absent authorized_keys file is less urgent than if SSH is on.  The
+        state comes from :func:`~macaudit.system_info.get_remote_login`, as
+        for the other SSH checks; the user-domain launchd snapshot cannot
+        answer it because the system daemon never appears there.
         Non-comment key lines are counted to determine severity.
 
         Returns:
             CheckResult: One of:
 
-            - ``pass`` — File absent (with or without SSH enabled).
+            - ``pass`` — File absent (SSH on, off, or in an unknown state).
             - ``pass`` — File is empty (no active key entries).
             - ``info`` — 1–5 keys found.
             - ``warning`` — > 5 keys found.
@@ -296,34 +595,29 @@ class SSHAuthorizedKeysCheck(BaseCheck):
         """
         # Check if Remote Login (SSH server) is even running — used for
         # context in the pass message, not as a gate on the check itself.
-        rc_ssh, ssh_out, _ = self.shell(
-            ["systemsetup", "-getremotelogin"], timeout=5
-        )
-        ssh_on = rc_ssh == 0 and "on" in ssh_out.lower()
+        # None means the state is unknown, not "SSH off".
+        ssh_on = get_remote_login()
+
+        try:
+            exists, content = _read_authorized_keys()
+        except OSError as e:
+            return self._error(f"Could not read authorized_keys: {e}")
 
-        if not _AUTHORIZED_KEYS.exists():
+        if not exists:
             if ssh_on:
                 return self._pass(
                     "SSH is on, but no authorized_keys file exists"
                 )
+            if ssh_on is None:
+                return self._pass("No authorized_keys file (SSH server state unknown)")
             return self._pass("No authorized_keys file (SSH server is off)")
 
-        try:
-            content = _AUTHORIZED_KEYS.read_text(errors="replace")
-        except OSError as e:
-            return self._error(f"Could not read authorized_keys: {e}")
-
         # Count valid key lines — exclude comment lines and blank lines.
-        keys = [
-            ln.strip()
-            for ln in content.splitlines()
-            if ln.strip() and not ln.strip().startswith("#")
-        ]
+        n = sum(1 for _ in _KEY_LINE_RE.finditer(content))
 
-        if not keys:
+        if not n:
             return self._pass("authorized_keys is empty")
 
-        n = len(keys)
         msg = f"{n} authorized SSH key{'s' if n != 1 else ''} found"
 
         if n > 5:
@@ -347,7 +641,8 @@ class SSHKeyStrengthCheck(BaseCheck):
     modern recommended alternatives.
 
     Detection mechanism:
-        1. Globs all ``*.pub`` files in ``~/.ssh/`` and reads each one.
+        1. Lists all ``*.pub`` files in ``~/.ssh/`` with one ``os.scandir``
+           pass and reads the first 16 bytes of each one.
         2. Identifies key type from the leading token: ``ssh-dss`` (DSA,
            broken), ``ssh-rsa`` (RSA, potentially weak), or modern types
            (``ssh-ed25519``, ``ecdsa-sha2-*``).
@@ -363,7 +658,7 @@ class SSHKeyStrengthCheck(BaseCheck):
         name (str): ``"SSH Key Strength"``
         fix_level (str): ``"instructions"`` — generating a new key and updating
             remote servers requires manual steps.
-        fix_steps (list[str]): Commands to generate an Ed25519 key, push it to
+        fix_steps (tuple[str, ...]): Commands to generate an Ed25519 key, push it to
             servers, and retire old keys.
         fix_reversible (bool): ``True`` — old keys are not deleted automatically;
             they can continue to be used until explicitly removed.
@@ -390,11 +685,11 @@ class SSHKeyStrengthCheck(BaseCheck):
     )
     fix_level = "instructions"
     fix_description = "Generate a new strong SSH key"
-    fix_steps = [
+    fix_steps = (
         "Run: ssh-keygen -t ed25519 -C 'your@email.com'",
         "Copy new public key to servers: ssh-copy-id user@host",
         "Remove old weak keys from ~/.ssh/ once new ones are working",
-    ]
+    )
     fix_reversible = True
     fix_time_estimate = "~10 minutes"
 
@@ -425,37 +720,47 @@ class SSHKeyStrengthCheck(BaseCheck):
             # warning: "Weak SSH keys found: id_dsa.pub (DSA — broken)"
             # info:    "RSA key(s) found: id_rsa.pub — consider upgrading to Ed25519"
         """
-        if not _SSH_DIR.exists():
+        # One directory scan feeds every classification below.
+        try:
+            with os.scandir(_SSH_DIR) as it:
+                pubs = [
+                    (e.name, e.path) for e in it
+                    if e.name.endswith(".pub") and e.is_file()
+                ]
+        except (FileNotFoundError, NotADirectoryError):
             return self._skip("No ~/.ssh directory found")
+        except OSError:
+            pubs = []
 
         weak_keys: list[str] = []
         rsa_keys: list[str] = []
 
-        # Scan all public key files in the .ssh directory.
-        for pub in _SSH_DIR.glob("*.pub"):
+        # Scan all public key files in the .ssh directory.  The algorithm
+        # name is the first token, so only the first few bytes are read.
+        for name, path in pubs:
             try:
-                text = pub.read_text(errors="replace").strip()
-                if text.startswith("ssh-dss"):
+                with open(path, "rb") as f:
+                    head = f.read(16).lstrip()
+                if head.startswith(b"ssh-dss"):
                     # DSA is cryptographically broken; flag immediately.
-                    weak_keys.append(f"{pub.name} (DSA — broken)")
-                elif text.startswith("ssh-rsa"):
+                    weak_keys.append(f"{name} (DSA — broken)")
+                elif head.startswith(b"ssh-rsa"):
                     # RSA may be safe (>=2048 bit) but flag for awareness;
                     # Ed25519 is preferred for new keys.
-                    rsa_keys.append(pub.name)
+                    rsa_keys.append(name)
             except OSError:
                 continue
 
         # Also scan authorized_keys for weak key types — a DSA key in
         # authorized_keys represents an active security weakness regardless
         # of whether the corresponding private key still exists locally.
-        if _AUTHORIZED_KEYS.exists():
-            try:
-                for ln in _AUTHORIZED_KEYS.read_text(errors="replace").splitlines():
-                    ln = ln.strip()
-                    if ln.startswith("ssh-dss"):
-                        weak_keys.append("authorized_keys entry (DSA — broken)")
-            except OSError:
-                pass
+        try:
+            _, auth_content = _read_authorized_keys()
+        except OSError:
+            auth_content = ""
+        for ln in auth_content.splitlines():
+            if ln.strip().startswith("ssh-dss"):
+                weak_keys.append("authorized_keys entry (DSA — broken)")
 
         if weak_keys:
             return self._warning(
@@ -471,13 +776,17 @@ class SSHKeyStrengthCheck(BaseCheck):
             )
 
         # Check specifically for modern key files as a pass condition.
-        modern = list(_SSH_DIR.glob("id_ed25519.pub")) + list(_SSH_DIR.glob("id_ecdsa*.pub"))
+        names = [name for name, _ in pubs]
+        modern = (
+            [n for n in names if n == "id_ed25519.pub"]
+            + [n for n in names if n.startswith("id_ecdsa")]
+        )
         if modern:
             return self._pass(
-                f"Strong key(s) found: {', '.join(p.name for p in modern[:3])}"
+                f"Strong key(s) found: {', '.join(modern[:3])}"
             )
 
-        if list(_SSH_DIR.glob("*.pub")):
+        if pubs:
             return self._info("SSH keys present — types appear acceptable")
 
         return self._pass("No local SSH keys found")
@@ -496,15 +805,18 @@ class LaunchAgentsCheck(BaseCheck):
        This directory should be empty for all normal users; its non-empty
        state indicates either a misconfigured installer or malicious activity.
 
-    2. **Ownership awareness**: ``*.plist`` files that do not begin with
-       ``com.apple.`` are counted and listed, because macOS ships with only
-       Apple-prefixed agents. Any third-party agent is worth knowing about,
-       even if most are legitimate.
+    2. **Ownership awareness**: jobs whose ``Label`` does not begin with
+       ``com.apple.``, or whose program lives outside Apple-owned paths, are
+       counted and listed, because macOS ships with only Apple agents. Any
+       third-party agent is worth knowing about, even if most are legitimate.
 
     Detection mechanism:
-        Globs ``*.plist`` in each directory listed in ``_LAUNCH_AGENT_DIRS``.
-        Applies filename prefix checks (``com.apple.`` / ``com.Apple.``) to
-        classify entries. Does not read plist content or validate signatures.
+        Lists ``*.plist`` files in each directory of ``_LAUNCH_AGENT_DIRS``
+        with a single ``os.scandir`` pass per directory.
+        Parses each plist with ``plistlib`` and classifies it by ``Label``
+        and ``Program`` / ``ProgramArguments`` (see
+        ``_is_apple_launch_job()``). Unparseable plists fall back to a
+        filename prefix check. Code signatures are not validated.
 
     Severity scale:
         - ``pass``: No third-party or suspicious agents found.
@@ -517,7 +829,7 @@ class LaunchAgentsCheck(BaseCheck):
         name (str): ``"Launch Agents & Daemons"``
         fix_level (str): ``"instructions"`` — disabling a launch agent requires
             ``launchctl unload`` followed by manual file deletion.
-        fix_steps (list[str]): Terminal commands for listing, disabling, and
+        fix_steps (tuple[str, ...]): Terminal commands for listing, disabling, and
             removing launch agent plists.
         fix_reversible (bool): ``True`` — removed agents can be reinstalled
             by the originating application.
@@ -545,25 +857,25 @@ class LaunchAgentsCheck(BaseCheck):
     )
     fix_level = "instructions"
     fix_description = "Review and remove suspicious launch agents"
-    fix_steps = [
+    fix_steps = (
         "Open Terminal and run: ls ~/Library/LaunchAgents/",
         "Research any plists you don't recognize",
         "To disable: launchctl unload ~/Library/LaunchAgents/<name>.plist",
         "To remove: rm ~/Library/LaunchAgents/<name>.plist",
-    ]
+    )
     fix_reversible = True
     fix_time_estimate = "10–30 minutes"
 
     def run(self) -> CheckResult:
-        """Glob ``*.plist`` in user and system launch directories; apply heuristic classification.
+        """Scan ``*.plist`` in user and system launch directories; apply heuristic classification.
 
         Iterates each directory in ``_LAUNCH_AGENT_DIRS``. For each ``.plist``
         file found:
 
         - If the containing directory is ``~/Library/LaunchDaemons/``, it is
           added to the ``suspicious`` list (structural anomaly).
-        - Otherwise, files whose names do not start with ``com.apple.`` or
-          ``com.Apple.`` are added to ``non_apple`` for awareness.
+        - Otherwise, jobs that ``_is_apple_launch_job()`` does not recognise
+          as Apple's are added to ``non_apple`` for awareness.
 
         Returns:
             CheckResult: One of:
@@ -586,23 +898,30 @@ class LaunchAgentsCheck(BaseCheck):
         suspicious: list[str] = []  # entries in structurally abnormal locations
 
         for directory in _LAUNCH_AGENT_DIRS:
-            if not directory.exists():
+            # One readdir per directory; DirEntry.is_file() answers from the
+            # cached d_type, so no per-entry stat is issued for regular files.
+            try:
+                with os.scandir(directory) as it:
+                    plists = [
+                        (e.name, e.path) for e in it
+                        if e.name.endswith(".plist") and e.is_file()
+                    ]
+            except OSError:
+                # Missing or unreadable directory — nothing to scan.
                 continue
 
             # ~/Library/LaunchDaemons/ should never contain plists for a normal
             # user; its presence indicates a potential compromise or malicious installer.
-            in_user_daemons = "LaunchDaemons" in str(directory) and str(directory).startswith(str(HOME))
-
-            for plist in directory.glob("*.plist"):
-                name = plist.name
+            in_user_daemons = directory == _USER_LAUNCH_DAEMONS
 
+            for name, path in plists:
                 if in_user_daemons:
                     suspicious.append(f"{name} (in ~/Library/LaunchDaemons/ — abnormal)")
                     continue
 
-                # Any plist not prefixed with com.apple. is a third-party agent.
-                # Both capitalisation variants are checked for robustness.
-                if not name.startswith("com.apple.") and not name.startswith("com.Apple."):
+                # Classify by the plist's Label and program path, not the
+                # filename, which malware can freely choose.
+                if not _is_apple_launch_job(path, name):
                     non_apple.append(f"{name} ({directory.name})")
 
         if suspicious:
@@ -656,7 +975,7 @@ class EtcHostsCheck(BaseCheck):
         name (str): ``"/etc/hosts Entries"``
         fix_level (str): ``"instructions"`` — requires reading the file,
           understanding each entry, and using ``sudo nano`` to edit.
-        fix_steps (list[str]): Commands to view and edit ``/etc/hosts`` safely.
+        fix_steps (tuple[str, ...]): Commands to view and edit ``/etc/hosts`` safely.
         fix_reversible (bool): ``True`` — removed entries can be re-added.
         fix_time_estimate (str): About 5 minutes.
     """
@@ -681,22 +1000,24 @@ class EtcHostsCheck(BaseCheck):
     )
     fix_level = "instructions"
     fix_description = "Review /etc/hosts for rogue entries"
-    fix_steps = [
+    fix_steps = (
         "Run: cat /etc/hosts",
         "Standard entries only: 127.0.0.1 localhost, ::1 localhost",
         "Remove any entries for well-known domains (google.com, apple.com, etc.)",
         "Edit with: sudo nano /etc/hosts",
-    ]
+    )
     fix_reversible = True
     fix_time_estimate = "~5 minutes"
 
     def run(self) -> CheckResult:
         """Parse ``/etc/hosts`` and flag entries with non-loopback IPs.
 
-        Iterates every non-comment, non-blank line. Splits each line into an
+        Streams the file via ``_scan_hosts()`` and iterates every
+        non-comment, non-blank line. Splits each line into an
         IP address and one or more hostnames. Skips any line whose IP begins
-        with a prefix in ``_LOOPBACK_PREFIXES``. Remaining entries are
-        collected as ``"<ip> → <hostname>"`` strings for display.
+        with a prefix in ``_LOOPBACK_PREFIXES``.
+        Remaining entries are collected as ``"<ip> → <hostname>"`` strings for
+        display.
 
         Returns:
             CheckResult: One of:
@@ -713,39 +1034,13 @@ class EtcHostsCheck(BaseCheck):
             result = check.run()
             # warning: "2 non-standard /etc/hosts entries: 1.2.3.4 → paypal.com, ..."
         """
-        hosts_path = Path("/etc/hosts")
-        if not hosts_path.exists():
-            return self._info("/etc/hosts not found")
-
         try:
-            content = hosts_path.read_text(errors="replace")
+            unusual = self._scan_hosts()
+        except FileNotFoundError:
+            return self._info("/etc/hosts not found")
         except OSError as e:
             return self._error(f"Could not read /etc/hosts: {e}")
 
-        unusual: list[str] = []
-        for line in content.splitlines():
-            line = line.strip()
-            if not line or line.startswith("#"):
-                continue
-
-            parts = line.split()
-            if len(parts) < 2:
-                continue
-
-            ip, *hostnames = parts
-
-            # Skip loopback, unspecified (0.0.0.0), and broadcast (255.) addresses —
-            # these are all benign regardless of what hostname they point to.
-            if any(ip.startswith(p) for p in _LOOPBACK_PREFIXES):
-                continue
-
-            # Any non-loopback entry that points to a non-standard hostname
-            # is worth flagging. This catches ad-blocker entries pointing to
-            # non-loopback IPs and genuine DNS-redirect attacks alike.
-            for host in hostnames:
-                if host not in _STANDARD_HOSTS:
-                    unusual.append(f"{ip} → {host}")
-
         if not unusual:
             return self._pass("No unusual entries in /etc/hosts")
 
@@ -757,6 +1052,56 @@ class EtcHostsCheck(BaseCheck):
             data={"unusual_entries": unusual},
         )
 
+    def _scan_hosts(self) -> list[str]:
+        """Stream ``/etc/hosts`` line by line and collect non-standard entries.
+
+        The file is iterated through a buffered reader rather than read into
+        one string, so ad-blocker hosts files with hundreds of thousands of
+        entries do not produce a transient copy of the whole file plus a
+        list of its lines.  If the file's identity, mtime and size match the
+        previous parse, that parse is returned without reading a line.
+
+        Returns:
+            list[str]: ``"<ip> → <hostname>"`` strings for every
+            non-loopback mapping to a non-standard hostname.
+
+        Raises:
+            OSError: The file is missing or could not be read.
+        """
+        global _HOSTS_CACHE
+        unusual: list[str] = []
+        with open(_ETC_HOSTS, encoding="utf-8", errors="replace") as f:
+            st = os.fstat(f.fileno())
+            key = (st.st_dev, st.st_ino, st.st_mtime_ns, st.st_size)
+            if _HOSTS_CACHE is not None and _HOSTS_CACHE[0] == key:
+                return list(_HOSTS_CACHE[1])
+
+            for line in f:
+                line = line.strip()
+                if not line or line.startswith("#"):
+                    continue
+
+                parts = line.split()
+                if len(parts) < 2:
+                    continue
+
+                ip, *hostnames = parts
+
+                # Skip loopback, unspecified (0.0.0.0), and broadcast (255.)
+                # addresses — these are all benign regardless of what
+                # hostname they point to.
+                if ip.startswith(_LOOPBACK_PREFIXES):
+                    continue
+
+                # Any non-loopback entry that points to a non-standard hostname
+                # is worth flagging. This catches ad-blocker entries pointing to
+                # non-loopback IPs and genuine DNS-redirect attacks alike.
+                for host in hostnames:
+                    if host not in _STANDARD_HOSTS:
+                        unusual.append(f"{ip} → {host}")
+        _HOSTS_CACHE = (key, tuple(unusual))
+        return unusual
+
 
 class SharingServicesCheck(BaseCheck):
     """Detect active sharing services that expose network-listening ports.
@@ -767,21 +1112,22 @@ class SharingServicesCheck(BaseCheck):
     users. Disabling unused services eliminates the corresponding attack surface.
 
     Services checked:
-        - **Remote Login (SSH)** — Port 22. Checked via
-          ``systemsetup -getremotelogin``.
-        - **Screen Sharing / VNC** — Port 5900. Checked via
-          ``launchctl list com.apple.screensharing``.
-        - **File Sharing (SMB)** — Port 445. Checked via
-          ``launchctl list com.apple.smbd``.
+        - **Remote Login (SSH)** — Port 22. Checked via the shared
+          ``get_remote_login()`` lookup.
+        - **Screen Sharing / VNC** — Port 5900. Checked via the
+          ``com.apple.screensharing`` launchd label.
+        - **File Sharing (SMB)** — Port 445. Checked via the
+          ``com.apple.smbd`` launchd label.
 
     Detection mechanism:
-        Uses ``systemsetup -getremotelogin`` for SSH state and
-        ``launchctl list <service>`` for Screen Sharing and SMB. A service is
-        considered active if ``launchctl list`` exits 0, returns non-empty
-        output, and does not contain "Could not find".
+        Uses :func:`~macaudit.system_info.get_remote_login` for SSH state and
+        a single cached ``launchctl list`` snapshot for Screen Sharing and SMB. A service is
+        considered active if its label appears in that snapshot.  When the
+        SSH state cannot be determined it is reported as unknown, never as off.
 
     Severity scale:
-        Always ``pass`` (no services) or ``info`` (some services active). This
+        Always ``pass`` (no services, SSH known to be off) or ``info`` (some
+        services active, or SSH state unknown). This
         is ``info`` rather than ``warning`` because sharing services are
         *potentially* legitimate depending on the user's use case — e.g. a
         home server needs File Sharing enabled. The user is informed so they
@@ -820,7 +1166,7 @@ class SharingServicesCheck(BaseCheck):
     fix_time_estimate = "~30 seconds"
 
     def run(self) -> CheckResult:
-        """Query systemsetup and launchctl to detect active listening services.
+        """Query the shared SSH state and launchd snapshot to detect listening services.
 
         Checks Remote Login (SSH), Screen Sharing (VNC), and File Sharing (SMB)
         independently using the most appropriate detection method for each.
@@ -829,9 +1175,11 @@ class SharingServicesCheck(BaseCheck):
             CheckResult: One of:
 
             - ``pass`` — None of the three services are active.
-            - ``info`` — One or more services are active. The message names each
-              active service. ``result.data["active_services"]`` is a list of
-              human-readable service names.
+            - ``info`` — One or more services are active, or the Remote Login
+              state is unknown. The message names each active service.
+              ``result.data["active_services"]`` is a list of human-readable
+              service names; ``result.data["unknown_services"]`` lists
+              ``"Remote Login (SSH)"`` when its state could not be read.
 
         Example::
 
@@ -841,33 +1189,41 @@ class SharingServicesCheck(BaseCheck):
         """
         active: list[str] = []
 
-        # Remote Login uses systemsetup rather than launchctl because
-        # systemsetup -getremotelogin gives a definitive on/off state.
-        rc, stdout, _ = self.shell(["systemsetup", "-getremotelogin"], timeout=5)
-        if rc == 0 and "on" in stdout.lower():
+        # Remote Login comes from launchd's persistent override (shared with
+        # the other SSH checks) — a definitive on/off, not just "loaded".
+        # None means neither source answered, which is not the same as off.
+        ssh_on = get_remote_login()
+        if ssh_on:
             active.append("Remote Login (SSH)")
 
-        # Screen Sharing / VNC — check whether the launchd service is registered.
-        rc2, stdout2, _ = self.shell(
-            ["launchctl", "list", "com.apple.screensharing"]
-        )
-        if rc2 == 0 and stdout2.strip() and "Could not find" not in stdout2:
+        # Screen Sharing and File Sharing — is the launchd service registered?
+        jobs = get_launchd_jobs()
+        if SCREEN_SHARING_LABEL in jobs:
             active.append("Screen Sharing")
-
-        # File Sharing (AFP/SMB) — same launchctl list approach.
-        rc3, stdout3, _ = self.shell(
-            ["launchctl", "list", "com.apple.smbd"]
-        )
-        if rc3 == 0 and stdout3.strip() and "Could not find" not in stdout3:
+        if SMB_LABEL in jobs:
             active.append("File Sharing (SMB)")
 
-        if not active:
-            return self._pass("No sharing services are active")
+        if ssh_on is not None:
+            if not active:
+                return self._pass("No sharing services are active")
+            n = len(active)
+            return self._info(
+                f"{n} sharing service{'s' if n != 1 else ''} active: {', '.join(active)}",
+                data={"active_services": active},
+            )
 
+        data = {"active_services": active, "unknown_services": ["Remote Login (SSH)"]}
+        if not active:
+            return self._info(
+                "No sharing services detected, but the Remote Login (SSH) "
+                "state could not be determined",
+                data=data,
+            )
         n = len(active)
         return self._info(
-            f"{n} sharing service{'s' if n != 1 else ''} active: {', '.join(active)}",
-            data={"active_services": active},
+            f"{n} sharing service{'s' if n != 1 else ''} active: {', '.join(active)}"
+            " (Remote Login state unknown)",
+            data=data,
         )
 
 
@@ -902,7 +1258,7 @@ class ActivationLockCheck(BaseCheck):
         name (str): ``"Activation Lock"``
         fix_level (str): ``"instructions"`` — resolving a previous owner's lock
             requires their Apple ID credentials or Apple Support.
-        fix_steps (list[str]): Steps for the previous owner to remove the lock
+        fix_steps (tuple[str, ...]): Steps for the previous owner to remove the lock
             via appleid.apple.com.
         fix_reversible (bool): ``False`` — removing Activation Lock from an
             account requires the account owner's credentials.
@@ -931,12 +1287,12 @@ class ActivationLockCheck(BaseCheck):
     )
     fix_level = "instructions"
     fix_description = "Contact previous owner to remove their Activation Lock"
-    fix_steps = [
+    fix_steps = (
         "Ask the previous owner to visit appleid.apple.com",
         "Sign in and go to Devices",
         "Select this Mac and choose 'Remove from Account'",
         "Or: erase and restore the Mac with original owner present",
-    ]
+    )
     fix_reversible = False
     fix_time_estimate = "Varies"
 
@@ -1006,10 +1362,12 @@ class MDMProfilesCheck(BaseCheck):
     without the user's knowledge or consent is a serious security concern.
 
     Detection mechanism:
-        Runs ``profiles list`` (the macOS profile management CLI). Parses output
-        for lines containing ``_computerlevel`` or ``profileIdentifier`` to count
-        installed profiles. A non-zero exit with a permissions-related error
-        indicates the command needs administrator privileges.
+        Runs ``profiles show -output stdout-xml`` (the macOS profile management
+        CLI), which prints a plist keyed by scope (``_computerlevel`` or a user
+        name) whose values are lists of profile dictionaries. The plist is
+        parsed once with ``plistlib`` and the lists are counted. A non-zero
+        exit with a permissions-related error indicates the command needs
+        administrator privileges.
 
     Severity scale:
         - ``pass``: No profiles installed.
@@ -1054,20 +1412,22 @@ class MDMProfilesCheck(BaseCheck):
     fix_time_estimate = "~5 minutes"
 
     def run(self) -> CheckResult:
-        """Run ``profiles list`` and count configuration profile entries.
+        """Run ``profiles show -output stdout-xml`` and count installed profiles.
 
-        Runs ``profiles list`` (no ``-all`` flag — shows profiles for the
-        current user context). Counts lines matching known profile output
-        patterns to estimate the number of installed profiles.
+        Parses the XML plist with ``plistlib`` rather than scraping the
+        human-readable ``profiles list`` text, so the count is exact and
+        independent of output wording.
 
         Returns:
             CheckResult: One of:
 
-            - ``pass`` — "There are no" in output, or output is empty.
+            - ``pass`` — "There are no" in output, output is empty, or the
+              plist contains no profiles.
             - ``warning`` — At least one profile detected. ``result.data["profile_count"]``
-              contains the estimated count; ``result.data["output_preview"]`` contains
-              the first 200 characters of raw output.
-            - ``info`` — Permission denied (needs admin) or command failed.
+              contains the count; ``result.data["profile_identifiers"]`` lists
+              each profile's ``ProfileIdentifier``.
+            - ``info`` — Permission denied (needs admin), command failed, or
+              the output was not a valid plist.
 
         Example::
 
@@ -1075,7 +1435,9 @@ class MDMProfilesCheck(BaseCheck):
             result = check.run()
             # warning: "2 configuration profiles installed — verify they're intentional"
         """
-        rc, stdout, stderr = self.shell(["profiles", "list"], timeout=8)
+        rc, stdout, stderr = self.shell(
+            ["profiles", "show", "-output", "stdout-xml"], timeout=8
+        )
 
         if rc != 0:
             if "permission" in stderr.lower() or "not permitted" in stderr.lower():
@@ -1089,18 +1451,29 @@ class MDMProfilesCheck(BaseCheck):
         if not stdout.strip() or "There are no" in stdout:
             return self._pass("No configuration profiles installed")
 
-        # Count profile entries by looking for known output markers.
-        # "_computerlevel" appears in computer-level profile entries;
-        # "profileIdentifier" appears in the detailed profile output format.
-        profile_lines = [
-            ln for ln in stdout.splitlines()
-            if "_computerlevel" in ln or "profileIdentifier" in ln.lower()
+        try:
+            doc = plistlib.loads(stdout.encode())
+        except Exception:
+            return self._info("Could not parse profiles output")
+
+        # Top-level keys are scopes ("_computerlevel", user names); each maps
+        # to the list of profile dictionaries installed in that scope.
+        profiles = [
+            p for scope in (doc.values() if isinstance(doc, dict) else ())
+            if isinstance(scope, list)
+            for p in scope
         ]
-        n = max(len(profile_lines), 1)  # at least 1 if there's any output at all
+        if not profiles:
+            return self._pass("No configuration profiles installed")
 
+        n = len(profiles)
+        identifiers = [
+            p.get("ProfileIdentifier", "?") if isinstance(p, dict) else "?"
+            for p in profiles
+        ]
         return self._warning(
             f"{n} configuration profile{'s' if n != 1 else ''} installed — verify they're intentional",
-            data={"profile_count": n, "output_preview": stdout[:200]},
+            data={"profile_count": n, "profile_identifiers": identifiers},
         )
 
 
@@ -1118,10 +1491,11 @@ class SystemRootCACheck(BaseCheck):
     should be explainable. On a corporate Mac, enterprise CAs are expected.
 
     Detection mechanism:
-        Runs ``security find-certificate -a /Library/Keychains/System.keychain``
-        and parses ``"alis"<blob>="Name"`` lines to extract certificate common
-        names. Checks each name against ``_MITM_INDICATORS``, a list of known
-        traffic-inspection tool name fragments.
+        Streams ``security find-certificate -a /Library/Keychains/System.keychain``
+        and keeps ``"alis"<blob>="Name"`` lines to extract certificate common
+        names. Checks each name against the module-level ``_MITM_RE``, built
+        from ``_MITM_INDICATORS`` (known traffic-inspection tool name
+        fragments).
 
     Severity scale:
         - ``pass``: Certificate count is <= 200 and no known MITM tool names found.
@@ -1133,12 +1507,9 @@ class SystemRootCACheck(BaseCheck):
     Attributes:
         id (str): ``"system_root_cas"``
         name (str): ``"System Root Certificates"``
-        _MITM_INDICATORS (list[str]): Lowercase name fragments used to identify
-            certificates from known traffic-inspection and MITM proxy tools.
-            Matched case-insensitively against certificate common names.
         fix_level (str): ``"instructions"`` — certificate removal requires Keychain
             Access or the ``security`` CLI with administrator authorization.
-        fix_steps (list[str]): Steps to identify and remove unexpected certificates
+        fix_steps (tuple[str, ...]): Steps to identify and remove unexpected certificates
             via Keychain Access.
         fix_reversible (bool): ``True`` — removed certificates can be re-added if
             needed (e.g. enterprise CA can be reinstalled by IT).
@@ -1167,29 +1538,22 @@ class SystemRootCACheck(BaseCheck):
     )
     fix_level = "instructions"
     fix_description = "Audit system root certificates via Keychain Access"
-    fix_steps = [
+    fix_steps = (
         "Open Keychain Access (search Spotlight)",
         "Select 'System' in the left sidebar, then click 'Certificates'",
         "Look for certificates with unknown issuers or blue trust overrides",
         "Delete certificates you don't recognize (requires admin password)",
-    ]
+    )
     fix_reversible = True
     fix_time_estimate = "~10 minutes"
 
-    # Lowercase name fragments identifying known MITM and traffic-inspection tools.
-    # Matched case-insensitively against certificate common names extracted from
-    # the System keychain.
-    _MITM_INDICATORS = [
-        "zscaler", "cisco umbrella", "palo alto", "forcepoint",
-        "charles proxy", "burp suite", "fiddler", "mitmproxy",
-        "netskope", "iboss", "lightspeed", "smoothwall", "squid",
-    ]
-
     def run(self) -> CheckResult:
         """Run ``security find-certificate`` on System.keychain and check for MITM tool certs.
 
-        Parses ``"alis"<blob>="<name>"`` lines from the ``security`` command
-        output to extract certificate common names. Checks each name for any
+        Streams the ``security`` command output through ``shell_grep()`` and
+        keeps only the ``"alis"<blob>="<name>"`` lines: ``_ALIS_PREFIX``
+        discards everything else cheaply and ``_ALIS_RE`` extracts the name,
+        so the full attribute dump is never held in memory. Checks each name for any
         of the fragments in ``_MITM_INDICATORS``. Also flags cert counts notably
         above the ~170 Apple defaults as potentially worth reviewing.
 
@@ -1210,40 +1574,29 @@ class SystemRootCACheck(BaseCheck):
             result = check.run()
             # warning: "Traffic inspection certificate detected: Zscaler Root CA"
         """
-        rc, out, _ = self.shell(
-            ["security", "find-certificate", "-a", "/Library/Keychains/System.keychain"]
+        # The dump includes every attribute of every certificate (often
+        # megabytes); stream it and keep only the "alis" name lines.
+        rc, matches = self.shell_grep(
+            ["security", "find-certificate", "-a", "/Library/Keychains/System.keychain"],
+            _ALIS_RE,
+            prefix=_ALIS_PREFIX,
         )
 
-        if rc != 0 or not out.strip():
+        if rc != 0:
             return self._info(
                 "Could not read System keychain certificates "
                 "(may require Full Disk Access)"
             )
 
-        # Extract certificate common names from "alis" attribute lines.
-        # Format: "alis"<blob>="Certificate Name"
-        names: list[str] = []
-        for line in out.splitlines():
-            line = line.strip()
-            if '"alis"<blob>=' in line:
-                try:
-                    name = line.split('="', 1)[1].rstrip('"')
-                    names.append(name)
-                except IndexError:
-                    continue
+        names = [m.group(1) for m in matches]
 
         if not names:
             return self._info("System keychain present (could not parse certificate names)")
 
-        # Check for known traffic inspection / MITM tool certificates by
-        # matching against the indicator list case-insensitively.
-        mitm_found: list[str] = []
-        for name in names:
-            name_lower = name.lower()
-            for indicator in self._MITM_INDICATORS:
-                if indicator in name_lower:
-                    mitm_found.append(name)
-                    break
+        # Check for known traffic inspection / MITM tool certificates with the
+        # precompiled case-insensitive indicator alternation.
+        search = _MITM_RE.search
+        mitm_found = [name for name in names if search(name)]
 
         count = len(names)
 
@@ -1281,12 +1634,13 @@ class GuestAccountCheck(BaseCheck):
 
     Detection mechanism:
         Reads ``GuestEnabled`` from
-        ``/Library/Preferences/com.apple.loginwindow`` using ``defaults read``.
-        A value of ``"1"`` means the Guest account is enabled.
+        ``/Library/Preferences/com.apple.loginwindow.plist`` via the cached
+        ``_loginwindow_prefs()`` parse. A true value means the Guest account
+        is enabled.
 
     Severity scale:
-        - ``pass``: Key absent or value is not ``"1"``.
-        - ``warning``: Value is ``"1"`` (Guest account enabled).
+        - ``pass``: Key absent or value is false.
+        - ``warning``: Value is true (Guest account enabled).
 
     Attributes:
         id (str): ``"guest_account"``
@@ -1323,13 +1677,13 @@ class GuestAccountCheck(BaseCheck):
     fix_time_estimate = "~30 seconds"
 
     def run(self) -> CheckResult:
-        """Read ``GuestEnabled`` from com.apple.loginwindow via ``defaults read``.
+        """Read ``GuestEnabled`` from the cached com.apple.loginwindow plist.
 
         Returns:
             CheckResult: One of:
 
-            - ``pass`` — Key absent or value is not ``"1"``.
-            - ``warning`` — Value is ``"1"`` (Guest account is enabled).
+            - ``pass`` — Key absent or value is false.
+            - ``warning`` — Value is true (Guest account is enabled).
               ``result.data["guest_enabled"]`` is ``True``.
 
         Example::
@@ -1338,10 +1692,9 @@ class GuestAccountCheck(BaseCheck):
             result = check.run()
             # warning: "Guest account is enabled — anyone can log in without a password"
         """
-        rc, out, _ = self.shell(
-            ["defaults", "read", "/Library/Preferences/com.apple.loginwindow", "GuestEnabled"]
-        )
-        if rc == 0 and out.strip() == "1":
+        # plistlib yields a bool; integer and string forms are accepted too
+        # since ``defaults write`` can store either.
+        if _loginwindow_prefs().get("GuestEnabled") in (True, 1, "1"):
             return self._warning(
                 "Guest account is enabled — anyone can log in without a password",
                 data={"guest_enabled": True},
@@ -1361,10 +1714,10 @@ class LoginHooksCheck(BaseCheck):
     mechanisms that bypass LaunchAgent scanning tools.
 
     Detection mechanism:
-        Reads ``LoginHook`` and ``LogoutHook`` keys from
-        ``com.apple.loginwindow`` using ``defaults read`` (no plist path
-        specified — reads the current user domain). A non-zero exit from
-        ``defaults read`` means the key is absent.
+        Reads ``LoginHook`` and ``LogoutHook`` keys from both the current
+        user's and the system-wide ``com.apple.loginwindow`` plists via the
+        cached ``_loginwindow_prefs()`` parse. An absent key in both means no
+        hook is configured.
 
     Severity scale:
         - ``pass``: Both keys are absent.
@@ -1375,7 +1728,7 @@ class LoginHooksCheck(BaseCheck):
         name (str): ``"Login/Logout Hooks"``
         fix_level (str): ``"instructions"`` — removing hooks requires running
             ``sudo defaults delete`` for each key.
-        fix_steps (list[str]): Commands to check and remove login/logout hooks,
+        fix_steps (tuple[str, ...]): Commands to check and remove login/logout hooks,
             with a recommendation to investigate the script path before deleting.
         fix_reversible (bool): ``True`` — hooks can be re-added with
             ``sudo defaults write com.apple.loginwindow LoginHook /path``.
@@ -1403,21 +1756,21 @@ class LoginHooksCheck(BaseCheck):
     )
     fix_level = "instructions"
     fix_description = "Remove unrecognised login/logout hooks"
-    fix_steps = [
+    fix_steps = (
         "Check current hooks: defaults read com.apple.loginwindow LoginHook",
         "To remove login hook:  sudo defaults delete com.apple.loginwindow LoginHook",
         "To remove logout hook: sudo defaults delete com.apple.loginwindow LogoutHook",
         "Investigate the script path before removing to understand what it was doing",
-    ]
+    )
     fix_reversible = True
     fix_time_estimate = "~5 minutes"
 
     def run(self) -> CheckResult:
         """Read ``LoginHook`` and ``LogoutHook`` from com.apple.loginwindow.
 
-        Iterates both key names and calls ``defaults read com.apple.loginwindow
-        <key>`` for each. A non-zero exit code from ``defaults read`` means the
-        key is absent. Non-empty values are collected and reported.
+        Iterates both key names against the user-domain plist first, then the
+        system plist. The first non-empty value found for each key is
+        collected and reported.
 
         Returns:
             CheckResult: One of:
@@ -1432,14 +1785,15 @@ class LoginHooksCheck(BaseCheck):
             result = check.run()
             # warning: "Login hook detected: LoginHook: /Library/Scripts/evil.sh"
         """
+        domains = (_loginwindow_prefs(user=True), _loginwindow_prefs())
         found: list[str] = []
         for key in ("LoginHook", "LogoutHook"):
-            rc, out, _ = self.shell(
-                ["defaults", "read", "com.apple.loginwindow", key]
-            )
-            if rc == 0 and out.strip():
-                # Truncate long paths to 60 chars for readable display.
-                found.append(f"{key}: {out.strip()[:60]}")
+            for prefs in domains:
+                value = str(prefs.get(key) or "").strip()
+                if value:
+                    # Truncate long paths to 60 chars for readable display.
+                    found.append(f"{key}: {value[:60]}")
+                    break
 
         if found:
             return self._warning(
@@ -1466,10 +1820,17 @@ class SSHConfigCheck(BaseCheck):
       attacker instant full system access if they can authenticate.
 
     Detection mechanism:
-        Reads ``/etc/ssh/sshd_config``, skips comment lines, and checks for
-        explicit ``PasswordAuthentication yes`` and ``PermitRootLogin``
-        (without ``no`` or ``prohibit``). The check is skipped if Remote Login
-        is off, since ``sshd_config`` is not applicable in that state.
+        Reads ``/etc/ssh/sshd_config`` as raw bytes and scans it with the
+        case-insensitive ``_SSHD_AUTH_RE`` for uncommented
+        ``PasswordAuthentication`` and ``PermitRootLogin`` lines.  As in
+        ``sshd`` itself, only the first occurrence of each directive in the
+        global section counts; it is risky when it is ``PasswordAuthentication
+        yes`` or a ``PermitRootLogin`` other than ``no`` / ``prohibit-*``.
+        ``Match`` blocks override the globals for the connections they match,
+        so every risky value inside one is reported too.  The check is skipped
+        if Remote Login is known to be off, since ``sshd_config`` is not
+        applicable in that state; when its state cannot be determined the
+        file is still scanned.
 
     Severity scale:
         - ``pass``: SSH is off, or no risky settings found.
@@ -1482,7 +1843,7 @@ class SSHConfigCheck(BaseCheck):
         name (str): ``"SSH Server Config"``
         fix_level (str): ``"instructions"`` — hardening requires editing
             ``/etc/ssh/sshd_config`` with ``sudo`` and restarting the SSH daemon.
-        fix_steps (list[str]): Commands to open, edit, and apply hardened
+        fix_steps (tuple[str, ...]): Commands to open, edit, and apply hardened
             SSH config settings.
         fix_reversible (bool): ``True`` — settings can be reverted by re-editing
             the config file.
@@ -1510,12 +1871,12 @@ class SSHConfigCheck(BaseCheck):
     )
     fix_level = "instructions"
     fix_description = "Harden sshd_config to disable password auth and root login"
-    fix_steps = [
+    fix_steps = (
         "Open: sudo nano /etc/ssh/sshd_config",
         "Set: PasswordAuthentication no",
         "Set: PermitRootLogin no",
         "Save and restart SSH: sudo launchctl kickstart -k system/com.openssh.sshd",
-    ]
+    )
     fix_reversible = True
     fix_time_estimate = "~5 minutes"
 
@@ -1523,10 +1884,18 @@ class SSHConfigCheck(BaseCheck):
         """Parse ``/etc/ssh/sshd_config`` for dangerous authentication settings.
 
         Skips the check entirely if Remote Login (SSH) is currently off, since
-        ``sshd_config`` only matters when the SSH daemon is listening. Reads
-        and parses the config file, skipping comment lines. Looks specifically
-        for ``PasswordAuthentication yes`` and ``PermitRootLogin`` without a
-        ``no`` or ``prohibit-password`` value.
+        ``sshd_config`` only matters when the SSH daemon is listening.  The
+        state comes from ``get_remote_login()``; when that is inconclusive
+        (``None``) the config is scanned anyway.  The user-domain launchd
+        snapshot is no substitute: the system daemon ``com.openssh.sshd``
+        never appears in it.  Reads the config file through the scan-cached
+        ``_read_sshd_config()`` and sweeps the raw bytes with
+        ``_SSHD_AUTH_RE``.  In the global section (up to the first ``Match``
+        line) ``sshd`` honours the first value it reads for each directive,
+        so only the first ``PasswordAuthentication`` and ``PermitRootLogin``
+        lines there are judged, and that sweep stops as soon as both are
+        resolved.  Lines inside ``Match`` blocks apply to the connections
+        they match, so each one is judged.  No per-line strings are created.
 
         Returns:
             CheckResult: One of:
@@ -1543,32 +1912,46 @@ class SSHConfigCheck(BaseCheck):
             result = check.run()
             # warning: "Risky SSH config: PasswordAuthentication yes (enables password brute-force)"
         """
-        config_path = Path("/etc/ssh/sshd_config")
-        if not config_path.exists():
-            return self._skip("sshd_config not found")
-
-        # Skip if SSH server is not running — sshd_config is irrelevant when
-        # the daemon is not listening.
-        rc_ssh, ssh_out, _ = self.shell(["systemsetup", "-getremotelogin"], timeout=5)
-        if rc_ssh == 0 and "off" in ssh_out.lower():
+        # Skip only if the SSH server is known to be off — sshd_config is
+        # irrelevant when the daemon is not listening.  An unknown state
+        # (None) falls through so a risky config is still reported.
+        if get_remote_login() is False:
             return self._pass("Remote Login (SSH) is off — sshd_config not applicable")
 
         try:
-            content = config_path.read_text(errors="replace")
+            raw = _read_sshd_config()
         except PermissionError:
             return self._info(
                 "Could not read /etc/ssh/sshd_config — run macaudit with sudo to check"
             )
+        if raw is None:
+            return self._skip("sshd_config not found")
+
+        first_match = _SSHD_MATCH_RE.search(raw)
+        global_end = first_match.start() if first_match else len(raw)
 
+        # Global section: sshd ignores repeats, so the first value wins.
         issues: list[str] = []
-        for line in content.splitlines():
-            stripped = line.strip().lower()
-            if stripped.startswith("#"):
+        seen: set[str] = set()
+        for m in _SSHD_AUTH_RE.finditer(raw, 0, global_end):
+            directive = "password" if m.group("password") else "root"
+            if directive in seen:
                 continue
-            if stripped.startswith("passwordauthentication") and "yes" in stripped:
-                issues.append("PasswordAuthentication yes (enables password brute-force)")
-            if stripped.startswith("permitrootlogin") and "no" not in stripped and "prohibit" not in stripped:
-                issues.append("PermitRootLogin is not 'no' (root login permitted)")
+            seen.add(directive)
+            issue = _sshd_auth_issue(m)
+            if issue:
+                issues.append(issue)
+            if len(seen) == 2:
+                break
+
+        # Match blocks: each overrides the globals for the connections it
+        # matches, so any risky value there is a finding of its own.
+        for m in _SSHD_AUTH_RE.finditer(raw, global_end):
+            issue = _sshd_auth_issue(m)
+            if issue:
+                issue = f"{issue} in a Match block"
+                if issue not in issues:
+                    issues.append(issue)
 
         if issues:
             return self._warning(
@@ -1598,9 +1981,9 @@ class SystemExtensionsCheck(BaseCheck):
           system events (file operations, process launches, network events).
 
     Detection mechanism:
-        Runs ``systemextensionsctl list`` and parses lines containing ``"["``
-        and the words ``"enabled"`` or ``"activated"``. Each such line is
-        treated as an active extension entry.
+        Runs ``systemextensionsctl list`` and matches rows whose bracketed
+        state contains ``"enabled"`` or ``"activated"`` (``_ACTIVE_EXT_RE``).
+        Each such row is treated as an active extension entry.
 
     Severity scale:
         Always ``pass`` (none found) or ``info`` (some found). Extensions are
@@ -1649,9 +2032,10 @@ class SystemExtensionsCheck(BaseCheck):
     def run(self) -> CheckResult:
         """Run ``systemextensionsctl list`` and count active/enabled extensions.
 
-        Parses each output line for the presence of ``[`` (extension state
-        brackets) and the word ``"enabled"`` or ``"activated"``. Truncates
-        each matching line to 80 characters for readable display.
+        Streams the output through ``shell_grep()`` with ``_ACTIVE_EXT_RE``,
+        keeping only rows whose state brackets contain ``"enabled"`` or
+        ``"activated"``.  The regex group is already the stripped row, so a
+        single slice truncates it to 80 characters for readable display.
 
         Returns:
             CheckResult: One of:
@@ -1669,17 +2053,14 @@ class SystemExtensionsCheck(BaseCheck):
             result = check.run()
             # info: "3 system extensions active — verify all are from apps you installed"
         """
-        rc, out, _ = self.shell(["systemextensionsctl", "list"], timeout=10)
-        if rc != 0 or not out.strip():
+        # Stream the listing; only active rows are kept in memory.
+        rc, matches = self.shell_grep(
+            ["systemextensionsctl", "list"], _ACTIVE_EXT_RE, timeout=10
+        )
+        if rc != 0:
             return self._info("Could not list system extensions")
 
-        extensions: list[str] = []
-        for line in out.splitlines():
-            # Active extension lines have state brackets and "enabled" or "activated".
-            if "[" in line and ("enabled" in line.lower() or "activated" in line.lower()):
-                parts = line.strip().split()
-                if len(parts) >= 2:
-                    extensions.append(line.strip()[:80])
+        extensions = [m.group(1)[:80] for m in matches]
 
         n = len(extensions)
         if n == 0:
@@ -1701,25 +2082,28 @@ class CronJobsCheck(BaseCheck):
     manual removal attempts that don't also check crontab.
 
     Detection mechanism:
-        Runs ``crontab -l`` for the current user. Non-zero exit or empty output
-        means no cron jobs are configured. Non-comment, non-blank lines are
-        counted as active jobs.
+        Reads the current user's table from ``/var/at/tabs/<user>`` directly
+        when readable (e.g. when run with sudo); otherwise streams
+        ``crontab -l`` through ``shell_grep()``. A missing table, non-zero
+        exit, or no matching lines means the user has no cron jobs. Every
+        other non-empty table found by ``_cron_sources()`` in ``/etc/cron.d/``
+        and ``/var/at/tabs/`` is then read as well. Non-comment, non-blank
+        lines are counted as active jobs.
 
     Severity scale:
-        - ``pass``: No cron jobs configured (``crontab -l`` fails or is empty).
+        - ``pass``: No active cron jobs in any readable table.
         - ``warning``: At least one non-comment cron job found.
 
     Note:
-        Only the current user's crontab is checked. System-level cron entries
-        (``/etc/cron.d/``, ``/var/at/tabs/``) require elevated privileges to
-        read and are not checked here.
+        ``/var/at/tabs/`` is root-only, so other users' tables are only seen
+        when macaudit runs with sudo. Unreadable tables are skipped.
 
     Attributes:
         id (str): ``"cron_jobs"``
         name (str): ``"Cron Jobs"``
         fix_level (str): ``"instructions"`` — removing cron jobs requires
             ``crontab -e`` (interactive editor), which cannot be automated.
-        fix_steps (list[str]): Commands to list and edit crontab entries.
+        fix_steps (tuple[str, ...]): Commands to list and edit crontab entries.
         fix_reversible (bool): ``True`` — removed cron jobs can be re-added.
         fix_time_estimate (str): About 5 minutes.
     """
@@ -1746,20 +2130,24 @@ class CronJobsCheck(BaseCheck):
     )
     fix_level = "instructions"
     fix_description = "Review and remove unexpected cron entries"
-    fix_steps = [
+    fix_steps = (
         "List current crons: crontab -l",
         "Edit crontab: crontab -e  (remove suspicious lines and save)",
         "Check system crons: ls /etc/cron.d/ (if it exists)",
-    ]
+    )
     fix_reversible = True
     fix_time_estimate = "~5 minutes"
 
     def run(self) -> CheckResult:
-        """Run ``crontab -l`` and count non-comment job lines.
+        """Read the user's and system cron tables and count active job lines.
 
-        ``crontab -l`` exits non-zero when no crontab exists for the current
-        user. Empty output after filtering comments and blank lines also
-        indicates no active jobs.
+        The user's table file is read directly, avoiding a fork, when
+        ``/var/at/tabs`` is accessible. On ``PermissionError`` (the usual
+        case for non-root users), or when the uid has no passwd entry to
+        name the table, ``crontab -l`` is used instead; it exits non-zero
+        when no crontab exists for the current user. The remaining
+        tables come from ``_cron_sources()`` and are read without any
+        subprocess; jobs from them are prefixed with the table's path.
 
         Returns:
             CheckResult: One of:
@@ -1775,16 +2163,38 @@ class CronJobsCheck(BaseCheck):
             result = check.run()
             # warning: "2 cron jobs found — verify each is intentional"
         """
-        rc, out, _ = self.shell(["crontab", "-l"])
-        if rc != 0 or not out.strip():
-            return self._pass("No cron jobs configured for this user")
-
-        # Filter out blank lines and comment lines (starting with #).
-        jobs = [
-            ln.strip()
-            for ln in out.splitlines()
-            if ln.strip() and not ln.strip().startswith("#")
-        ]
+        # Blank lines and comment lines (starting with #) never match.
+        # The table is named after the real uid's login, as crontab -l uses.
+        table: Path | None = None
+        jobs: list[str] = []
+        try:
+            table = _CRON_TABS / pwd.getpwuid(os.getuid()).pw_name
+            with open(table, encoding="utf-8", errors="replace") as f:
+                jobs = [
+                    m.group(1)
+                    for line in f if (m := _CRON_JOB_RE.search(line))
+                ]
+        except FileNotFoundError:
+            pass
+        except (KeyError, OSError):
+            # No passwd entry for the uid, or the table is not readable.
+            rc, matches = self.shell_grep(["crontab", "-l"], _CRON_JOB_RE)
+            if rc == 0:
+                jobs = [m.group(1) for m in matches]
+
+        # System-level tables, plus other users' when running as root.
+        for path in _cron_sources():
+            if path == table:
+                continue
+            try:
+                with open(path, encoding="utf-8", errors="replace") as f:
+                    jobs.extend(
+                        f"{path}: {m.group(1)}"
+                        for line in f if (m := _CRON_JOB_RE.search(line))
+                    )
+            except OSError:
+                continue
+
         if not jobs:
             return self._pass("No active cron jobs configured")
 
@@ -1806,10 +2216,11 @@ class XProtectCheck(BaseCheck):
     families that Apple has already detected and catalogued.
 
     Detection mechanism:
-        Runs ``pkgutil --pkg-info com.apple.pkg.XProtectPlistConfigData`` to
-        retrieve the package version and install timestamp. Converts the
-        ``install-time`` field (Unix timestamp) to an age in days. Falls back
-        to checking for the XProtect bundle path directly if pkgutil fails.
+        Parses the ``com.apple.pkg.XProtectPlistConfigData`` installer receipt
+        with ``plistlib`` for ``PackageVersion`` and ``InstallDate`` — the
+        same data ``pkgutil --pkg-info`` prints, without the subprocess.
+        Falls back to the XProtect bundle's ``Info.plist`` (version and file
+        mtime) when the receipt is missing.
 
     Severity scale:
         - ``pass``: Signatures updated within the last 30 days.
@@ -1853,13 +2264,10 @@ class XProtectCheck(BaseCheck):
     fix_time_estimate = "~30 seconds"
 
     def run(self) -> CheckResult:
-        """Query ``pkgutil`` for XProtect install date and warn if older than 30 days.
+        """Read XProtect's version and install date and warn if older than 30 days.
 
-        Parses the ``version:`` and ``install-time:`` fields from
-        ``pkgutil --pkg-info`` output. Converts the Unix epoch ``install-time``
-        value to an age in days. Falls back to bundle existence check if
-        ``pkgutil`` cannot find the package (e.g. on Apple Silicon with
-        cryptex-based XProtect delivery).
+        Reads the version and install time via ``_signature_info()`` and
+        converts the install time to an age in days.
 
         Returns:
             CheckResult: One of:
@@ -1867,51 +2275,28 @@ class XProtectCheck(BaseCheck):
             - ``pass`` — Signatures updated within 30 days.
             - ``warning`` — Signatures are > 30 days old.
             - ``info`` — Package version present but install date unavailable.
-            - ``info`` — pkgutil failed but XProtect bundle is present.
+            - ``info`` — Neither receipt nor bundle metadata is readable, but
+              the XProtect bundle is present.
             - ``info`` — XProtect bundle not found (unusual; may be in system
               cryptex).
 
-        Note:
-            The ``import time as _time`` inside this method is intentional:
-            ``time`` is only needed here, and the alias avoids shadowing the
-            module-level ``time`` name if it were ever imported at the top.
-
         Example::
 
             check = XProtectCheck()
             result = check.run()
             # pass: "XProtect signatures updated 3 days ago (v5273)"
         """
-        import time as _time
-
-        rc, out, _ = self.shell(
-            ["pkgutil", "--pkg-info", "com.apple.pkg.XProtectPlistConfigData"],
-            timeout=5,
-        )
-
-        if rc != 0 or not out.strip():
-            # Fallback: verify the XProtect bundle is at least present on disk.
-            bundle = Path(
-                "/Library/Apple/System/Library/CoreServices/XProtect.bundle"
-            )
-            if bundle.exists():
-                return self._info("XProtect is present (version unreadable via pkgutil)")
+        info = self._signature_info()
+        if info is None:
+            if stat_path(_XPROTECT_BUNDLE) is not None:
+                return self._info("XProtect is present (version unreadable)")
             return self._info("XProtect bundle not found — may be part of System volume")
 
-        version = ""
-        install_time = 0
-        for line in out.splitlines():
-            if line.startswith("version:"):
-                version = line.split(":", 1)[1].strip()
-            elif line.startswith("install-time:"):
-                try:
-                    install_time = int(line.split(":", 1)[1].strip())
-                except ValueError:
-                    pass
+        version, install_time = info
 
         if install_time:
             # Convert from Unix epoch to whole days of age.
-            age_days = int((_time.time() - install_time) / 86400)
+            age_days = int((time.time() - install_time) / 86400)
             age_str = f"{age_days} day{'s' if age_days != 1 else ''} ago"
             ver_str = f" (v{version})" if version else ""
 
@@ -1933,6 +2318,45 @@ class XProtectCheck(BaseCheck):
             )
         return self._info("XProtect present (details unavailable)")
 
+    def _signature_info(self) -> tuple[str, float] | None:
+        """Return XProtect's signature version and install time from disk.
+
+        Prefers the installer receipt, whose ``InstallDate`` plistlib decodes
+        as a naive UTC ``datetime``.  This is the same record
+        ``pkgutil --pkg-info-plist`` serialises, so shelling out to pkgutil
+        would add a fork without adding a source.  Without a receipt, uses
+        the bundle's ``CFBundleShortVersionString`` and the ``Info.plist``
+        mtime, which changes whenever an update replaces the bundle.
+
+        Returns:
+            tuple[str, float] | None: ``(version, install_epoch)``, where
+            either element may be empty/``0.0`` if its source lacks it, or
+            ``None`` if neither plist could be read.
+        """
+        try:
+            with open(_XPROTECT_RECEIPT, "rb") as f:
+                receipt = plistlib.load(f)
+        except Exception:
+            receipt = None
+        if isinstance(receipt, dict):
+            date = receipt.get("InstallDate")
+            installed = (
+                date.replace(tzinfo=timezone.utc).timestamp()
+                if isinstance(date, datetime) else 0.0
+            )
+            return str(receipt.get("PackageVersion", "")), installed
+
+        info_plist = _XPROTECT_BUNDLE / "Contents" / "Info.plist"
+        try:
+            with open(info_plist, "rb") as f:
+                bundle_info = plistlib.load(f)
+                installed = os.fstat(f.fileno()).st_mtime
+        except Exception:
+            return None
+        if not isinstance(bundle_info, dict):
+            return None
+        return str(bundle_info.get("CFBundleShortVersionString", "")), installed
+
 
 # ── Public list for main.py ───────────────────────────────────────────────────
 # Consumed by macaudit/main.py to discover and register all checks in this module.
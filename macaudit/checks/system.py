@@ -6,7 +6,12 @@ Gatekeeper, Time Machine, auto-update config, screen lock,
 Rosetta 2, and Secure Boot.
 """
 
+import bisect
+import plistlib
+import re
+import shutil
 import subprocess
+import time
 from datetime import datetime, timezone
 from functools import lru_cache
 from pathlib import Path
@@ -17,28 +22,189 @@ from macaudit.constants import (
     SCREEN_LOCK_PASS_SECONDS,
     SCREEN_LOCK_WARNING_SECONDS,
 )
-from macaudit.system_info import IS_APPLE_SILICON, MACOS_VERSION
+from macaudit.system_info import (
+    IS_APPLE_SILICON,
+    MACOS_VERSION,
+    MACOS_VERSION_STRING,
+    scan_cache,
+    stat_path,
+)
 
+# Absolute paths of the system tools these checks run, resolved through PATH
+# once at import.  Handing subprocess an absolute path skips the per-call
+# PATH walk in execvp; the stock location is the fallback when PATH does not
+# list the tool's directory.
+_EXE = {
+    name: shutil.which(name) or default
+    for name, default in (
+        ("arch", "/usr/bin/arch"),
+        ("csrutil", "/usr/bin/csrutil"),
+        ("defaults", "/usr/bin/defaults"),
+        ("fdesetup", "/usr/bin/fdesetup"),
+        ("nvram", "/usr/sbin/nvram"),
+        ("softwareupdate", "/usr/sbin/softwareupdate"),
+        ("spctl", "/usr/sbin/spctl"),
+        ("system_profiler", "/usr/sbin/system_profiler"),
+        ("tmutil", "/usr/bin/tmutil"),
+    )
+}
+
+# Both firewall checks probe this binary via stat_path(), so one stat per scan.
 _FIREWALL = "/usr/libexec/ApplicationFirewall/socketfilterfw"
+_SOFTWARE_UPDATE_PLIST = Path("/Library/Preferences/com.apple.SoftwareUpdate.plist")
+_SCREENSAVER_PLIST = Path.home() / "Library" / "Preferences" / "com.apple.screensaver.plist"
+
+# Status keywords in the one-line answers of csrutil, fdesetup,
+# socketfilterfw and spctl.  One findall collects every keyword present, so
+# each check branches on set membership instead of rescanning its output
+# once per substring.  "status: enabled." is listed first so SIP's fully
+# enabled sentence is told apart from "enabled (Custom Configuration)".
+_STATUS_RE = re.compile(
+    r"status: enabled\.|\b(?:enabled|disabled|custom|converting"
+    r"|is on|is off|state = [01])\b",
+    re.IGNORECASE,
+)
+
+
+def _status_words(output: str) -> frozenset[str]:
+    """Return the lower-cased _STATUS_RE keywords found in *output*."""
+    return frozenset(m.lower() for m in _STATUS_RE.findall(output))
+
+
+# The running major version is fixed for the process, so Apple's support
+# cutoff is decided once at import.
+_MACOS_EOL = MACOS_VERSION[0] < MIN_SUPPORTED_MACOS_MAJOR
+
+# Files whose presence means Rosetta 2 is installed, most common first.
+_ROSETTA_PATHS = (
+    Path("/usr/libexec/rosetta/rosetta"),
+    Path("/usr/libexec/oah/translate"),  # alternate indicator
+)
+
+# Case-insensitive matches over `softwareupdate -l` text, so no lower-cased
+# copy of each line (or of the whole output) is made.
+_MACOS_UPDATE_RE = re.compile(r"macos|os x", re.IGNORECASE)
+_NO_UPDATES_RE = re.compile(r"no new software available", re.IGNORECASE)
+
+# An update item line: starts with "*" or "-" (but is not a bare "-"
+# separator); the group is the line without surrounding whitespace.
+_UPDATE_LINE_RE = re.compile(r"^[ \t]*((?:\*|-(?=[ \t]*\S))[^\n]*?)[ \t\r]*$", re.MULTILINE)
+_SECURITY_UPDATE_RE = re.compile(r"security|recommended:[ \t]*yes", re.IGNORECASE)
+
+# The "Secure Boot: <policy>" row of `system_profiler SPiBridgeDataType`.
+# Every repeat is confined to one line, so a non-matching row fails fast.
+_SECURE_BOOT_RE = re.compile(
+    r"^[ \t]*Secure Boot[^:\n]*:[ \t]*([^\n]*?)[ \t\r]*$",
+    re.MULTILINE | re.IGNORECASE,
+)
+
+
+# ── Shared preference reads (cached) ──────────────────────────────────────────
+
+@scan_cache(maxsize=4)
+def _read_plist(path: Path) -> dict | None:
+    """
+    Parse a preferences plist once per scan.
+
+    Returns the top-level dict, {} when the file does not exist (every key
+    absent, as `defaults read` would report), or None when it exists but
+    cannot be read or parsed, so the caller can fall back to `defaults`.
+    """
+    try:
+        with open(path, "rb") as f:
+            prefs = plistlib.load(f)
+    except FileNotFoundError:
+        return {}
+    except (OSError, plistlib.InvalidFileException, ValueError):
+        return None
+    return prefs if isinstance(prefs, dict) else None
 
 
 # ── Shared network call (cached) ──────────────────────────────────────────────
 
-@lru_cache(maxsize=1)
+# A `softwareupdate -l` started by prefetch_software_updates(), waiting to be
+# collected by the first _fetch_software_updates() call of the scan.
+_prefetched_updates: subprocess.Popen | None = None
+
+
+def _start_software_update_list() -> subprocess.Popen:
+    """
+    Launch `softwareupdate -l` with stderr merged into one stdout pipe.
+
+    The "No new software available." banner arrives on stderr; merging at the
+    pipe keeps it in emission order and leaves one buffer to read, with no
+    concatenated copy of the two afterwards.
+    """
+    return subprocess.Popen(
+        [_EXE["softwareupdate"], "-l"],
+        stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True,
+    )
+
+
+def prefetch_software_updates() -> None:
+    """
+    Start `softwareupdate -l` in the background at the beginning of a scan.
+
+    The call is a network round trip of up to 30 s.  Starting it before the
+    checks are dispatched lets it overlap with everything else, so the checks
+    that need it usually find the output already waiting.  Errors are left
+    for _fetch_software_updates() to report.
+
+    Whoever starts a prefetch owns its cleanup: the process is only collected
+    if an update check actually runs, so the caller must follow up with
+    cancel_software_update_prefetch() once the scan is over (a no-op when
+    the process was already consumed).
+    """
+    global _prefetched_updates
+    if _prefetched_updates is not None:
+        return
+    try:
+        _prefetched_updates = _start_software_update_list()
+    except Exception:
+        _prefetched_updates = None
+
+
+def cancel_software_update_prefetch() -> None:
+    """
+    Stop a prefetched `softwareupdate -l` whose scan is not going to run.
+
+    Used when the user cancels at the pre-scan prompt, and after every scan
+    in case no update check consumed the process (gated out by min_macos or
+    requires_tool, or the scan failed), so the network query does not
+    outlive the tool as an orphaned child process.
+    """
+    global _prefetched_updates
+    proc, _prefetched_updates = _prefetched_updates, None
+    if proc is None:
+        return
+    try:
+        proc.kill()
+        proc.communicate()
+    except Exception:
+        pass
+
+
+@scan_cache()
 def _fetch_software_updates() -> tuple[int, str]:
     """
-    Run `softwareupdate -l` once; cache result.
+    Collect `softwareupdate -l` output once per scan; cache result.
+
+    Reuses the process started by prefetch_software_updates() when there is
+    one, otherwise starts it now.
 
     Returns (returncode, combined_output).
     Timeout is 30 s because this is a network call.
     """
+    global _prefetched_updates
+    proc, _prefetched_updates = _prefetched_updates, None
     try:
-        r = subprocess.run(
-            ["softwareupdate", "-l"],
-            capture_output=True, text=True, timeout=30, check=False,
-        )
-        return r.returncode, r.stdout + r.stderr
+        if proc is None:
+            proc = _start_software_update_list()
+        output, _ = proc.communicate(timeout=30)
+        return proc.returncode, output
     except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.communicate()
         return -1, "TIMEOUT: softwareupdate took too long"
     except FileNotFoundError:
         return -1, "NOTFOUND: softwareupdate not available"
@@ -46,13 +212,20 @@ def _fetch_software_updates() -> tuple[int, str]:
         return -1, f"ERROR: {e}"
 
 
-def _parse_update_lines(output: str) -> list[str]:
-    """Return lines that describe available update items (start with * or -)."""
-    return [
-        ln.strip()
-        for ln in output.splitlines()
-        if ln.strip().startswith(("*", "-")) and ln.strip() != "-"
-    ]
+@lru_cache(maxsize=1)
+def _parse_updates(output: str) -> tuple[tuple[str, ...], bool]:
+    """
+    Parse `softwareupdate -l` output with two compiled regex sweeps.
+
+    Returns (update_lines, has_security): the lines that describe available
+    update items (start with * or -), and whether the output mentions a
+    security or recommended update.  Both run in the regex engine, with no
+    per-line Python loop.  Both update checks receive the same cached output
+    string, so the second call is a cache hit.
+    """
+    update_lines = tuple(_UPDATE_LINE_RE.findall(output))
+    has_security = _SECURITY_UPDATE_RE.search(output) is not None
+    return update_lines, has_security
 
 
 # ── Checks ────────────────────────────────────────────────────────────────────
@@ -85,8 +258,16 @@ class MacOSVersionCheck(BaseCheck):
     fix_time_estimate = "20–60 minutes"
 
     def run(self) -> CheckResult:
-        """Use cached softwareupdate -l output to detect pending macOS updates; flag major versions below 13 as unsupported."""
-        from macaudit.system_info import MACOS_VERSION_STRING
+        """Use cached softwareupdate -l output to detect pending macOS updates; flag major versions below 13 as unsupported.
+
+        An unsupported major version is a warning whatever softwareupdate says,
+        so it is reported before waiting on the network call.
+        """
+        if _MACOS_EOL:
+            return self._warning(
+                f"macOS {MACOS_VERSION_STRING} is no longer supported by Apple",
+                data={"version": MACOS_VERSION_STRING},
+            )
 
         rc, output = _fetch_software_updates()
 
@@ -98,11 +279,8 @@ class MacOSVersionCheck(BaseCheck):
                 data={"version": MACOS_VERSION_STRING},
             )
 
-        update_lines = _parse_update_lines(output)
-        macos_update = any(
-            "macos" in ln.lower() or "os x" in ln.lower()
-            for ln in update_lines
-        )
+        update_lines, _ = _parse_updates(output)
+        macos_update = any(_MACOS_UPDATE_RE.search(ln) for ln in update_lines)
 
         if macos_update:
             return self._warning(
@@ -110,13 +288,6 @@ class MacOSVersionCheck(BaseCheck):
                 data={"version": MACOS_VERSION_STRING, "update_available": True},
             )
 
-        # Sanity: flag very old major version even if softwareupdate thinks it's fine
-        if MACOS_VERSION[0] < MIN_SUPPORTED_MACOS_MAJOR:
-            return self._warning(
-                f"macOS {MACOS_VERSION_STRING} is no longer supported by Apple",
-                data={"version": MACOS_VERSION_STRING},
-            )
-
         return self._pass(
             f"macOS {MACOS_VERSION_STRING} is current",
             data={"version": MACOS_VERSION_STRING},
@@ -160,21 +331,15 @@ class PendingUpdatesCheck(BaseCheck):
                 f"Could not check for updates: {output[:80]}",
             )
 
-        if "no new software available" in output.lower():
+        if _NO_UPDATES_RE.search(output):
             return self._pass("All software is up to date")
 
-        update_lines = _parse_update_lines(output)
+        update_lines, has_security = _parse_updates(output)
         n = len(update_lines)
 
         if n == 0:
             return self._pass("No pending updates found")
 
-        # Flag critical/security updates specially
-        has_security = any(
-            "security" in ln.lower() or "recommended: yes" in ln.lower()
-            for ln in output.splitlines()
-        )
-
         msg = f"{n} update{'s' if n != 1 else ''} pending"
         if has_security:
             msg += " (includes recommended updates)"
@@ -208,37 +373,37 @@ class SIPCheck(BaseCheck):
     )
     fix_level = "instructions"
     fix_description = "Re-enabling SIP requires booting to Recovery Mode"
-    fix_steps = [
+    fix_steps = (
         "Restart and hold Power (Apple Silicon) or Cmd+R (Intel) to enter Recovery",
         "Open Terminal from the Utilities menu",
         "Run: csrutil enable",
         "Restart your Mac",
-    ]
+    )
     fix_reversible = True
     fix_time_estimate = "~5 minutes"
 
     def run(self) -> CheckResult:
         """Run csrutil status and parse output for enabled, disabled, or custom configuration states."""
-        rc, stdout, stderr = self.shell(["csrutil", "status"])
+        rc, stdout, stderr = self.shell([_EXE["csrutil"], "status"])
 
         if rc != 0 or not stdout:
             return self._info(f"Could not determine SIP status: {stderr[:80]}")
 
-        out = stdout.strip().lower()
+        words = _status_words(stdout)
 
         # Full SIP enabled: "system integrity protection status: enabled."
         # Must not match "enabled (custom configuration)" — that's partial.
-        if "status: enabled." in out and "custom" not in out:
+        if "status: enabled." in words and "custom" not in words:
             return self._pass("System Integrity Protection is enabled")
 
         # Partial: SIP enabled with specific flags removed
-        if "enabled" in out and "custom" in out:
+        if "enabled" in words and "custom" in words:
             return self._warning(
                 "SIP is partially disabled (custom configuration — some protections removed)",
                 data={"sip_status": stdout.strip()[:120]},
             )
 
-        if "disabled" in out:
+        if "disabled" in words:
             return self._warning(
                 "System Integrity Protection is disabled",
                 data={"sip_enabled": False},
@@ -277,22 +442,22 @@ class FileVaultCheck(BaseCheck):
 
     def run(self) -> CheckResult:
         """Run fdesetup status to check encryption state; detect in-progress conversions."""
-        rc, stdout, stderr = self.shell(["fdesetup", "status"])
+        rc, stdout, stderr = self.shell([_EXE["fdesetup"], "status"])
 
         if rc != 0:
             return self._error(f"Could not check FileVault: {stderr[:80]}")
 
-        out = stdout.lower()
+        words = _status_words(stdout)
 
-        if "is on" in out:
-            if "converting" in out:
+        if "is on" in words:
+            if "converting" in words:
                 return self._info(
                     "FileVault is encrypting (conversion in progress)",
                     data={"converting": True},
                 )
             return self._pass("Disk encryption is enabled")
 
-        if "is off" in out:
+        if "is off" in words:
             return self._critical(
                 "Disk encryption is disabled — physical access = data access",
                 data={"filevault_enabled": False},
@@ -337,7 +502,7 @@ class FirewallCheck(BaseCheck):
 
         Skips gracefully if the socketfilterfw binary is not present.
         """
-        if not Path(_FIREWALL).exists():
+        if stat_path(_FIREWALL) is None:
             return self._skip("socketfilterfw not found")
 
         rc, stdout, stderr = self.shell([_FIREWALL, "--getglobalstate"])
@@ -345,12 +510,12 @@ class FirewallCheck(BaseCheck):
         if rc != 0:
             return self._info(f"Could not check firewall: {stderr[:80]}")
 
-        out = stdout.lower()
+        words = _status_words(stdout)
 
-        if "enabled" in out or "state = 1" in out:
+        if "enabled" in words or "state = 1" in words:
             return self._pass("Application firewall is enabled")
 
-        if "disabled" in out or "state = 0" in out:
+        if "disabled" in words or "state = 0" in words:
             return self._warning(
                 "Application firewall is disabled",
                 data={"firewall_enabled": False},
@@ -391,7 +556,7 @@ class FirewallStealthCheck(BaseCheck):
 
         Handles both modern ('is on/off') and older ('enabled/disabled') output formats.
         """
-        if not Path(_FIREWALL).exists():
+        if stat_path(_FIREWALL) is None:
             return self._skip("socketfilterfw not found")
 
         rc, stdout, stderr = self.shell([_FIREWALL, "--getstealthmode"])
@@ -399,14 +564,14 @@ class FirewallStealthCheck(BaseCheck):
         if rc != 0:
             return self._info(f"Could not check stealth mode: {stderr[:80]}")
 
-        out = stdout.lower()
+        words = _status_words(stdout)
 
         # Output format: "Firewall stealth mode is on" / "Firewall stealth mode is off"
         # Older format: "Stealth mode enabled" / "Stealth mode disabled"
-        if "enabled" in out or " is on" in out:
+        if "enabled" in words or "is on" in words:
             return self._pass("Stealth mode is enabled")
 
-        if "disabled" in out or " is off" in out:
+        if "disabled" in words or "is off" in words:
             return self._info(
                 "Stealth mode is disabled — Mac responds to network probes",
                 data={"stealth_enabled": False},
@@ -445,17 +610,17 @@ class GatekeeperCheck(BaseCheck):
 
     def run(self) -> CheckResult:
         """Run spctl --status to determine if Gatekeeper assessments are enabled or disabled."""
-        rc, stdout, stderr = self.shell(["spctl", "--status"])
+        rc, stdout, stderr = self.shell([_EXE["spctl"], "--status"])
 
         if rc != 0 and not stdout:
             return self._info(f"Could not check Gatekeeper: {stderr[:80]}")
 
-        out = stdout.lower()
+        words = _status_words(stdout)
 
-        if "enabled" in out:
+        if "enabled" in words:
             return self._pass("Gatekeeper is enabled — apps are verified before running")
 
-        if "disabled" in out:
+        if "disabled" in words:
             return self._critical(
                 "Gatekeeper is disabled — apps run without any verification",
                 data={"gatekeeper_enabled": False},
@@ -491,12 +656,15 @@ class TimeMachineCheck(BaseCheck):
     fix_reversible = True
     fix_time_estimate = "Varies — depends on backup size"
 
+    # Upper bounds (days, inclusive) of the pass and info bands.
+    _AGE_THRESHOLDS = (1, 7)
+
     def run(self) -> CheckResult:
         """Run tmutil latestbackup and parse the backup folder timestamp to compute age in days.
 
         Warns if no backup exists or last backup is older than 7 days.
         """
-        rc, stdout, stderr = self.shell(["tmutil", "latestbackup"])
+        rc, stdout, stderr = self.shell([_EXE["tmutil"], "latestbackup"])
 
         if rc != 0 or not stdout.strip():
             return self._warning(
@@ -506,30 +674,29 @@ class TimeMachineCheck(BaseCheck):
 
         backup_path = stdout.strip()
 
-        # Parse date from path component like "2024-02-10-143052"
+        # Parse date from path component like "2024-02-10-143052" by fixed
+        # offsets; int() and datetime() reject any malformed field.
         try:
             folder = Path(backup_path).name  # e.g. "2024-02-10-143052"
-            dt = datetime.strptime(folder[:15], "%Y-%m-%d-%H%M%S")
-            dt = dt.replace(tzinfo=timezone.utc)
-            now = datetime.now(timezone.utc)
-            age_days = (now - dt).days
+            if folder[4:5] != "-" or folder[7:8] != "-" or folder[10:11] != "-":
+                raise ValueError(folder)
+            dt = datetime(
+                int(folder[0:4]), int(folder[5:7]), int(folder[8:10]),
+                int(folder[11:13]), int(folder[13:15]), int(folder[15:17]),
+                tzinfo=timezone.utc,
+            )
+            age_days = (int(time.time()) - int(dt.timestamp())) // 86400
             age_str = (
                 f"{age_days} day{'s' if age_days != 1 else ''} ago"
                 if age_days > 0
                 else "today"
             )
 
-            if age_days > 7:
-                return self._warning(
-                    f"Last backup was {age_str}",
-                    data={"backup_age_days": age_days},
-                )
-            if age_days > 1:
-                return self._info(
-                    f"Last backup was {age_str}",
-                    data={"backup_age_days": age_days},
-                )
-            return self._pass(
+            # ≤1 day → pass, ≤7 days → info, older → warning
+            verdict = (self._pass, self._info, self._warning)[
+                bisect.bisect_left(self._AGE_THRESHOLDS, age_days)
+            ]
+            return verdict(
                 f"Last backup was {age_str}",
                 data={"backup_age_days": age_days},
             )
@@ -566,21 +733,29 @@ class AutoUpdateCheck(BaseCheck):
     fix_time_estimate = "~30 seconds"
 
     _PREF_DOMAIN = "/Library/Preferences/com.apple.SoftwareUpdate"
+    _KEYS = (
+        ("AutomaticCheckEnabled",  "Check for updates"),
+        ("CriticalUpdateInstall",  "Install security responses"),
+        ("ConfigDataInstall",      "Install XProtect/MRT updates"),
+    )
 
     def run(self) -> CheckResult:
-        """Read three keys from com.apple.SoftwareUpdate via defaults read.
+        """Read three keys from com.apple.SoftwareUpdate in one plist parse.
 
-        A missing key means the system default (on), so only an explicit '0' is flagged.
+        A missing key means the system default (on), so only an explicit 0 is flagged.
+        Falls back to one `defaults read` per key only if the plist is unreadable.
         """
         issues = []
-
-        for key, label in [
-            ("AutomaticCheckEnabled",  "Check for updates"),
-            ("CriticalUpdateInstall",  "Install security responses"),
-            ("ConfigDataInstall",      "Install XProtect/MRT updates"),
-        ]:
+        prefs = _read_plist(_SOFTWARE_UPDATE_PLIST)
+
+        for key, label in self._KEYS:
+            if prefs is not None:
+                # Booleans parse as True/False; False == 0, and True is not.
+                if prefs.get(key, True) in (0, "0"):
+                    issues.append(label)
+                continue
             rc, stdout, _ = self.shell(
-                ["defaults", "read", self._PREF_DOMAIN, key]
+                [_EXE["defaults"], "read", self._PREF_DOMAIN, key]
             )
             if rc == 0 and stdout.strip() == "0":
                 issues.append(label)
@@ -623,32 +798,36 @@ class ScreenLockCheck(BaseCheck):
     fix_time_estimate = "~30 seconds"
 
     def run(self) -> CheckResult:
-        """Read askForPassword and askForPasswordDelay from com.apple.screensaver via defaults.
+        """Read askForPassword and askForPasswordDelay from com.apple.screensaver.
 
+        Both keys come from one cached parse of the user's plist; `defaults read`
+        is only used if that file is unreadable.
         Delays over 5s trigger a warning; missing keys assume secure system defaults.
         """
-        # Check if password is required at all
-        rc_req, req_out, _ = self.shell(
-            ["defaults", "read", "com.apple.screensaver", "askForPassword"]
-        )
-        if rc_req == 0 and req_out.strip() == "0":
+        prefs = _read_plist(_SCREENSAVER_PLIST)
+        if prefs is not None:
+            ask = prefs.get("askForPassword")
+            raw_delay = prefs.get("askForPasswordDelay")
+        else:
+            ask = self._defaults_value("askForPassword")
+            raw_delay = self._defaults_value("askForPasswordDelay")
+
+        # Check if password is required at all (False == 0 for plist booleans)
+        if ask in (0, "0"):
             return self._warning(
                 "Password not required after sleep or screensaver",
                 data={"password_required": False},
             )
 
         # Check delay
-        rc, stdout, _ = self.shell(
-            ["defaults", "read", "com.apple.screensaver", "askForPasswordDelay"]
-        )
-        if rc != 0 or not stdout.strip():
+        if raw_delay is None or raw_delay == "":
             # Key absent → system default is 0 (immediate) — safe
             return self._pass("Password required immediately after sleep (system default)")
 
         try:
-            delay = int(float(stdout.strip()))
-        except ValueError:
-            return self._info(f"Screen lock delay unreadable: {stdout.strip()[:40]}")
+            delay = int(float(raw_delay))
+        except (TypeError, ValueError):
+            return self._info(f"Screen lock delay unreadable: {str(raw_delay)[:40]}")
 
         if delay == 0:
             return self._pass("Password required immediately after sleep")
@@ -668,6 +847,11 @@ class ScreenLockCheck(BaseCheck):
             data={"delay_seconds": delay},
         )
 
+    def _defaults_value(self, key: str) -> str | None:
+        """Read one com.apple.screensaver key with `defaults`; None if absent."""
+        rc, stdout, _ = self.shell([_EXE["defaults"], "read", "com.apple.screensaver", key])
+        return stdout.strip() if rc == 0 else None
+
 
 class RosettaCheck(BaseCheck):
     """Check that Rosetta 2 is installed on Apple Silicon Macs for Intel app compatibility."""
@@ -697,19 +881,21 @@ class RosettaCheck(BaseCheck):
     fix_time_estimate = "~2 minutes"
 
     def run(self) -> CheckResult:
-        """Check for Rosetta runtime binaries on disk; fall back to arch -arch x86_64 test."""
+        """Check for Rosetta runtime binaries on disk; fall back to arch -arch x86_64 test.
+
+        The probe stops at the first path found, so an installed Rosetta costs
+        one stat.  ``arch`` only runs when neither file exists — normally a Mac
+        without Rosetta, where the command fails immediately.
+        """
         if not IS_APPLE_SILICON:
             return self._skip("Rosetta 2 only applies to Apple Silicon Macs")
 
         # Check if Rosetta translation runtime is present
-        rosetta_path = Path("/usr/libexec/rosetta/rosetta")
-        oah_path = Path("/usr/libexec/oah/translate")  # alternate indicator
-
-        if rosetta_path.exists() or oah_path.exists():
+        if any(stat_path(p) is not None for p in _ROSETTA_PATHS):
             return self._pass("Rosetta 2 is installed (Intel app compatibility ready)")
 
-        # Double-check: try running an x86_64 command
-        rc, _, _ = self.shell(["arch", "-arch", "x86_64", "true"])
+        # Double-check for runtime layouts the paths above do not cover
+        rc, _, _ = self.shell([_EXE["arch"], "-arch", "x86_64", "true"])
         if rc == 0:
             return self._pass("Rosetta 2 is installed")
 
@@ -742,12 +928,12 @@ class SecureBootCheck(BaseCheck):
     )
     fix_level = "instructions"
     fix_description = "Requires Recovery Mode to change Secure Boot policy"
-    fix_steps = [
+    fix_steps = (
         "Restart and hold the Power button (Apple Silicon) or Cmd+R (Intel)",
         "Open Utilities → Startup Security Utility",
         "Select 'Full Security'",
         "Restart",
-    ]
+    )
     fix_reversible = True
     fix_time_estimate = "~5 minutes"
 
@@ -756,22 +942,21 @@ class SecureBootCheck(BaseCheck):
         if not IS_APPLE_SILICON:
             # For Intel with T2: system_profiler SPiBridgeDataType
             rc, stdout, _ = self.shell(
-                ["system_profiler", "SPiBridgeDataType"], timeout=8
+                [_EXE["system_profiler"], "SPiBridgeDataType"], timeout=8
             )
             if rc != 0 or not stdout:
                 return self._skip("Secure Boot check requires T2 chip or Apple Silicon")
 
-            for line in stdout.splitlines():
-                if "secure boot" in line.lower():
-                    val = line.split(":", 1)[-1].strip()
-                    if "full" in val.lower():
-                        return self._pass(f"Secure Boot: {val}")
-                    return self._info(f"Secure Boot: {val}")
-
-            return self._skip("Secure Boot info not available on this Mac")
+            m = _SECURE_BOOT_RE.search(stdout)
+            if m is None:
+                return self._skip("Secure Boot info not available on this Mac")
+            val = m.group(1)
+            if "full" in val.lower():
+                return self._pass(f"Secure Boot: {val}")
+            return self._info(f"Secure Boot: {val}")
 
         # Apple Silicon: nvram AppleSecureBootPolicy
-        rc, stdout, _ = self.shell(["nvram", "AppleSecureBootPolicy"])
+        rc, stdout, _ = self.shell([_EXE["nvram"], "AppleSecureBootPolicy"])
 
         if rc != 0 or not stdout:
             # On some Apple Silicon builds the key name differs or requires
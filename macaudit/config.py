@@ -19,12 +19,17 @@ Design decisions:
       accepted as a fallback for Python 3.10.
     - All parse errors are silently swallowed so a bad config file
       never prevents the user from running a scan.
-    - The ``suppress`` list is coerced to a ``set[str]`` for O(1)
-      membership tests in the main scan loop.
+    - Non-string ``suppress`` entries are dropped and the remaining IDs
+      are stored as a ``frozenset[str]`` for O(1) membership tests in
+      the main scan loop, cached per path so repeated calls do not
+      re-stat or re-parse the file.
 
 Attributes:
     _CONFIG_PATH (pathlib.Path): Default filesystem path for the
         user configuration file.
+    _tomllib (module | None): The TOML parser resolved at import time —
+        ``tomllib`` or the ``tomli`` backport — or ``None`` when neither
+        is installed.
 
 Note:
     The public API surface is intentionally minimal: a single
@@ -32,18 +37,74 @@ Note:
     edits the TOML file directly.
 """
 
+from functools import lru_cache
 from pathlib import Path
 
+# ── TOML parser (resolved once) ───────────────────────────────────────────────
+# ``tomllib`` is in the stdlib as of Python 3.11; ``tomli`` is the backport
+# for Python 3.10 (listed as optional dep).
+try:
+    import tomllib as _tomllib
+except ModuleNotFoundError:
+    try:
+        import tomli as _tomllib  # type: ignore[no-redef]
+    except ModuleNotFoundError:
+        _tomllib = None  # type: ignore[assignment]
+
+
 # Default filesystem location for the user config file.
 # Follows the XDG Base Directory convention (~/.config/<app>/).
 _CONFIG_PATH = Path.home() / ".config" / "macaudit" / "config.toml"
 
 
+@lru_cache(maxsize=8)
+def _load_suppress(config_path: Path) -> frozenset[str]:
+    """Read and validate the ``suppress`` list of *config_path*, once per path.
+
+    Args:
+        config_path (pathlib.Path): The TOML file to read.
+
+    Returns:
+        frozenset[str]: The suppressed check IDs — empty on any failure.
+        Immutable, so the cached value is safely shared between callers.
+    """
+    # Guard: do nothing if the config file does not exist.
+    # This is the normal case for first-time users.
+    if not config_path.is_file():
+        return frozenset()
+
+    # Neither parser available — silently skip config loading.
+    if _tomllib is None:
+        return frozenset()
+
+    # Parse straight from the binary file (TOML is always UTF-8), so no
+    # decoded copy of the document is built.  OSError covers permission
+    # denied and similar I/O errors; any malformed file returns defaults.
+    try:
+        with config_path.open("rb") as f:
+            data = _tomllib.load(f)
+    except Exception:
+        return frozenset()
+
+    # Validate the ``suppress`` key: must be a list if present.
+    # Wrong type (e.g. a bare string) is treated as misconfiguration → ignore.
+    suppress = data.get("suppress")
+    if not isinstance(suppress, list):
+        return frozenset()
+
+    # Check IDs are strings, which TOML already hands back as ``str`` — keep
+    # those and drop anything else (a stray number cannot name a check).
+    # A frozenset gives O(1) lookup.
+    return frozenset(item for item in suppress if isinstance(item, str))
+
+
 def load_config(path: Path | None = None) -> dict:
     """Load and return the macaudit configuration from a TOML file.
 
     Reads the config file at *path* (or ``_CONFIG_PATH`` if *path* is
-    ``None``) and returns a validated configuration dictionary.
+    ``None``) and returns a validated configuration dictionary.  The file
+    is stat-ed and parsed only on the first call for a given path; later
+    calls reuse the cached result.
 
     This function is **safe to call unconditionally** — it catches every
     expected failure mode (file absent, permission error, bad TOML, wrong
@@ -58,13 +119,15 @@ def load_config(path: Path | None = None) -> dict:
     Returns:
         dict: A configuration dict guaranteed to contain:
 
-            ``suppress`` (set[str])
+            ``suppress`` (frozenset[str])
                 Set of check IDs that should be skipped during scans.
-                Empty set when no suppression is configured.
+                Empty when no suppression is configured.
 
     Note:
         The returned ``suppress`` set always exists (never ``None``),
         so callers can safely iterate or call ``in`` without a guard.
+        It is immutable because the same object is handed to every
+        caller; edits to the file are not seen until the process restarts.
 
     Example::
 
@@ -72,44 +135,4 @@ def load_config(path: Path | None = None) -> dict:
         >>> if "homebrew_outdated" in cfg["suppress"]:
         ...     print("homebrew_outdated suppressed")
     """
-    config_path = path or _CONFIG_PATH
-
-    # Canonical empty configuration — returned on any failure path.
-    empty: dict = {"suppress": set()}
-
-    # Guard: do nothing if the config file does not exist.
-    # This is the normal case for first-time users.
-    if not config_path.is_file():
-        return empty
-
-    # Read raw bytes; OSError covers permission denied and similar I/O errors.
-    try:
-        raw = config_path.read_bytes()
-    except OSError:
-        return empty
-
-    # Resolve the TOML parser.  ``tomllib`` is in the stdlib as of Python 3.11;
-    # ``tomli`` is the backport for Python 3.10 (listed as optional dep).
-    try:
-        import tomllib
-    except ModuleNotFoundError:
-        try:
-            import tomli as tomllib  # type: ignore[no-redef]
-        except ModuleNotFoundError:
-            # Neither parser available — silently skip config loading.
-            return empty
-
-    # Parse the TOML document; any malformed file returns defaults.
-    try:
-        data = tomllib.loads(raw.decode("utf-8"))
-    except Exception:
-        return empty
-
-    # Validate the ``suppress`` key: must be a list if present.
-    # Wrong type (e.g. a bare string) is treated as misconfiguration → ignore.
-    suppress = data.get("suppress")
-    if not isinstance(suppress, list):
-        return empty
-
-    # Coerce each list element to str and store as a set for O(1) lookup.
-    return {"suppress": {str(item) for item in suppress}}
+    return {"suppress": _load_suppress(path or _CONFIG_PATH)}
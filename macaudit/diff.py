@@ -25,15 +25,25 @@ Filter-mismatch suppression:
     cleared to avoid misleading noise in the diff panel.
 
 Attributes:
+    _SEVERITY_RANKING (tuple[str, ...]): Every status from least to most
+        severe; a status's index is its severity rank.
     _STATUS_SEVERITY (dict[str, int]): Maps each status string to an
         integer severity rank used to determine improvement vs regression.
         Higher values are more severe.
+    _ID (operator.itemgetter): Sort key returning a result's ``id``.
 
 Note:
     All functions in this module are stateless and side-effect-free.
     They may be called freely from tests without any setup.
+
+    The comparison core is deliberately plain Python.  A scan holds a few
+    dozen checks, so a vectorised or JIT-compiled kernel (numpy/numba)
+    would cost more in import and compile time than it could save, and
+    would add heavy dependencies to a small CLI.
 """
 
+from operator import itemgetter
+
 from macaudit.enums import CheckStatus
 
 
@@ -41,19 +51,29 @@ from macaudit.enums import CheckStatus
 # Maps each check status to an integer rank.  A decrease in rank
 # (curr_sev < prev_sev) means the check improved; an increase means
 # it regressed.  ``pass`` is the best state (0); ``critical`` is worst (5).
-# Keys are CheckStatus members; because CheckStatus inherits from str, plain
-# string lookups (e.g. from JSON payloads) work without conversion.
+# The order is declared once as a tuple and each rank is a status's index in
+# it, so the table cannot drift from the order.  Keys are CheckStatus
+# members; because CheckStatus inherits from str, plain string lookups
+# (e.g. from JSON payloads) work without conversion.
+
+_SEVERITY_RANKING: tuple[CheckStatus, ...] = (
+    CheckStatus.PASS,
+    CheckStatus.INFO,
+    CheckStatus.SKIP,
+    CheckStatus.WARNING,
+    CheckStatus.ERROR,
+    CheckStatus.CRITICAL,
+)
 
 _STATUS_SEVERITY: dict[CheckStatus, int] = {
-    CheckStatus.PASS:     0,
-    CheckStatus.INFO:     1,
-    CheckStatus.SKIP:     2,
-    CheckStatus.WARNING:  3,
-    CheckStatus.ERROR:    4,
-    CheckStatus.CRITICAL: 5,
+    status: rank for rank, status in enumerate(_SEVERITY_RANKING)
 }
 
 
+# Sort key for scan results: their check ID.
+_ID = itemgetter("id")
+
+
 # ── Public API ────────────────────────────────────────────────────────────────
 
 def compute_diff(current: dict, previous: dict) -> dict | None:
@@ -96,9 +116,10 @@ def compute_diff(current: dict, previous: dict) -> dict | None:
             no improved/regressed/new/removed checks).
 
     Note:
-        Each entry in ``improved``, ``regressed``, ``new_checks``, and
-        ``removed_checks`` is a dict with keys ``id``, ``name``,
-        ``category``, ``status``, and ``message``.
+        Each entry in ``new_checks`` and ``removed_checks`` is a dict
+        with keys ``id``, ``name``, ``category``, ``status``, and
+        ``message``; ``improved`` and ``regressed`` entries carry
+        ``before_status`` and ``after_status`` in place of ``status``.
 
     Example::
 
@@ -114,81 +135,105 @@ def compute_diff(current: dict, previous: dict) -> dict | None:
     score_after  = current.get("score", 0)
     score_delta  = score_after - score_before
 
+    # Fast path for the common case of back-to-back identical scans: same
+    # score and the same status for every ID can only produce an empty diff,
+    # so skip the index, sort and classification work below entirely.
+    if (
+        score_delta == 0
+        and _status_fingerprint(previous) == _status_fingerprint(current)
+    ):
+        return None
+
     # Index both scan result lists by check ID for O(1) cross-reference.
+    # Inserting in ID order means every loop below walks the IDs sorted, so
+    # each change list comes out in deterministic, reproducible order
+    # without a sort of its own.  The raw result dicts are indexed, not a
+    # projection of their fields: only checks that changed, appeared or
+    # disappeared ever need more than their status, so fields are read
+    # lazily for those few.
     prev_by_id: dict[str, dict] = {
-        r["id"]: r for r in previous.get("results", [])
+        r["id"]: r for r in sorted(previous.get("results", []), key=_ID)
     }
     curr_by_id: dict[str, dict] = {
-        r["id"]: r for r in current.get("results", [])
+        r["id"]: r for r in sorted(current.get("results", []), key=_ID)
     }
 
-    improved:       list[dict] = []
-    regressed:      list[dict] = []
-    new_checks:     list[dict] = []
-    removed_checks: list[dict] = []
-
-    # ── Compare checks present in both scans ──────────────────────────────────
-    # For each check that appeared in both scans, compare severity ranks.
-    # A lower rank in the current scan means improvement; higher means regression.
-    common_ids = set(prev_by_id) & set(curr_by_id)
-    for check_id in common_ids:
-        prev_r = prev_by_id[check_id]
-        curr_r = curr_by_id[check_id]
-
-        prev_sev = _STATUS_SEVERITY.get(prev_r.get("status", ""), 0)
-        curr_sev = _STATUS_SEVERITY.get(curr_r.get("status", ""), 0)
-
+    improved:  list[dict] = []
+    regressed: list[dict] = []
+    # Only IDs for now: the new/removed records are built after the
+    # filter-mismatch check below, and only if they will be kept.
+    new_ids:   list[str]     = []
+
+    # ── Compare current checks against the previous scan ──────────────────────
+    # One pass over the current results: a check missing from the previous
+    # scan is new; otherwise compare severity ranks.  A lower rank in the
+    # current scan means improvement; higher means regression.  Dict
+    # membership replaces the intersection/difference sets of both id views.
+    # The bound methods are hoisted into locals so the loop body does not
+    # repeat the attribute lookups for every check.
+    severity      = _STATUS_SEVERITY.get
+    prev_lookup   = prev_by_id.get
+    add_new       = new_ids.append
+    add_improved  = improved.append
+    add_regressed = regressed.append
+
+    for check_id, curr_r in curr_by_id.items():
+        prev_r = prev_lookup(check_id)
+        curr_get = curr_r.get
+
+        if prev_r is None:
+            # The check exists now but did not exist in the previous scan.
+            add_new(check_id)
+            continue
+
+        curr_status = curr_get("status", "")
+
+        # Most checks keep their status between scans; an equal string
+        # cannot change rank, so skip both severity lookups for it.
+        prev_status = prev_r.get("status", "")
+        if prev_status == curr_status:
+            continue
+
+        prev_sev = severity(prev_status, 0)
+        curr_sev = severity(curr_status, 0)
+
+        if curr_sev == prev_sev:
+            continue
+
+        change = {
+            "id":            check_id,
+            "name":          curr_get("name", ""),
+            "category":      curr_get("category", ""),
+            "before_status": prev_status,
+            "after_status":  curr_status,
+            "message":       curr_get("message", ""),
+        }
         if curr_sev < prev_sev:
             # The check status improved (e.g. critical → pass).
-            improved.append({
-                "id":            check_id,
-                "name":          curr_r.get("name", ""),
-                "category":      curr_r.get("category", ""),
-                "before_status": prev_r.get("status", ""),
-                "after_status":  curr_r.get("status", ""),
-                "message":       curr_r.get("message", ""),
-            })
-        elif curr_sev > prev_sev:
+            add_improved(change)
+        else:
             # The check status regressed (e.g. pass → warning).
-            regressed.append({
-                "id":            check_id,
-                "name":          curr_r.get("name", ""),
-                "category":      curr_r.get("category", ""),
-                "before_status": prev_r.get("status", ""),
-                "after_status":  curr_r.get("status", ""),
-                "message":       curr_r.get("message", ""),
-            })
-
-    # ── Checks added in the current scan ──────────────────────────────────────
-    # These are checks that exist now but did not exist in the previous scan.
-    for check_id in set(curr_by_id) - set(prev_by_id):
-        r = curr_by_id[check_id]
-        new_checks.append({
-            "id":       check_id,
-            "name":     r.get("name", ""),
-            "category": r.get("category", ""),
-            "status":   r.get("status", ""),
-            "message":  r.get("message", ""),
-        })
+            add_regressed(change)
 
     # ── Checks removed from the current scan ─────────────────────────────────
     # These were present previously but are absent now (e.g. check removed
     # from the suite, or excluded via --skip).
-    for check_id in set(prev_by_id) - set(curr_by_id):
-        r = prev_by_id[check_id]
-        removed_checks.append({
-            "id":       check_id,
-            "name":     r.get("name", ""),
-            "category": r.get("category", ""),
-            "status":   r.get("status", ""),
-            "message":  r.get("message", ""),
-        })
+    removed_ids = [cid for cid in prev_by_id if cid not in curr_by_id]
 
-    # Sort all lists by check ID for deterministic, reproducible output.
-    improved.sort(key=lambda d: d["id"])
-    regressed.sort(key=lambda d: d["id"])
-    new_checks.sort(key=lambda d: d["id"])
-    removed_checks.sort(key=lambda d: d["id"])
+    # ── Filter-mismatch suppression ───────────────────────────────────────────
+    # When the user runs with different --only / --skip flags across scans,
+    # many checks appear as "new" or "removed" even though nothing real changed.
+    # Heuristic: if more than half of all checks are in the new/removed
+    # buckets, it's almost certainly a filter mismatch — clear those buckets.
+    # Decided from the ID counts alone, so suppressed records are never built.
+    total_checks = max(len(prev_by_id), len(curr_by_id), 1)
+    filter_ratio = (len(new_ids) + len(removed_ids)) / total_checks
+    if filter_ratio > 0.5:
+        new_checks:     list[dict] = []
+        removed_checks: list[dict] = []
+    else:
+        new_checks     = _presence_records(new_ids, curr_by_id)
+        removed_checks = _presence_records(removed_ids, prev_by_id)
 
     diff = {
         "previous_scan_time": previous.get("scan_time", ""),
@@ -201,17 +246,6 @@ def compute_diff(current: dict, previous: dict) -> dict | None:
         "removed_checks":     removed_checks,
     }
 
-    # ── Filter-mismatch suppression ───────────────────────────────────────────
-    # When the user runs with different --only / --skip flags across scans,
-    # many checks appear as "new" or "removed" even though nothing real changed.
-    # Heuristic: if more than half of all checks are in the new/removed
-    # buckets, it's almost certainly a filter mismatch — clear those buckets.
-    total_checks = max(len(prev_by_id), len(curr_by_id), 1)
-    filter_ratio = (len(new_checks) + len(removed_checks)) / total_checks
-    if filter_ratio > 0.5:
-        diff["new_checks"]     = []
-        diff["removed_checks"] = []
-
     # If the diff is empty after suppression, signal "nothing to show".
     if is_empty_diff(diff):
         return None
@@ -219,6 +253,46 @@ def compute_diff(current: dict, previous: dict) -> dict | None:
     return diff
 
 
+def _presence_records(ids: list[str], by_id: dict[str, dict]) -> list[dict]:
+    """Build the ``new_checks`` / ``removed_checks`` entries for *ids*.
+
+    Args:
+        ids (list[str]): Check IDs present in only one scan, in ID order.
+        by_id (dict[str, dict]): That scan's results indexed by check ID.
+
+    Returns:
+        list[dict]: One entry per ID, in the order given.
+    """
+    records = []
+    add = records.append
+    for check_id in ids:
+        get = by_id[check_id].get
+        add({
+            "id":       check_id,
+            "name":     get("name", ""),
+            "category": get("category", ""),
+            "status":   get("status", ""),
+            "message":  get("message", ""),
+        })
+    return records
+
+
+def _status_fingerprint(payload: dict) -> dict[str, str]:
+    """Map each check ID in *payload* to its status string.
+
+    Two payloads with equal fingerprints have the same checks in the same
+    states, whatever their result order.  An exact mapping is compared
+    rather than a hash of it so a collision can never hide a real change.
+
+    Args:
+        payload (dict): A scan payload in the JSON output schema.
+
+    Returns:
+        dict[str, str]: ``{check_id: status}`` for every result.
+    """
+    return {r["id"]: r.get("status", "") for r in payload.get("results", ())}
+
+
 def is_empty_diff(diff: dict) -> bool:
     """Return ``True`` if the diff contains no meaningful changes.
 
@@ -45,19 +45,51 @@ Security note:
     injection.
 
 Attributes:
-    None — this module exports only the four executor functions.
+    None — this module exports the four executor functions and
+    ``format_command()``, the shared display form of a ``fix_command``.
 """
 
 from __future__ import annotations
 
+import codecs
+import re
 import shlex
 import subprocess
+from functools import lru_cache
 
 from rich.console import Console
 
 from macaudit.checks.base import CheckResult
 
 
+# Escapes a shell string for embedding in an AppleScript string literal.
+# translate() maps each character exactly once, so backslashes and double
+# quotes are escaped in one pass with no replace-ordering pitfalls.
+_APPLESCRIPT_ESCAPE = str.maketrans({"\\": "\\\\", '"': '\\"'})
+
+# Line breaks in fix output: \r\n, a bare \r (progress redraws) or \n — the
+# same set text-mode pipes translate with universal newlines.
+_LINE_BREAK_RE = re.compile(r"\r\n?|\n")
+
+
+# ── Command display ───────────────────────────────────────────────────────────
+
+@lru_cache(maxsize=64)
+def _quote_command(cmd: tuple[str, ...]) -> str:
+    """Memoised ``shlex.join`` keyed on the hashable argument tuple."""
+    return shlex.join(cmd)
+
+
+def format_command(cmd: list[str]) -> str:
+    """
+    Return *cmd* as a properly-quoted shell string.
+
+    fix_command lists are static per check, so each distinct command is
+    quoted once per session and reused by the fix card and the executor.
+    """
+    return _quote_command(tuple(cmd))
+
+
 # ── AUTO — stream shell command output ────────────────────────────────────────
 
 def run_auto_fix(result: CheckResult, console: Console) -> bool:
@@ -71,7 +103,7 @@ def run_auto_fix(result: CheckResult, console: Console) -> bool:
         console.print("  [red]No fix command defined.[/red]\n")
         return False
 
-    display_cmd = shlex.join(result.fix_command)
+    display_cmd = format_command(result.fix_command)
     console.print(f"  [dim]$[/dim]  [cyan]{display_cmd}[/cyan]")
     console.print()
 
@@ -81,17 +113,23 @@ def run_auto_fix(result: CheckResult, console: Console) -> bool:
             shell=False,
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
-            text=True,
-            bufsize=1,
         )
 
         if proc.stdout is None:
             console.print("  [red]No output stream available.[/red]\n")
             return False
-        for line in proc.stdout:
-            stripped = line.rstrip()
-            if stripped:
-                console.print(f"  [dim]{stripped}[/dim]")
+
+        # Binary pipe read in whatever-is-available batches (read1 returns
+        # as soon as the child has written something, so output still
+        # appears live), decoded incrementally so a UTF-8 sequence split
+        # across reads survives.  The trailing partial line is carried
+        # over to the next batch.
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        pending = ""
+        while chunk := proc.stdout.read1(65536):
+            *lines, pending = _LINE_BREAK_RE.split(pending + decoder.decode(chunk))
+            _print_output_lines(lines, console)
+        _print_output_lines([pending + decoder.decode(b"", final=True)], console)
 
         proc.wait(timeout=120)
 
@@ -113,6 +151,14 @@ def run_auto_fix(result: CheckResult, console: Console) -> bool:
         return False
 
 
+def _print_output_lines(lines: list[str], console: Console) -> None:
+    """Print each non-blank line of command output, dimmed and indented."""
+    for line in lines:
+        stripped = line.rstrip()
+        if stripped:
+            console.print(f"  [dim]{stripped}[/dim]")
+
+
 # ── AUTO_SUDO — osascript for native macOS password dialog ────────────────────
 
 def run_auto_sudo_fix(result: CheckResult, console: Console) -> bool:
@@ -127,10 +173,10 @@ def run_auto_sudo_fix(result: CheckResult, console: Console) -> bool:
         console.print("  [red]No fix command defined.[/red]\n")
         return False
 
-    # shlex.join produces a properly-quoted shell string from the arg list.
+    # format_command produces a properly-quoted shell string from the arg list.
     # Then escape double-quotes for embedding inside the AppleScript string.
-    shell_cmd = shlex.join(result.fix_command)
-    osa_safe = shell_cmd.replace("\\", "\\\\").replace('"', '\\"')
+    shell_cmd = format_command(result.fix_command)
+    osa_safe = shell_cmd.translate(_APPLESCRIPT_ESCAPE)
     osa_script = f'do shell script "{osa_safe}" with administrator privileges'
 
     display_cmd = shell_cmd
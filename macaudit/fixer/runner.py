@@ -36,11 +36,13 @@ Attributes:
         executor.  ``"none"`` results are excluded because no action is possible.
     _SEVERITY_ORDER (dict[str, int]): Maps status strings to sort keys for
         the severity-descending display order.
+    _EXECUTORS (dict[str, Callable]): Maps each ``fix_level`` in
+        ``_FIXABLE_LEVELS`` to the executor function that applies it.
 """
 
 from __future__ import annotations
 
-import shlex
+from collections.abc import Callable
 
 from simple_term_menu import TerminalMenu
 from rich.console import Console, Group
@@ -51,6 +53,7 @@ from rich.text import Text
 from macaudit.checks.base import CheckResult
 from macaudit.enums import CheckStatus, FixLevel
 from macaudit.fixer.executor import (
+    format_command,
     run_auto_fix,
     run_auto_sudo_fix,
     run_guided_fix,
@@ -94,6 +97,13 @@ _SEVERITY_ORDER: dict[CheckStatus, int] = {
     CheckStatus.INFO:     3,
 }
 
+_EXECUTORS: dict[FixLevel, Callable[[CheckResult, Console], bool]] = {
+    FixLevel.AUTO:         run_auto_fix,
+    FixLevel.AUTO_SUDO:    run_auto_sudo_fix,
+    FixLevel.GUIDED:       run_guided_fix,
+    FixLevel.INSTRUCTIONS: run_instructions_fix,
+}
+
 
 
 # ── Public API ────────────────────────────────────────────────────────────────
@@ -227,10 +237,10 @@ def _run_auto_mode(
 def _dispatch(result: CheckResult, console: Console) -> bool:
     """Route a fix result to the appropriate executor function.
 
-    Looks up ``result.fix_level`` in a static dispatch map and calls the
+    Looks up ``result.fix_level`` in ``_EXECUTORS`` and calls the
     corresponding executor.  Returns ``False`` if the fix level has no
     registered executor (defensive guard; should not occur if ``_FIXABLE_LEVELS``
-    is kept in sync with the dispatch map).
+    is kept in sync with ``_EXECUTORS``).
 
     Args:
         result (CheckResult): The check result whose fix should be executed.
@@ -239,13 +249,7 @@ def _dispatch(result: CheckResult, console: Console) -> bool:
     Returns:
         bool: ``True`` if the executor reported success, ``False`` otherwise.
     """
-    dispatch_map = {
-        "auto":         run_auto_fix,
-        "auto_sudo":    run_auto_sudo_fix,
-        "guided":       run_guided_fix,
-        "instructions": run_instructions_fix,
-    }
-    fn = dispatch_map.get(result.fix_level)
+    fn = _EXECUTORS.get(result.fix_level)
     if fn is None:
         console.print("  [dim]No executor for this fix level.[/dim]\n")
         return False
@@ -273,12 +277,15 @@ def _get_fixable(results: list[CheckResult]) -> list[CheckResult]:
         list[CheckResult]: Filtered and severity-sorted list of actionable
         results.  Empty list if no fixable results exist.
     """
-    fixable = [
-        r for r in results
-        if r.status in _FIXABLE_STATUSES
-        and r.fix_level in _FIXABLE_LEVELS
-    ]
-    return sorted(fixable, key=lambda r: _SEVERITY_ORDER.get(r.status, 9))
+    # There are only a handful of severity ranks, so filter and bucket in a
+    # single pass and concatenate the buckets: a stable, linear-time
+    # severity sort with no key function.  The spare last bucket (index -1)
+    # holds any status missing from _SEVERITY_ORDER, so it sorts last.
+    buckets: list[list[CheckResult]] = [[] for _ in range(len(_SEVERITY_ORDER) + 1)]
+    for r in results:
+        if r.status in _FIXABLE_STATUSES and r.fix_level in _FIXABLE_LEVELS:
+            buckets[_SEVERITY_ORDER.get(r.status, -1)].append(r)
+    return [r for bucket in buckets for r in bucket]
 
 
 def _print_fix_card(
@@ -316,19 +323,21 @@ def _print_fix_card(
 
     parts: list = []
 
+    # Each block is built in one Text constructor call rather than grown with
+    # append() per span.  Plain (str, style) pieces rather than console markup,
+    # because messages and commands may contain "[" and would need escaping.
+
     # ── Status badge + fix level ───────────────────────────────────────────────
-    badge = Text()
-    badge.append(f"  {status_icon}  ", style=str(status_style))
-    badge.append(result.status.upper(), style=f"bold {str(status_style)}")
-    badge.append("   ")
-    badge.append(f"{level_emoji}  {level_label}", style=COLOR_DIM)
-    parts.append(badge)
+    parts.append(Text.assemble(
+        (f"  {status_icon}  ", str(status_style)),
+        (result.status.upper(), f"bold {str(status_style)}"),
+        "   ",
+        (f"{level_emoji}  {level_label}", COLOR_DIM),
+    ))
     parts.append(Text(""))
 
     # ── Message + finding explanation ─────────────────────────────────────────
-    msg = Text()
-    msg.append(f"  {result.message}", style=COLOR_TEXT)
-    parts.append(msg)
+    parts.append(Text(f"  {result.message}", style=COLOR_TEXT))
 
     if result.finding_explanation:
         parts.append(
@@ -338,20 +347,20 @@ def _print_fix_card(
     parts.append(Text(""))
 
     # ── What this fix does ────────────────────────────────────────────────────
-    what = Text()
-    what.append("  What this fix does\n", style=f"bold {COLOR_TEXT}")
-    what.append(f"  {result.fix_description}", style=COLOR_DIM)
-    parts.append(what)
+    parts.append(Text.assemble(
+        ("  What this fix does\n", f"bold {COLOR_TEXT}"),
+        (f"  {result.fix_description}", COLOR_DIM),
+    ))
 
     if result.fix_level in (FixLevel.AUTO, FixLevel.AUTO_SUDO) and result.fix_command:
-        cmd = Text()
-        cmd.append(f"\n  $ {shlex.join(result.fix_command)}", style="dim cyan")
-        parts.append(cmd)
+        parts.append(
+            Text(f"\n  $ {format_command(result.fix_command)}", style="dim cyan")
+        )
     elif result.fix_level == FixLevel.INSTRUCTIONS and result.fix_steps:
-        steps = Text()
-        for i, step in enumerate(result.fix_steps, 1):
-            steps.append(f"\n  {i}. {step}", style=COLOR_DIM)
-        parts.append(steps)
+        parts.append(Text(
+            "".join(f"\n  {i}. {step}" for i, step in enumerate(result.fix_steps, 1)),
+            style=COLOR_DIM,
+        ))
 
     parts.append(Text(""))
 
@@ -363,9 +372,7 @@ def _print_fix_card(
     if result.requires_sudo:
         meta_parts.append("🔐 requires password")
 
-    footer = Text()
-    footer.append("  " + "  ·  ".join(meta_parts), style=COLOR_DIM)
-    parts.append(footer)
+    parts.append(Text("  " + "  ·  ".join(meta_parts), style=COLOR_DIM))
 
     # Border colour follows status
     if result.status == CheckStatus.CRITICAL:
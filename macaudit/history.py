@@ -27,6 +27,12 @@ Design decisions:
       that external tools consuming ``--json`` can also parse history files.
     - All I/O operations are wrapped in ``try/except OSError`` so a history
       write failure never crashes a scan.
+    - Each file is written to a hidden temporary file in the same directory
+      and ``os.replace()``-d into place, so a failed write never leaves a
+      truncated newest scan for ``load_previous_scan()`` to trip over.
+    - ``orjson`` (the optional ``fast`` extra) encodes and decodes history
+      files when installed; the stdlib ``json`` module is the fallback.
+      Both produce the same two-space-indented document.
     - ``_build_payload()`` is module-private but also imported directly by
       ``main.py`` for diff computation (to avoid building the payload twice).
 
@@ -34,16 +40,32 @@ Attributes:
     _HISTORY_DIR (pathlib.Path): Filesystem path to the history directory.
     _MAX_SCANS (int): Maximum number of scan snapshots to retain.
         Older files beyond this cap are deleted by ``prune_history()``.
+    _orjson (module | None): The ``orjson`` module, or ``None`` when the
+        optional dependency is not installed.
+    _listing (tuple[pathlib.Path, list[pathlib.Path]] | None): The history
+        directory and its sorted ``*.json`` files, listed once per process
+        and kept current by ``save_scan()`` / ``prune_history()``.
 """
 
-import dataclasses
+import bisect
 import json
+import os
+import tempfile
+from collections import Counter
 from datetime import datetime, timezone
 from pathlib import Path
 
 from macaudit import __version__
 from macaudit.checks.base import CheckResult, calculate_health_score
 
+# ── Optional orjson codec ─────────────────────────────────────────────────────
+# orjson is not a hard dependency (pip install "macaudit[fast]").  Without it
+# the stdlib json module reads and writes history files.
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
 
 # ── Constants ─────────────────────────────────────────────────────────────────
 
@@ -54,9 +76,57 @@ _HISTORY_DIR = Path.home() / ".config" / "macaudit" / "history"
 # 10 scans provides roughly 10 days of history for daily users.
 _MAX_SCANS = 10
 
+# Sorted history listing shared by load_previous_scan(), save_scan() and
+# prune_history(), so a load → save → prune cycle reads the directory once.
+# Keyed by the directory it was taken from; every write and delete goes
+# through this module and updates the list in place.
+_listing: tuple[Path, list[Path]] | None = None
+
 
 # ── Public API ────────────────────────────────────────────────────────────────
 
+def _write_atomically(path: Path, payload: dict) -> None:
+    """Write *payload* as JSON to *path* via a temporary file and a rename.
+
+    The document goes to a hidden ``.tmp`` file in the same directory (so it
+    never appears in the history listing) and is ``os.replace()``-d onto
+    *path* only once it is complete.  If encoding or writing fails, the
+    temporary file is removed and the exception propagates; *path* is never
+    left half-written.
+
+    Args:
+        path (pathlib.Path): The final history file path.
+        payload (dict): The document built by ``_build_payload()``.
+
+    Raises:
+        OSError: The temporary file could not be created, written, or
+            renamed.
+    """
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.stem}-", suffix=".tmp")
+    try:
+        if _orjson is not None:
+            # orjson encodes in native code straight to UTF-8 bytes.
+            # OPT_NON_STR_KEYS matches json's handling of non-str keys
+            # that checks may put in their ``data`` dicts.
+            with os.fdopen(fd, "wb") as f:
+                f.write(_orjson.dumps(
+                    payload, option=_orjson.OPT_INDENT_2 | _orjson.OPT_NON_STR_KEYS,
+                ))
+        else:
+            # Stream into the file rather than building the whole indented
+            # document as one string first.  Raw UTF-8 rather than \u
+            # escapes, byte-for-byte what the orjson branch writes.
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(payload, f, indent=2, ensure_ascii=False)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
 def save_scan(results: list[CheckResult]) -> Path | None:
     """Persist a completed scan to the history directory as a JSON file.
 
@@ -96,12 +166,19 @@ def save_scan(results: list[CheckResult]) -> Path | None:
     try:
         # Create intermediate directories if this is the first scan.
         _HISTORY_DIR.mkdir(parents=True, exist_ok=True)
-        path.write_text(json.dumps(payload, indent=2))
+        _write_atomically(path, payload)
     except OSError:
         return None
 
-    # Enforce the maximum-scans cap after writing the new file.
-    prune_history()
+    # Record the new file in the shared listing (it is normally the newest
+    # name, so this is an append), then enforce the cap against that list.
+    try:
+        files = _history_files()
+    except OSError:
+        return path
+    if path not in files:
+        bisect.insort(files, path)
+    prune_history(files)
     return path
 
 
@@ -129,8 +206,7 @@ def load_previous_scan() -> dict | None:
             diff = compute_diff(current_payload, previous)
     """
     try:
-        # Sorted glob gives chronological order (filename = timestamp).
-        files = sorted(_HISTORY_DIR.glob("*.json"))
+        files = _history_files()
     except OSError:
         # History directory absent or not accessible.
         return None
@@ -140,26 +216,35 @@ def load_previous_scan() -> dict | None:
 
     try:
         # Load only the newest file — we never need older history directly.
-        return json.loads(files[-1].read_text())
+        # Both parsers accept the raw bytes, and orjson.JSONDecodeError is
+        # a subclass of json.JSONDecodeError.
+        data = files[-1].read_bytes()
+        return _orjson.loads(data) if _orjson is not None else json.loads(data)
     except (json.JSONDecodeError, OSError):
         return None
 
 
-def prune_history() -> None:
+def prune_history(files: list[Path] | None = None) -> None:
     """Delete the oldest history files to stay within the ``_MAX_SCANS`` cap.
 
     Files are sorted lexicographically; those beyond the *last*
     ``_MAX_SCANS`` entries are deleted.  Individual deletion failures
     are silently ignored so a locked file never blocks future writes.
 
+    Args:
+        files (list[pathlib.Path] | None): The sorted history listing, as
+            returned by ``_history_files()``.  ``None`` (the default) reads
+            it from the shared listing.
+
     Note:
         This is called automatically by ``save_scan()`` after every write.
         Manual invocation is not normally needed.
     """
-    try:
-        files = sorted(_HISTORY_DIR.glob("*.json"))
-    except OSError:
-        return
+    if files is None:
+        try:
+            files = _history_files()
+        except OSError:
+            return
 
     # ``files[:-_MAX_SCANS]`` is empty when len(files) <= _MAX_SCANS,
     # so no deletions occur in the normal case.
@@ -170,9 +255,46 @@ def prune_history() -> None:
             # Silently skip locked or already-deleted files.
             pass
 
+    # Pruned (or vanished) files leave the listing either way.
+    del files[:-_MAX_SCANS]
+
 
 # ── Internal ──────────────────────────────────────────────────────────────────
 
+def _history_files() -> list[Path]:
+    """Return the sorted ``*.json`` files in ``_HISTORY_DIR``.
+
+    The directory is read only on the first call for a given
+    ``_HISTORY_DIR``; later calls return the same list object, which
+    ``save_scan()`` and ``prune_history()`` update as they change the
+    directory.  Sorted order is chronological (filename = timestamp).
+
+    Returns:
+        list[pathlib.Path]: The shared, mutable listing.
+
+    Raises:
+        OSError: If the directory cannot be read.
+    """
+    global _listing
+    if _listing is None or _listing[0] != _HISTORY_DIR:
+        # os.scandir with a suffix test instead of Path.glob: no fnmatch,
+        # and a Path is built only for the names that are kept.  Dotfiles
+        # are skipped, as glob's "*" would.  A missing directory simply
+        # has no history yet.
+        try:
+            with os.scandir(_HISTORY_DIR) as it:
+                names = sorted(
+                    e.name for e in it
+                    if e.name.endswith(".json")
+                    and not e.name.startswith(".")
+                    and e.is_file()
+                )
+        except FileNotFoundError:
+            names = []
+        _listing = (_HISTORY_DIR, [_HISTORY_DIR / n for n in names])
+    return _listing[1]
+
+
 def _build_payload(results: list[CheckResult]) -> dict:
     """Serialise a list of ``CheckResult`` objects into the canonical JSON payload.
 
@@ -192,9 +314,10 @@ def _build_payload(results: list[CheckResult]) -> dict:
             schema_version, macaudit_version, scan_time, system,
             score, summary, results
 
-        ``results`` is a list of ``dataclasses.asdict()``-serialised
-        ``CheckResult`` dicts, with the ``min_macos`` tuple converted to
-        a list for JSON compatibility.
+        ``results`` is a list of shallow ``CheckResult`` field dicts, with
+        the ``min_macos`` tuple converted to a list for JSON compatibility.
+        Nested values (``data``, ``fix_steps``, …) are shared with the
+        results rather than deep-copied; the payload is only read.
 
     Note:
         ``from macaudit.system_info import get_system_info`` is imported
@@ -206,18 +329,15 @@ def _build_payload(results: list[CheckResult]) -> dict:
 
     info = get_system_info()
 
-    # Compute per-status counts for the "summary" section.
-    counts: dict[str, int] = {}
-    for r in results:
-        counts[r.status] = counts.get(r.status, 0) + 1
-
-    # Convert each CheckResult dataclass to a plain dict for JSON serialisation.
-    serialised = []
-    for r in results:
-        d = dataclasses.asdict(r)
-        # tuples are not valid JSON; convert min_macos tuple → list.
-        d["min_macos"] = list(d["min_macos"])
-        serialised.append(d)
+    # Compute per-status counts for the "summary" section.  Counter tallies
+    # in C; dict() keeps the JSON a plain object in first-seen status order.
+    counts: dict[str, int] = dict(Counter(r.status for r in results))
+
+    # Project each CheckResult onto a plain dict for JSON serialisation.  The
+    # instance __dict__ already holds every field, so unpacking it is a flat
+    # copy — dataclasses.asdict() would deep-copy every nested list and dict.
+    # tuples are not valid JSON; convert min_macos tuple → list.
+    serialised = [{**vars(r), "min_macos": list(r.min_macos)} for r in results]
 
     return {
         "schema_version":    1,
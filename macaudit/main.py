@@ -14,13 +14,14 @@ It owns:
   - Exit-code contract for CI integration (``--fail-on-critical``).
 
 Architecture notes:
-    - All heavy imports (``macaudit.checks.*``, ``macaudit.ui.*``,
+    - All heavy imports (``rich``, ``macaudit.checks.*``, ``macaudit.ui.*``,
       ``macaudit.fixer.*``) are deferred to the *inside* of functions to
-      minimise startup latency.  Only the absolute minimum needed to parse
-      CLI arguments is imported at module level.
-    - ``console`` is a module-level ``rich.Console`` instance shared by all
-      output functions.  Passing it explicitly avoids global state in the
-      UI layer.
+      minimise startup latency.  Only ``click`` and ``__version__`` are
+      imported at module level, so ``-V`` and ``-h`` return without
+      loading the theme (which probes dark mode) or ``system_info``.
+    - ``_get_console()`` builds the one ``rich.Console`` shared by all
+      output functions on first use.  Passing it explicitly avoids global
+      state in the UI layer.
     - The MDM enrollment flag file (``_MDM_FLAG``) is touched on first
       detection so the advisory is shown exactly once per install.
 
@@ -32,29 +33,44 @@ Exit codes:
       finding was returned.
 
 Attributes:
-    console (rich.Console): Shared Rich console instance using
-        ``MACTUNER_THEME``.  All output goes through this instance.
     _MDM_FLAG (pathlib.Path): Sentinel file path whose existence indicates
         the MDM advisory has already been shown to this user.
+    _SCAN_WORKERS (int): Thread-pool width used by ``_run_checks`` in every
+        output mode.
 """
 
+from __future__ import annotations
+
 import shutil
 import time
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import click
-from rich.console import Console
 
 from macaudit import __version__
-from macaudit.checks.base import BaseCheck, CheckResult, calculate_health_score
-from macaudit.enums import CheckStatus
-from macaudit.ui.header import print_header
-from macaudit.ui.theme import COLOR_DIM, COLOR_TEXT, MACTUNER_THEME
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+    from macaudit.checks.base import BaseCheck, CheckResult
 
 
 # ── Console (shared across the tool) ─────────────────────────────────────────
 
-console = Console(theme=MACTUNER_THEME)
+@lru_cache(maxsize=1)
+def _get_console() -> Console:
+    """Return the shared Rich console, built with ``MACTUNER_THEME`` on first use.
+
+    All output goes through this one instance.  Construction is deferred so
+    the flag-only paths (``-V``, ``-h``) never import Rich or the theme.
+    """
+    from rich.console import Console
+
+    from macaudit.ui.theme import MACTUNER_THEME
+
+    return Console(theme=MACTUNER_THEME)
 
 
 # ── MDM flag ─────────────────────────────────────────────────────────────────
@@ -62,6 +78,13 @@ console = Console(theme=MACTUNER_THEME)
 _MDM_FLAG = Path.home() / ".config" / "macaudit" / ".mdm_warned"
 
 
+# ── Scan concurrency ──────────────────────────────────────────────────────────
+
+# Eight keeps concurrent child processes low enough that macOS does not
+# rate-limit the terminal.
+_SCAN_WORKERS = 8
+
+
 # ── CLI ───────────────────────────────────────────────────────────────────────
 
 @click.command(name="macaudit", context_settings={"help_option_names": ["-h", "--help"]})
@@ -163,6 +186,8 @@ def cli(
       NO_COLOR=1   Disable all colour output (ANSI-stripped plain text).
       TERM=dumb    Alternative way to suppress colour in some terminals.
     """
+    console = _get_console()
+
     # ── Shell completion ──────────────────────────────────────────────────────
     if show_completion:
         _print_completion_help(console)
@@ -197,6 +222,7 @@ def cli(
                 return
             _warn_if_mdm_enrolled(console)
         else:
+            from macaudit.ui.header import print_header
             print_header(console, mode=_resolve_mode(fix, only, skip), only_cats=only_cats)
             console.print()
             _warn_if_mdm_enrolled(console)
@@ -242,6 +268,10 @@ def cli(
 
     # ── Pre-scan prompt ───────────────────────────────────────────────────────
     if not quiet and not as_json and not yes and not _first_run:
+        # The header has already warmed get_system_info() and the MDM probe;
+        # the slow remaining startup cost is softwareupdate's network query,
+        # so start it now to run during the user's think time.
+        _prefetch_for(active_checks)
         n = len(active_checks)
         console.print(f"  [dim]Ready to run [bold text]{n}[/bold text] checks.[/dim]")
         console.print()
@@ -252,11 +282,16 @@ def cli(
         try:
             input()
         except (KeyboardInterrupt, EOFError):
+            from macaudit.checks.system import cancel_software_update_prefetch
+            cancel_software_update_prefetch()
             console.print("\n  [dim]Cancelled.[/dim]\n")
             return
         console.print()
 
     # ── Run checks (narrated) ─────────────────────────────────────────────────
+    from macaudit.checks.base import calculate_health_score
+    from macaudit.enums import CheckStatus
+
     _scan_start = time.monotonic()
     results = _run_checks(active_checks, quiet=quiet, as_json=as_json) + suppressed_results
     _scan_elapsed = time.monotonic() - _scan_start
@@ -345,7 +380,7 @@ def _print_completion_help(console: Console) -> None:
     import os
     from rich.panel import Panel
     from rich.text import Text
-    from macaudit.ui.theme import COLOR_BRAND
+    from macaudit.ui.theme import COLOR_BRAND, COLOR_DIM, COLOR_TEXT
 
     shell = os.environ.get("SHELL", "").split("/")[-1]
 
@@ -380,6 +415,7 @@ def _print_completion_help(console: Console) -> None:
 
 # ── MDM enrollment advisory ───────────────────────────────────────────────────
 
+@lru_cache(maxsize=1)
 def _is_mdm_enrolled() -> bool:
     """Detect whether this Mac is MDM-enrolled via the ``profiles`` command.
 
@@ -396,6 +432,9 @@ def _is_mdm_enrolled() -> bool:
     Note:
         The ``profiles`` binary requires no special permissions for the
         ``status`` subcommand.  It is available on all supported macOS versions.
+        The result is memoised: ``cli()`` needs it for the report badges and
+        ``_warn_if_mdm_enrolled()`` for the advisory, and enrollment does not
+        change mid-run, so ``profiles`` is spawned at most once per process.
     """
     import subprocess
     try:
@@ -423,6 +462,7 @@ def _warn_if_mdm_enrolled(console: Console) -> None:
 
     from rich.panel import Panel
     from rich.text import Text
+    from macaudit.ui.theme import COLOR_DIM
     note = Text()
     note.append("  This Mac appears to be MDM-enrolled.\n", style="bold yellow")
     note.append(
@@ -559,21 +599,41 @@ def _collect_checks(
 
 # ── Scan loop ─────────────────────────────────────────────────────────────────
 
+def _prefetch_for(checks: list) -> None:
+    """Start ``softwareupdate -l`` in the background if any check needs it.
+
+    It is a network call of up to 30 s; starting it early lets it overlap
+    the pre-scan prompt and the scan instead of starting when its first
+    check runs.  Safe to call more than once — a running prefetch is reused.
+
+    Args:
+        checks (list[BaseCheck]): The checks about to run.
+    """
+    from macaudit.checks.system import (
+        MacOSVersionCheck,
+        PendingUpdatesCheck,
+        prefetch_software_updates,
+    )
+
+    if any(isinstance(c, (MacOSVersionCheck, PendingUpdatesCheck)) for c in checks):
+        prefetch_software_updates()
+
+
 def _run_checks(checks: list, quiet: bool, as_json: bool) -> list[CheckResult]:
     """Execute checks, returning results in input order with optional live narration.
 
-    **Quiet / JSON mode**: checks run serially via a simple list comprehension
-    so there is no live UI overhead.
+    Both modes dispatch checks to a ``ThreadPoolExecutor`` with
+    ``_SCAN_WORKERS`` threads, so wall time approaches the slowest single
+    check rather than the sum of all of them; checks mostly wait on
+    subprocesses, which release the GIL.
 
-    **Narrated mode**: checks are submitted to a ``ThreadPoolExecutor`` with
-    8 workers.  Results are stored in a pre-allocated list indexed by their
-    original position so the output order is deterministic regardless of
-    completion order.  A contiguous-flush loop prints results above the live
-    progress area as soon as a leading run of consecutive indices completes.
+    **Quiet / JSON mode**: ``pool.map`` returns results in input order with
+    no live UI overhead.
 
-    The 8-worker limit was chosen to balance concurrency (most checks block on
-    ``subprocess`` calls) against not spawning so many processes that macOS
-    rate-limits the terminal.
+    **Narrated mode**: results are stored in a pre-allocated list indexed by
+    their original position so the output order is deterministic regardless
+    of completion order.  A contiguous-flush loop prints results above the live
+    progress area as soon as a leading run of consecutive indices completes.
 
     Args:
         checks (list[BaseCheck]): Ordered list of instantiated check objects.
@@ -587,31 +647,47 @@ def _run_checks(checks: list, quiet: bool, as_json: bool) -> list[CheckResult]:
     """
     import concurrent.futures
 
+    from macaudit.checks.base import BaseCheck
+    from macaudit.checks.system import cancel_software_update_prefetch
+    from macaudit.system_info import clear_scan_caches
     from macaudit.ui.narrator import ScanNarrator
 
-    if quiet or as_json:
-        return [check.execute() for check in checks]
+    # Every check in this scan shares one read of each cached source; none
+    # of it may carry over from an earlier scan in the same process.
+    clear_scan_caches()
 
-    results: list[CheckResult | None] = [None] * len(checks)
-    with ScanNarrator(console, total=len(checks)) as narrator:
-        narrator.print_scan_header()
-        next_to_print = 0
-
-        with concurrent.futures.ThreadPoolExecutor(max_workers=8) as pool:
-            future_to_idx = {
-                pool.submit(check.execute): i
-                for i, check in enumerate(checks)
-            }
-            for future in concurrent.futures.as_completed(future_to_idx):
-                idx = future_to_idx[future]
-                results[idx] = future.result()
-                narrator.increment()
-                # Flush contiguous completed results in input order
-                while next_to_print < len(results) and results[next_to_print] is not None:
-                    narrator.print_result(results[next_to_print])
-                    next_to_print += 1
-
-    return results
+    _prefetch_for(checks)
+    try:
+        if quiet or as_json:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=_SCAN_WORKERS) as pool:
+                return list(pool.map(BaseCheck.execute, checks))
+
+        total = len(checks)
+        results: list[CheckResult | None] = [None] * total
+        with ScanNarrator(_get_console(), total=total) as narrator:
+            narrator.print_scan_header()
+            next_to_print = 0
+
+            with concurrent.futures.ThreadPoolExecutor(max_workers=_SCAN_WORKERS) as pool:
+                future_to_idx = {
+                    pool.submit(check.execute): i
+                    for i, check in enumerate(checks)
+                }
+                for future in concurrent.futures.as_completed(future_to_idx):
+                    idx = future_to_idx[future]
+                    results[idx] = future.result()
+                    narrator.increment()
+                    # Flush contiguous completed results in input order
+                    while next_to_print < total and results[next_to_print] is not None:
+                        narrator.print_result(results[next_to_print])
+                        next_to_print += 1
+
+        return results
+    finally:
+        # A prefetched softwareupdate is normally collected by the update
+        # checks, but they may be gated out (min_macos, requires_tool) or the
+        # scan may fail; reap any leftover so no child outlives the scan.
+        cancel_software_update_prefetch()
 
 
 
@@ -638,12 +714,13 @@ def _output_json(results: list[CheckResult], diff: dict | None = None) -> None:
 
     Note:
         This function writes **only** to stdout.  All error output goes through
-        the shared ``console`` (stderr-routed).
+        the shared console (stderr-routed).
     """
     import dataclasses
     import json
     from datetime import datetime, timezone
 
+    from macaudit.checks.base import calculate_health_score
     from macaudit.system_info import get_system_info
 
     info = get_system_info()
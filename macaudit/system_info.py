@@ -6,10 +6,27 @@ across every check module.  It is imported at module load time by all
 checks, so correctness and performance are critical:
 
   - All expensive calls (``system_profiler``, ``sysctl``) are cached with
-    ``@lru_cache`` so they execute at most once per process lifetime.
-  - The module-level constants are populated eagerly at import time using
-    the cheap ``platform`` stdlib module; no subprocess is needed.
+    ``@lru_cache`` so they execute at most once per process lifetime.  The
+    hardware sysctl keys are read in-process through libc's
+    ``sysctlbyname`` where it is available, and otherwise together in one
+    ``sysctl`` process.
+  - The module-level constants are populated eagerly at import time from
+    one ``plistlib`` read of ``SystemVersion.plist``; no subprocess is
+    needed.
   - The ``_run()`` helper never raises — all errors return ``""``.
+  - ``get_launchd_jobs()`` snapshots ``launchctl list`` once so every
+    service-state probe across check modules is a dictionary lookup.
+  - ``get_remote_login()`` answers "is SSH on?" for every check that asks,
+    from launchd's override plist where possible, so the slow
+    ``systemsetup -getremotelogin`` runs at most once per scan.
+  - ``stat_path()`` memoizes ``os.stat`` per path, so existence probes that
+    several checks repeat (the firewall binary, the XProtect bundle) cost
+    one syscall per scan.
+  - Data that can change between scans (launchd state, preference files,
+    ``system_profiler`` output) is cached with ``@scan_cache`` instead.
+    Those caches are registered centrally and dropped together by
+    ``clear_scan_caches()`` at the start of every scan, so repeated scans in
+    one process never see a previous scan's state.
 
 Typical import pattern in check modules::
 
@@ -18,32 +35,74 @@ Typical import pattern in check modules::
 Attributes:
     MACOS_VERSION (tuple[int, int]): Two-element tuple of the running
         macOS major and minor version numbers, e.g. ``(15, 3)`` for
-        macOS Sequoia 15.3.  Populated at import time via
-        ``platform.mac_ver()``.
+        macOS Sequoia 15.3.  Populated at import time from
+        ``SystemVersion.plist``.
     IS_APPLE_SILICON (bool): ``True`` when the process is running
         natively on an Apple Silicon chip (arm64 architecture).
         ``False`` on Intel Macs or Rosetta 2 translation.
-    MACOS_VERSION_STRING (str): Full version string as reported by
-        ``platform.mac_ver()``, e.g. ``"15.3.1"``.
+    SSHD_LABEL (str): launchd label of the OpenSSH server daemon,
+        ``"com.openssh.sshd"``.
+    SCREEN_SHARING_LABEL, SMB_LABEL, AFP_LABEL (str): launchd labels of the
+        Screen Sharing, SMB, and AFP sharing daemons.
+    MACOS_VERSION_STRING (str): Full version string from the
+        ``ProductVersion`` key of ``SystemVersion.plist``, e.g. ``"15.3.1"``.
+        Falls back to ``platform.mac_ver()`` if the plist is unreadable.
+    _sysctlbyname (ctypes function | None): libc's ``sysctlbyname``, or
+        ``None`` off macOS or when libc cannot be loaded.
 
 Note:
     All public constants are computed at import time and are read-only.
     Modifying them at runtime has no effect on already-resolved checks.
 """
 
+import ctypes
+import os
 import platform
+import plistlib
 import subprocess
 import shutil
-from functools import lru_cache
-from typing import Any
+import sys
+import threading
+from functools import lru_cache, wraps
+from typing import Any, Callable, TypeVar
+
+_F = TypeVar("_F", bound=Callable[..., Any])
 
 
 # ── Module-level constants — imported by every check ─────────────────────────
-# These are resolved once at import time using the lightweight ``platform``
-# module to avoid spawning subprocesses on every check execution.
+# These are resolved once at import time from the version plist (the file
+# ``platform.mac_ver()`` itself reads), so no subprocess is ever spawned.
+
+_SYSTEM_VERSION_PLIST = "/System/Library/CoreServices/SystemVersion.plist"
+
+
+def _read_macos_version() -> str:
+    """Return the dotted macOS version, e.g. ``"15.3.1"``.
+
+    Parses ``SystemVersion.plist`` once with ``plistlib``; every version
+    constant below derives from this one read rather than each calling
+    ``platform.mac_ver()``, which re-reads the plist per call.  Falls back
+    to ``platform.mac_ver()`` if the plist is unreadable.
+    """
+    try:
+        with open(_SYSTEM_VERSION_PLIST, "rb") as f:
+            version = plistlib.load(f).get("ProductVersion")
+        if isinstance(version, str) and version:
+            return version
+    except Exception:
+        pass
+    return platform.mac_ver()[0]
+
+
+MACOS_VERSION_STRING: str = _read_macos_version()
+"""Full dotted macOS version string, e.g. ``"15.3.1"``.
+
+Used in human-readable messages.  Prefer ``MACOS_VERSION`` tuple for
+programmatic version comparisons.
+"""
 
 MACOS_VERSION: tuple[int, int] = tuple(
-    map(int, platform.mac_ver()[0].split(".")[:2])
+    map(int, MACOS_VERSION_STRING.split(".")[:2])
 )
 """Two-element tuple ``(major, minor)`` of the running macOS version.
 
@@ -59,13 +118,6 @@ Note: This is ``False`` when a native arm64 Python is running inside a
 Rosetta 2 x86_64 process, but that scenario is uncommon in practice.
 """
 
-MACOS_VERSION_STRING: str = platform.mac_ver()[0]
-"""Full dotted macOS version string, e.g. ``"15.3.1"``.
-
-Used in human-readable messages.  Prefer ``MACOS_VERSION`` tuple for
-programmatic version comparisons.
-"""
-
 
 def _run(cmd: list[str], timeout: int = 5) -> str:
     """Run a shell command and return its stdout as a stripped string.
@@ -90,14 +142,15 @@ def _run(cmd: list[str], timeout: int = 5) -> str:
         graceful fallbacks for an empty string return value.
     """
     try:
+        # Bytes are captured and decoded once, rather than through the
+        # text-mode wrapper ``text=True`` puts around each pipe.
         result = subprocess.run(
             cmd,
             capture_output=True,
-            text=True,
             timeout=timeout,
             check=False,
         )
-        return result.stdout.strip()
+        return result.stdout.decode("utf-8", "replace").strip()
     except Exception:
         # Any error (TimeoutExpired, FileNotFoundError, OSError) returns
         # an empty string.  The callers handle this gracefully.
@@ -149,10 +202,14 @@ def get_system_info() -> dict[str, Any]:
         >>> print(info["model_name"])
         MacBook Pro (M3 Max)
     """
+    # One sysctl process answers all three hardware keys.
+    sysctl = _sysctl_batch(_SYSCTL_KEYS)
+    hw_model = sysctl.get("hw.model", "")
+
     macos_name = _macos_name(MACOS_VERSION[0])
-    model_name = _model_name()
-    cpu_brand = _cpu_brand()
-    ram_gb = _ram_gb()
+    model_name = _model_name(hw_model)
+    cpu_brand = _cpu_brand(sysctl.get("machdep.cpu.brand_string", ""), hw_model)
+    ram_gb = _ram_gb(sysctl.get("hw.memsize", ""))
 
     return {
         "macos_version": MACOS_VERSION_STRING,
@@ -169,6 +226,213 @@ def get_system_info() -> dict[str, Any]:
     }
 
 
+# ── Scan-scoped caches ────────────────────────────────────────────────────────
+
+# Every function wrapped by ``scan_cache``, in registration order.
+_SCAN_CACHES: list[Any] = []
+
+# Distinguishes "not cached" from a cached ``None`` result.
+_MISSING = object()
+
+
+def scan_cache(maxsize: int = 1) -> Callable[[_F], _F]:
+    """Memoize a data fetcher for the duration of one scan.
+
+    Keeps up to *maxsize* results keyed by the call's arguments (the oldest
+    entry is evicted first) and records the wrapped function so
+    :func:`clear_scan_caches` can invalidate every scan-scoped cache at once.
+    Checks run concurrently on the scan's thread pool.  A hit is a plain
+    dictionary read that takes no lock; only a miss takes a lock, one per
+    argument key.  The first caller fetches while later callers for the same
+    key wait for its result, so e.g. ``softwareupdate -l`` runs exactly once,
+    and a slow fetch never blocks calls for other keys.  Use it for reads
+    several checks share within a scan (``launchctl list``, preference
+    plists); keep plain ``lru_cache`` for facts that cannot change while the
+    process runs, such as the hardware model.
+
+    Args:
+        maxsize (int): Number of distinct argument combinations to keep.
+
+    Returns:
+        Callable: A decorator returning the memoized function, which gains a
+        ``cache_clear()`` method.
+
+    Example::
+
+        @scan_cache()
+        def _read_config() -> str:
+            ...
+    """
+    def decorate(fn: _F) -> _F:
+        cache: dict[Any, Any] = {}
+        key_locks: dict[Any, threading.Lock] = {}
+        # Guards mutation of both dicts; never held while a fetcher runs.
+        guard = threading.Lock()
+
+        @wraps(fn)
+        def cached(*args: Any, **kwargs: Any) -> Any:
+            key = (args, frozenset(kwargs.items())) if kwargs else args
+            value = cache.get(key, _MISSING)
+            if value is not _MISSING:
+                return value
+
+            with guard:
+                lock = key_locks.setdefault(key, threading.Lock())
+            with lock:
+                # Another caller may have filled the entry while we waited.
+                value = cache.get(key, _MISSING)
+                if value is not _MISSING:
+                    return value
+                try:
+                    value = fn(*args, **kwargs)
+                    with guard:
+                        cache[key] = value
+                        while len(cache) > maxsize:
+                            del cache[next(iter(cache))]
+                finally:
+                    with guard:
+                        key_locks.pop(key, None)
+                return value
+
+        def cache_clear() -> None:
+            with guard:
+                cache.clear()
+
+        cached.cache_clear = cache_clear  # type: ignore[attr-defined]
+        _SCAN_CACHES.append(cached)
+        return cached  # type: ignore[return-value]
+    return decorate
+
+
+def clear_scan_caches() -> None:
+    """Drop every cache registered with :func:`scan_cache`.
+
+    Called once at the start of each scan so all checks in that scan share
+    one read of each source, and no scan reuses a previous scan's data.
+    """
+    for fn in _SCAN_CACHES:
+        fn.cache_clear()
+
+
+@scan_cache()
+def get_launchd_jobs() -> dict[str, tuple[str, str]]:
+    """Run ``launchctl list`` once and index the loaded jobs by label.
+
+    ``launchctl list`` prints one tab-separated row per loaded job::
+
+        PID     Status  Label
+        412     0       com.apple.screensharing
+        -       0       com.apple.smbd
+
+    A label being present is equivalent to ``launchctl list <label>``
+    exiting 0, so every sharing-service probe in the network and security
+    modules is answered from this one snapshot instead of spawning a
+    process per service.
+
+    Returns:
+        dict[str, tuple[str, str]]: Mapping of job label to its
+        ``(pid, last_exit_status)`` columns as printed by launchctl.
+        Returns an empty dict if ``launchctl`` fails or is unavailable.
+
+    Example::
+
+        >>> "com.apple.smbd" in get_launchd_jobs()
+        False
+    """
+    out = _run(["launchctl", "list"], timeout=10)
+    jobs: dict[str, tuple[str, str]] = {}
+    for line in out.splitlines():
+        parts = line.split("\t")
+        if len(parts) == 3 and parts[2] != "Label":
+            jobs[parts[2]] = (parts[0], parts[1])
+    return jobs
+
+
+# launchd's persistent enable/disable overrides for system daemons.  Toggling
+# Remote Login writes the com.openssh.sshd entry here (True = disabled).
+_LAUNCHD_OVERRIDES = "/var/db/com.apple.xpc.launchd/disabled.plist"
+
+# launchd labels of the sharing daemons, defined once for every module that
+# looks the jobs up.
+SSHD_LABEL: str = "com.openssh.sshd"
+"""launchd label of the OpenSSH server (Remote Login) system daemon."""
+
+SCREEN_SHARING_LABEL: str = "com.apple.screensharing"
+"""launchd label of the Screen Sharing (VNC) daemon."""
+
+SMB_LABEL: str = "com.apple.smbd"
+"""launchd label of the SMB file sharing daemon."""
+
+AFP_LABEL: str = "com.apple.AppleFileServer"
+"""launchd label of the legacy AFP file sharing daemon."""
+
+
+@scan_cache()
+def get_remote_login() -> bool | None:
+    """Report whether Remote Login (the OpenSSH server) is enabled.
+
+    Reads launchd's override plist first: no subprocess, and no admin
+    rights needed.  An absent ``com.openssh.sshd`` entry means the daemon
+    still has its shipped ``Disabled`` default, i.e. off.  Only if the plist
+    cannot be read is ``systemsetup -getremotelogin`` run — it takes
+    seconds to start and requires administrator access.
+
+    Returns:
+        bool | None: ``True`` if Remote Login is on, ``False`` if off, or
+        ``None`` if neither source gave an answer.
+
+    Example::
+
+        >>> get_remote_login()
+        False
+    """
+    try:
+        with open(_LAUNCHD_OVERRIDES, "rb") as f:
+            overrides = plistlib.load(f)
+    except Exception:
+        overrides = None
+    if isinstance(overrides, dict):
+        return overrides.get(SSHD_LABEL, True) is False
+
+    # "Remote Login: On" / "Remote Login: Off"; anything else (e.g. the
+    # "You need administrator access" refusal) is not an answer.
+    label, _, state = _run(["systemsetup", "-getremotelogin"]).partition(":")
+    if label.strip().lower() != "remote login":
+        return None
+    return state.strip().lower() == "on"
+
+
+@scan_cache(maxsize=64)
+def stat_path(path: str | os.PathLike[str]) -> os.stat_result | None:
+    """``os.stat`` a path once per scan.
+
+    Checks that probe the same system file (``exists()`` before running it,
+    or its mtime for a freshness test) share one syscall.  Pass the same
+    object type for a given path — ``"/x"`` and ``Path("/x")`` are separate
+    cache keys.  Probing individual paths beats listing their parent once:
+    ``/usr/libexec`` holds hundreds of entries, while the checks look up
+    only a handful of files (``socketfilterfw``, the Rosetta runtime), and
+    nested paths would need further listings.
+
+    Args:
+        path (str | os.PathLike[str]): The path to stat; symlinks are
+            followed.
+
+    Returns:
+        os.stat_result | None: The stat result, or ``None`` when the path
+        does not exist or cannot be reached, mirroring ``os.path.exists``.
+
+    Example::
+
+        >>> stat_path("/usr/libexec/ApplicationFirewall/socketfilterfw") is not None
+        True
+    """
+    try:
+        return os.stat(path)
+    except (OSError, ValueError):
+        return None
+
+
 # ── Internal helpers ───────────────────────────────────────────────────────────
 
 # Mapping of macOS major version integers to Apple marketing names.
@@ -180,6 +444,100 @@ _MACOS_NAMES: dict[int, str] = {
     16: "Tahoe",
 }
 
+# _MACOS_NAMES plus the bare number for the majors after the newest named
+# one, so every plausible version resolves with a single lookup.
+_MACOS_NAME_TABLE: dict[int, str] = {
+    **{major: str(major) for major in range(max(_MACOS_NAMES) + 1, 31)},
+    **_MACOS_NAMES,
+}
+
+
+# Every sysctl key get_system_info() reads, fetched in a single invocation.
+_SYSCTL_KEYS: tuple[str, ...] = ("hw.model", "machdep.cpu.brand_string", "hw.memsize")
+
+# Keys whose kernel value is a native-endian integer rather than a C string.
+_SYSCTL_INT_KEYS: frozenset[str] = frozenset({"hw.memsize"})
+
+
+# ── Optional libc sysctl ──────────────────────────────────────────────────────
+# Darwin's libc exports sysctlbyname(3), the call the sysctl tool itself
+# makes.  Elsewhere (or if libc cannot be loaded) the tool is spawned instead.
+
+_sysctlbyname: Any = None
+if sys.platform == "darwin":
+    try:
+        _sysctlbyname = ctypes.CDLL("/usr/lib/libc.dylib").sysctlbyname
+        _sysctlbyname.argtypes = (
+            ctypes.c_char_p, ctypes.c_void_p, ctypes.POINTER(ctypes.c_size_t),
+            ctypes.c_void_p, ctypes.c_size_t,
+        )
+        _sysctlbyname.restype = ctypes.c_int
+    except (OSError, AttributeError):
+        _sysctlbyname = None
+
+
+def _read_sysctl(name: str) -> bytes | None:
+    """Read one sysctl value in-process via ``sysctlbyname``.
+
+    The first call asks the kernel for the value's size, the second copies
+    it into a buffer of that size.
+
+    Args:
+        name (str): The sysctl name, e.g. ``"hw.model"``.
+
+    Returns:
+        bytes | None: The raw value, or ``None`` if the kernel does not
+        know the key or either call fails.
+    """
+    key = name.encode()
+    size = ctypes.c_size_t(0)
+    if _sysctlbyname(key, None, ctypes.byref(size), None, 0) != 0:
+        return None
+    buf = ctypes.create_string_buffer(size.value)
+    if _sysctlbyname(key, buf, ctypes.byref(size), None, 0) != 0:
+        return None
+    return buf.raw[:size.value]
+
+
+def _sysctl_text(name: str, raw: bytes) -> str:
+    """Render a raw sysctl value the way the ``sysctl`` tool prints it."""
+    if name in _SYSCTL_INT_KEYS:
+        return str(int.from_bytes(raw, sys.byteorder))
+    return raw.rstrip(b"\0").decode("utf-8", "replace").strip()
+
+
+def _sysctl_batch(keys: tuple[str, ...]) -> dict[str, str]:
+    """Read several sysctl keys without a process per key.
+
+    With libc's ``sysctlbyname`` available every key is read in-process.
+    Otherwise one ``sysctl`` process answers them all; ``-n`` is
+    deliberately not used there, because it prints bare values, so a key
+    the kernel does not know (reported on stderr) would shift every later
+    value onto the wrong key.  Each ``name: value`` line is matched by name
+    instead.  Either way, unknown keys are simply absent from the result.
+
+    Args:
+        keys (tuple[str, ...]): The sysctl names to read, e.g.
+            ``("hw.model", "hw.memsize")``.
+
+    Returns:
+        dict[str, str]: Mapping of each key that was read to its stripped
+        value.  Empty if ``sysctl`` fails entirely.
+    """
+    values: dict[str, str] = {}
+    if _sysctlbyname is not None:
+        for key in keys:
+            raw = _read_sysctl(key)
+            if raw is not None:
+                values[key] = _sysctl_text(key, raw)
+        return values
+
+    for line in _run(["sysctl", *keys]).splitlines():
+        name, sep, value = line.partition(": ")
+        if sep and name in keys:
+            values[name] = value.strip()
+    return values
+
 
 def _macos_name(major: int) -> str:
     """Map a macOS major version integer to its Apple marketing name.
@@ -197,43 +555,52 @@ def _macos_name(major: int) -> str:
         returns the version number itself (e.g. ``"16"``), since the
         header already prepends ``"macOS"`` in the UI.
     """
-    # Check the known-names table first for an O(1) lookup.
-    name = _MACOS_NAMES.get(major)
+    # Named versions and the next few unnamed ones are one table lookup.
+    name = _MACOS_NAME_TABLE.get(major)
     if name:
         return name
 
-    # For future major versions not yet in the table, use the number itself
-    # as a graceful fallback rather than "Unknown".
-    if major >= 16:
-        return str(major)
-
-    # Anything older than Ventura (13) is truly unknown/historical.
-    return "Unknown"
+    # Beyond the table: later majors keep their number, anything older
+    # than Ventura (13) is truly unknown/historical.
+    return str(major) if major >= 16 else "Unknown"
 
 
-def _model_name() -> str:
+def _model_name(model: str) -> str:
     """Return a human-readable Mac model identifier.
 
-    Attempts two strategies in order of speed:
+    Attempts three strategies in order of speed:
       1. ``sysctl hw.model`` — fast (< 1 ms), returns machine-readable
-         identifiers like ``"MacBookPro18,3"``.
-      2. ``system_profiler SPHardwareDataType`` — slow (~500 ms), but
-         returns the marketing name like ``"MacBook Pro"``.
+         identifiers like ``"MacBookPro18,3"``.  Read by the caller as
+         part of the batched sysctl and passed in as *model*.
+      2. ``ioreg`` ``product-name`` — fast (~20 ms), the marketing name
+         like ``"MacBook Pro (14-inch, 2021)"``.  Apple Silicon only.
+      3. ``system_profiler SPHardwareDataType`` — slow (~500 ms to
+         seconds), but returns the marketing name like ``"MacBook Pro"``
+         on every Mac.
+
+    Args:
+        model (str): The ``hw.model`` machine identifier (e.g.
+            ``"MacBookPro18,3"``), or ``""`` if sysctl could not read it.
 
     Returns:
-        str: The marketing model name if ``system_profiler`` is available,
+        str: The marketing model name from ``ioreg`` or ``system_profiler``,
         the raw sysctl identifier string as a fallback, or ``"Mac"`` if
-        both fail.
+        sysctl fails.
 
     Note:
         The result is not cached here because ``get_system_info()`` is
         decorated with ``@lru_cache`` and calls this exactly once.
     """
     # sysctl is always available and fast; used as a fallback identifier.
-    brand = _run(["sysctl", "-n", "hw.model"])  # e.g. "MacBookPro18,3"
-    if not brand:
+    if not model:  # e.g. "MacBookPro18,3"
         return "Mac"
 
+    # The platform device's product-name answers in-kernel, without the
+    # multi-second system_profiler start-up.
+    product = _ioreg_product_name()
+    if product:
+        return product
+
     # system_profiler provides the friendly marketing name but is slower.
     # Parse only the "Model Name" line to avoid iterating the full output.
     sp = _run(
@@ -247,10 +614,38 @@ def _model_name() -> str:
 
     # system_profiler unavailable or "Model Name" line absent — fall back
     # to the raw sysctl identifier (e.g. "MacBookPro18,3").
-    return brand
+    return model
 
 
-def _cpu_brand() -> str:
+def _ioreg_product_name() -> str:
+    """Return the platform device's ``product-name`` from the I/O Registry.
+
+    ``ioreg -a`` prints the matching registry entries as a plist array;
+    ``product-name`` is NUL-terminated data, e.g.
+    ``b"MacBook Pro (14-inch, 2021)\\x00"``.  Intel Macs do not publish
+    the property.
+
+    Returns:
+        str: The decoded product name, or ``""`` when it is unavailable.
+    """
+    out = _run(
+        ["ioreg", "-a", "-r", "-c", "IOPlatformExpertDevice",
+         "-k", "product-name", "-d", "1"],
+    )
+    try:
+        devices = plistlib.loads(out.encode())
+    except Exception:
+        return ""
+    if not isinstance(devices, list):
+        return ""
+    for device in devices:
+        name = device.get("product-name") if isinstance(device, dict) else None
+        if isinstance(name, bytes):
+            return name.rstrip(b"\0").decode("utf-8", "replace").strip()
+    return ""
+
+
+def _cpu_brand(brand: str, chip: str) -> str:
     """Return a human-readable CPU description string.
 
     Intel Macs expose the brand string via sysctl ``machdep.cpu.brand_string``
@@ -258,32 +653,36 @@ def _cpu_brand() -> str:
     do not populate this key, so a composite fallback is built from
     ``hw.model`` instead.
 
+    Args:
+        brand (str): The ``machdep.cpu.brand_string`` value, or ``""``.
+        chip (str): The ``hw.model`` identifier, or ``""``.
+
     Returns:
         str: CPU description, e.g. ``"Apple M3 Max"``,
         ``"Intel Core i9"``, or ``"Apple Silicon (MacBookPro18,3)"``
         as a last-resort fallback.
     """
-    brand = _run(["sysctl", "-n", "machdep.cpu.brand_string"])
     if brand:
         return brand
 
     # Apple Silicon: machdep.cpu.brand_string is not available.
     # Build a reasonable description from the model identifier.
-    chip = _run(["sysctl", "-n", "hw.model"])
     return f"Apple Silicon ({chip})" if chip else "Unknown CPU"
 
 
-def _ram_gb() -> int:
+def _ram_gb(mem_bytes_str: str) -> int:
     """Return total physical RAM in whole gigabytes.
 
-    Reads ``hw.memsize`` via sysctl, which returns the raw byte count as
+    Converts ``hw.memsize`` from sysctl, which is the raw byte count as
     a decimal string (e.g. ``"34359738368"`` for 32 GiB).
 
+    Args:
+        mem_bytes_str (str): The ``hw.memsize`` value, or ``""``.
+
     Returns:
         int: RAM size rounded down to the nearest gigabyte, e.g. ``32``.
         Returns ``0`` if sysctl output cannot be parsed as an integer.
     """
-    mem_bytes_str = _run(["sysctl", "-n", "hw.memsize"])
     try:
         # Integer-divide by 1 GiB (1024^3 bytes) for the whole-GB value.
         return int(mem_bytes_str) // (1024 ** 3)
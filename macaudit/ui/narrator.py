@@ -69,6 +69,8 @@ class ScanNarrator:
             category-header lines between groups.
         _live (rich.live.Live): The underlying Live rendering context.
             Configured to refresh at 12 fps for smooth spinner animation.
+        _spinner_row (Padding): The indented "Running checks…" spinner,
+            built once and shared by every progress frame.
     """
 
     def __init__(self, console: Console, total: int) -> None:
@@ -83,6 +85,13 @@ class ScanNarrator:
         self.completed = 0
         self._last_category: str | None = None
 
+        # The spinner never changes between frames, and keeping one instance
+        # keeps its animation clock running across increments.
+        self._spinner_row = Padding(
+            Spinner("dots", text=Text("  Running checks…", style=COLOR_DIM), style="cyan"),
+            pad=(0, 0, 0, 4),
+        )
+
         self._live = Live(
             console=console,
             refresh_per_second=12,
@@ -171,19 +180,7 @@ class ScanNarrator:
 
           [████████░░░░░░░░░░░░░░] 34%  ·  8 of 23 checks
         """
-        spinner = Spinner(
-            "dots",
-            text=Text("  Running checks…", style=COLOR_DIM),
-            style="cyan",
-        )
-        spinner_indented = Padding(spinner, pad=(0, 0, 0, 4))
-
-        progress = Padding(
-            render_progress(self.completed, self.total),
-            pad=(1, 0, 0, 0),
-        )
-
-        return Group(spinner_indented, progress)
+        return Group(self._spinner_row, _idle_bar(self.completed, self.total))
 
 
 # ── Module-level helpers ──────────────────────────────────────────────────────
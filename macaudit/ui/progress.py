@@ -14,6 +14,12 @@ from macaudit.ui.theme import COLOR_DIM, PROGRESS_BAR_COLOR, PROGRESS_COMPLETE_C
 
 BAR_WIDTH = 22
 
+# Every (filled, empty) segment pair the bar can show, indexed by the filled
+# cell count, so drawing a frame builds no new bar strings.
+_BARS: tuple[tuple[str, str], ...] = tuple(
+    ("█" * filled, "░" * (BAR_WIDTH - filled)) for filled in range(BAR_WIDTH + 1)
+)
+
 
 def render_progress(completed: int, total: int) -> Text:
     """
@@ -30,8 +36,7 @@ def render_progress(completed: int, total: int) -> Text:
         return Text("  No checks to run", style=COLOR_DIM)
 
     pct = completed / total
-    filled = round(BAR_WIDTH * pct)
-    empty = BAR_WIDTH - filled
+    filled_str, empty_str = _BARS[min(round(BAR_WIDTH * pct), BAR_WIDTH)]
 
     done = completed == total
     bar_color = PROGRESS_COMPLETE_COLOR if done else PROGRESS_BAR_COLOR
@@ -39,8 +44,8 @@ def render_progress(completed: int, total: int) -> Text:
 
     t = Text()
     t.append("  [", style=COLOR_DIM)
-    t.append("█" * filled, style=bar_color)
-    t.append("░" * empty, style=COLOR_DIM)
+    t.append(filled_str, style=bar_color)
+    t.append(empty_str, style=COLOR_DIM)
     t.append("]  ", style=COLOR_DIM)
     t.append(f"{int(pct * 100)}%", style=pct_color)
     t.append(f"  ·  {completed} of {total} checks", style=COLOR_DIM)
@@ -13,14 +13,14 @@ Design:
     boilerplate at the call site.
 
 Note:
-    Add new ``cache_clear()`` calls here whenever a new ``@lru_cache``
-    is introduced to a macaudit module.  The fixture teardown runs
+    Caches declared with ``@scan_cache`` are cleared in one call through
+    ``system_info.clear_scan_caches()``.  Add an explicit ``cache_clear()``
+    here only for a plain ``@lru_cache``.  The fixture teardown runs
     *after* each test (post-``yield``), ensuring a clean slate for the
     next test regardless of whether the current test passed or failed.
 """
 import pytest
 
-from macaudit.checks import hardware, system
 from macaudit import system_info
 
 
@@ -37,6 +37,5 @@ def clear_lru_caches():
     test body raises an exception, keeping the test order independent.
     """
     yield
-    hardware._get_power_data.cache_clear()
-    system._fetch_software_updates.cache_clear()
+    system_info.clear_scan_caches()
     system_info.get_system_info.cache_clear()
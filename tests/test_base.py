@@ -9,15 +9,17 @@ Covers:
       is checked before tool).
     - ``BaseCheck._result()`` / ``execute()`` propagates the subclass
       ``profile_tags`` tuple into the returned ``CheckResult``.
+    - Every shipped check declares ``fix_steps`` as a tuple (or ``None``).
     - ``BaseCheck.shell()`` error handling: successful command, missing binary
       (``FileNotFoundError``), timeout, and non-zero exit with stderr.
+    - ``BaseCheck.shell_grep()``: line filtering, and the same error mapping.
 
 Design:
     Three minimal ``BaseCheck`` subclasses are defined at module level:
     ``_AlwaysPass``, ``_AlwaysCrash``, and ``_DevOnlyCheck``.  They are
     intentionally simple so tests stay fast and their behaviour is trivially
     verifiable without reading the implementation.  Real macOS commands
-    (``echo``, ``ls``, ``sleep``) are used only in the ``shell()`` tests where
+    (``echo``, ``printf``, ``ls``, ``sleep``) are used only in the shell tests where
     subprocess behaviour is the property under test.
 
 Note:
@@ -25,6 +27,7 @@ Note:
     so they pass on both Intel and Apple Silicon CI runners.
 """
 
+import re
 from unittest.mock import patch
 
 import pytest
@@ -283,6 +286,22 @@ class TestResultProfileTagsPropagation:
         assert "creative" in BaseCheck.profile_tags
         assert "standard" in BaseCheck.profile_tags
 
+    def test_every_check_declares_fix_steps_as_tuple(self):
+        """Class-level ``fix_steps`` are tuples so results can share them.
+
+        ``_result()`` hands the class attribute to every ``CheckResult`` by
+        reference; a list would let one consumer mutate every later result.
+        """
+        import importlib
+
+        for name in (
+            "apps", "dev_env", "disk", "hardware", "homebrew", "malware",
+            "memory", "network", "privacy", "secrets", "security", "system",
+        ):
+            module = importlib.import_module(f"macaudit.checks.{name}")
+            for cls in module.ALL_CHECKS:
+                assert cls.fix_steps is None or isinstance(cls.fix_steps, tuple), cls.__name__
+
 
 # ── BaseCheck.shell() ─────────────────────────────────────────────────────────
 
@@ -335,3 +354,58 @@ class TestShellHelper:
         check = _AlwaysPass()
         rc, out, err = check.shell(["ls", "/path/that/does/not/exist/xyzzy"])
         assert rc != 0
+
+
+# ── BaseCheck.shell_grep() ────────────────────────────────────────────────────
+
+class TestShellGrepHelper:
+    """Tests for ``BaseCheck.shell_grep()`` — the streaming line-filter variant.
+
+    ``shell_grep()`` reads stdout line by line and keeps only pattern matches.
+    Error handling mirrors ``shell()``: missing binaries and timeouts map to
+    ``rc = -1`` rather than raising.
+    """
+
+    def test_only_matching_lines_returned(self):
+        """Non-matching lines are dropped; match groups are available to callers."""
+        check = _AlwaysPass()
+        rc, matches = check.shell_grep(
+            ["printf", "skip\\nns: 1.1.1.1\\nskip\\nns: 8.8.8.8\\n"],
+            re.compile(r"ns: (\S+)"),
+        )
+        assert rc == 0
+        assert [m.group(1) for m in matches] == ["1.1.1.1", "8.8.8.8"]
+
+    def test_prefix_prefilters_lines(self):
+        """Lines not starting with ``prefix`` are skipped even if the regex would match."""
+        check = _AlwaysPass()
+        rc, matches = check.shell_grep(
+            ["printf", "  ns: 1.1.1.1\nns: 8.8.8.8\n"],
+            re.compile(r"ns: (\S+)"),
+            prefix="  ns:",
+        )
+        assert rc == 0
+        assert [m.group(1) for m in matches] == ["1.1.1.1"]
+
+    def test_missing_binary_returns_negative_one(self):
+        """A binary not on ``$PATH`` → ``rc = -1`` and no matches."""
+        check = _AlwaysPass()
+        rc, matches = check.shell_grep(
+            ["this_command_definitely_does_not_exist_9999"], re.compile("x"),
+        )
+        assert rc == -1
+        assert matches == []
+
+    def test_timeout_kills_process(self):
+        """A command that exceeds ``timeout`` is killed and reports ``rc = -1``."""
+        check = _AlwaysPass()
+        rc, _ = check.shell_grep(["sleep", "10"], re.compile("x"), timeout=1)
+        assert rc == -1
+
+    def test_nonzero_exit_propagated(self):
+        """A regular non-zero exit code is returned unmodified."""
+        check = _AlwaysPass()
+        rc, _ = check.shell_grep(
+            ["ls", "/path/that/does/not/exist/xyzzy"], re.compile("x"),
+        )
+        assert rc > 0
@@ -0,0 +1,191 @@
+"""
+Tests for checks/network.py.
+
+Covers:
+    - ``ScreenSharingCheck`` / ``FileSharingCheck``: service detection as
+      lookups against the shared ``get_launchd_jobs()`` snapshot.
+    - ``RemoteLoginCheck``: the shared ``get_remote_login()`` state, with an
+      unknown state reported as info.
+    - ``DNSCheck``: nameserver extraction from streamed ``scutil --dns``
+      lines and the suspicious-public-IPv4 classification.
+    - ``SavedWifiCheck``: the in-process ``CoreWLAN`` path and its fallback
+      to ``networksetup`` when pyobjc is absent or the bridge call fails.
+
+Design:
+    The optional ``CoreWLAN`` bridge is replaced with a ``MagicMock`` via
+    ``patch`` on the module attribute, so these tests run on any platform
+    without pyobjc installed.  ``BaseCheck.shell`` is patched for the
+    fallback path so no subprocess is spawned.
+"""
+
+from unittest.mock import MagicMock, patch
+
+from macaudit.checks import network
+from macaudit.checks.network import (
+    DNSCheck,
+    FileSharingCheck,
+    RemoteLoginCheck,
+    SavedWifiCheck,
+    ScreenSharingCheck,
+)
+
+
+def _fake_corewlan(profile_count: int) -> MagicMock:
+    """Build a stand-in ``CoreWLAN`` module exposing *profile_count* profiles."""
+    fake = MagicMock()
+    config = fake.CWWiFiClient.sharedWiFiClient.return_value.interface.return_value.configuration.return_value
+    config.networkProfiles.return_value = [object()] * profile_count
+    return fake
+
+
+# ── Sharing services ──────────────────────────────────────────────────────────
+
+class TestSharingServices:
+    """Screen and File Sharing are answered from the launchd snapshot."""
+
+    def test_screen_sharing_enabled(self):
+        """Loaded ``com.apple.screensharing`` label → warning."""
+        with patch.object(network, "get_launchd_jobs", return_value={"com.apple.screensharing": ("1", "0")}):
+            assert ScreenSharingCheck().run().status == "warning"
+
+    def test_screen_sharing_off(self):
+        """Label absent → pass."""
+        with patch.object(network, "get_launchd_jobs", return_value={}):
+            assert ScreenSharingCheck().run().status == "pass"
+
+    def test_file_sharing_smb(self):
+        """Loaded ``com.apple.smbd`` → warning naming SMB."""
+        with patch.object(network, "get_launchd_jobs", return_value={"com.apple.smbd": ("-", "0")}):
+            result = FileSharingCheck().run()
+        assert result.status == "warning"
+        assert "SMB" in result.message
+
+    def test_file_sharing_afp(self):
+        """Only the legacy AFP daemon loaded → warning naming AFP."""
+        with patch.object(network, "get_launchd_jobs", return_value={"com.apple.AppleFileServer": ("-", "0")}):
+            result = FileSharingCheck().run()
+        assert "AFP" in result.message
+
+    def test_file_sharing_off(self):
+        """Neither daemon loaded → pass."""
+        with patch.object(network, "get_launchd_jobs", return_value={}):
+            assert FileSharingCheck().run().status == "pass"
+
+
+class TestRemoteLoginCheck:
+    """Remote Login comes from the shared ``get_remote_login()`` state."""
+
+    def test_remote_login_on(self):
+        """Shared SSH state on → warning."""
+        with patch.object(network, "get_remote_login", return_value=True):
+            assert RemoteLoginCheck().run().status == "warning"
+
+    def test_remote_login_off(self):
+        """Shared SSH state off → pass, without consulting launchd."""
+        with patch.object(network, "get_remote_login", return_value=False), \
+             patch.object(network, "get_launchd_jobs") as jobs:
+            assert RemoteLoginCheck().run().status == "pass"
+        jobs.assert_not_called()
+
+    def test_remote_login_unknown_is_info(self):
+        """Unknown SSH state → info, never a green "Off"."""
+        with patch.object(network, "get_remote_login", return_value=None), \
+             patch.object(network, "get_launchd_jobs") as jobs:
+            result = RemoteLoginCheck().run()
+        assert result.status == "info"
+        assert "Could not determine" in result.message
+        jobs.assert_not_called()
+
+
+# ── DNSCheck ─────────────────────────────────────────────────────────────────
+
+class TestDNSCheck:
+    """Tests for ``DNSCheck`` against canned ``scutil --dns`` output."""
+
+    def _run_with_output(self, text: str):
+        """Feed *text* through the real ``_NS_RE`` filter and run the check."""
+        matches = [m for m in map(network._NS_RE.search, text.splitlines()) if m]
+        check = DNSCheck()
+        with patch.object(check, "shell_grep", return_value=(0, matches)):
+            return check.run()
+
+    def test_known_good_and_private_servers_are_info(self):
+        """Private-range and well-known resolvers → info, de-duplicated."""
+        result = self._run_with_output(
+            "resolver #1\n  nameserver[0] : 192.168.1.1\n  nameserver[1] : 1.1.1.1\n"
+            "resolver #2\n  nameserver[0] : 192.168.1.1\n  flags : Request A records\n"
+        )
+        assert result.status == "info"
+        assert result.data["dns_servers"] == ["192.168.1.1", "1.1.1.1"]
+
+    def test_unknown_public_ipv4_warns(self):
+        """An unrecognised public IPv4 resolver → warning listing it."""
+        result = self._run_with_output("  nameserver[0] : 45.90.28.0\n")
+        assert result.status == "warning"
+        assert result.data["suspicious"] == ["45.90.28.0"]
+
+    def test_scutil_failure_returns_info(self):
+        """Non-zero exit from ``scutil`` → informational result."""
+        check = DNSCheck()
+        with patch.object(check, "shell_grep", return_value=(-1, [])):
+            result = check.run()
+        assert "Could not read" in result.message
+
+
+# ── SavedWifiCheck ────────────────────────────────────────────────────────────
+
+class TestSavedWifiCheck:
+    """Tests for ``SavedWifiCheck`` network enumeration."""
+
+    def test_corewlan_count_used_without_subprocess(self):
+        """With CoreWLAN available, no ``networksetup`` call is made."""
+        check = SavedWifiCheck()
+        with patch.object(network, "_CoreWLAN", _fake_corewlan(3)), \
+             patch.object(check, "shell") as mock_shell:
+            result = check.run()
+        mock_shell.assert_not_called()
+        assert result.status == "info"
+        assert result.data == {"count": 3}
+
+    def test_corewlan_high_count_warns(self):
+        """More than 30 profiles → warning, same thresholds as the shell path."""
+        check = SavedWifiCheck()
+        with patch.object(network, "_CoreWLAN", _fake_corewlan(31)):
+            result = check.run()
+        assert result.status == "warning"
+
+    def test_no_wifi_interface_falls_back_to_networksetup(self):
+        """``interface()`` returning ``None`` (no Wi-Fi hardware) → shell fallback."""
+        fake = MagicMock()
+        fake.CWWiFiClient.sharedWiFiClient.return_value.interface.return_value = None
+        check = SavedWifiCheck()
+        shell_out = [
+            (0, "Hardware Port: Wi-Fi\nDevice: en0\n", ""),
+            (0, "Preferred networks on en0:\n\tHome\n\tOffice\n", ""),
+        ]
+        with patch.object(network, "_CoreWLAN", fake), \
+             patch.object(check, "shell", side_effect=shell_out):
+            result = check.run()
+        assert result.data == {"count": 2}
+
+    def test_missing_pyobjc_uses_networksetup(self):
+        """``_CoreWLAN is None`` → count comes from ``networksetup``."""
+        check = SavedWifiCheck()
+        shell_out = [
+            (0, "Hardware Port: Wi-Fi\nDevice: en1\n", ""),
+            (0, "Preferred networks on en1:\n\tHome\n", ""),
+        ]
+        with patch.object(network, "_CoreWLAN", None), \
+             patch.object(check, "shell", side_effect=shell_out) as mock_shell:
+            result = check.run()
+        assert mock_shell.call_args_list[1].args[0][-1] == "en1"
+        assert result.data == {"count": 1}
+
+    def test_networksetup_failure_returns_info(self):
+        """Every candidate interface failing → informational result."""
+        check = SavedWifiCheck()
+        with patch.object(network, "_CoreWLAN", None), \
+             patch.object(check, "shell", return_value=(1, "", "")):
+            result = check.run()
+        assert result.status == "info"
+        assert "Could not list" in result.message
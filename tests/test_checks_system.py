@@ -2,16 +2,34 @@
 Tests for checks/system.py.
 
 Covers:
-    - ``_parse_update_lines()``: the pure-function parser that extracts
-      pending update names from raw ``softwareupdate -l`` output.  All
-      relevant output patterns (``*`` prefix, ``-`` prefix, bare separator,
-      no-update banner) are exercised without spawning a subprocess.
+    - ``_parse_updates()``: the pure-function parser that extracts
+      pending update names and the security flag from raw
+      ``softwareupdate -l`` output in one pass.  All relevant output patterns
+      (``*`` prefix, ``-`` prefix, bare separator, no-update banner) are
+      exercised without spawning a subprocess.
     - ``MacOSVersionCheck``: metadata contract (category, id, profile tags,
       ``min_macos``, ``requires_tool``) and the guarantee that ``execute()``
       returns a valid ``CheckResult`` with a non-empty message.
+    - ``prefetch_software_updates()``: the background ``softwareupdate -l``
+      is collected by ``_fetch_software_updates()`` instead of a second run,
+      and ``cancel_software_update_prefetch()`` reaps it when no scan follows.
+    - ``AutoUpdateCheck``: keys read from one parse of the SoftwareUpdate
+      plist, with the per-key ``defaults`` fallback when it is unreadable.
+    - ``ScreenLockCheck``: password requirement and delay from the same
+      cached plist reader.
+    - ``FirewallCheck`` / ``FirewallStealthCheck``: one shared existence
+      probe of ``socketfilterfw`` per scan.
+    - ``_EXE``: every system tool is run through an absolute path resolved
+      once at import.
+    - ``_status_words()``: the keyword set the SIP, FileVault, firewall and
+      Gatekeeper checks branch on, including SIP's full-vs-custom split.
+    - ``SecureBootCheck``: the Intel T2 ``system_profiler`` parse.
+    - ``RosettaCheck``: on-disk runtime probe before the ``arch`` fallback.
+    - ``TimeMachineCheck``: backup age from the ``tmutil latestbackup``
+      folder name.
 
 Design:
-    ``_parse_update_lines`` has no side effects and is testable with plain
+    ``_parse_updates`` has no side effects and is testable with plain
     strings, so no mocking is required.  The ``MacOSVersionCheck`` metadata
     tests instantiate the check and inspect class attributes; they intentionally
     do *not* call ``run()`` because ``run()`` invokes real macOS system calls
@@ -24,20 +42,37 @@ Note:
     handled by manual integration testing, not automated unit tests.
 """
 
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
+
+import plistlib
+from datetime import datetime, timedelta, timezone
 
 import pytest
 
+from macaudit import system_info
+from macaudit.checks import system
 from macaudit.checks.system import (
+    AutoUpdateCheck,
+    FirewallCheck,
+    FirewallStealthCheck,
     MacOSVersionCheck,
-    _parse_update_lines,
+    RosettaCheck,
+    ScreenLockCheck,
+    SecureBootCheck,
+    SIPCheck,
+    TimeMachineCheck,
+    _fetch_software_updates,
+    _parse_updates,
+    _status_words,
+    cancel_software_update_prefetch,
+    prefetch_software_updates,
 )
 
 
-# ── _parse_update_lines() — pure parser, no subprocess ───────────────────────
+# ── _parse_updates() — pure parser, no subprocess ────────────────────────────
 
-class TestParseUpdateLines:
-    """Tests for the ``_parse_update_lines()`` pure parser.
+class TestParseUpdates:
+    """Tests for the ``_parse_updates()`` pure parser.
 
     ``softwareupdate -l`` output mixes header lines, ``*``-prefixed update
     entries, ``-`` detail lines, and bare separator dashes.  The parser must
@@ -47,19 +82,19 @@ class TestParseUpdateLines:
     def test_asterisk_prefixed_lines_included(self):
         """``*``-prefixed lines are the primary update entries — all must be returned."""
         output = "Software Update Tool\n* macOS 15.4\n* Safari 18.0\n"
-        lines = _parse_update_lines(output)
+        lines = _parse_updates(output)[0]
         assert len(lines) == 2
 
     def test_asterisk_lines_stripped(self):
         """Leading whitespace around the ``*`` is stripped; the ``*`` itself is kept."""
         output = "  * macOS 15.4 (Label: macOS15.4)\n"
-        lines = _parse_update_lines(output)
+        lines = _parse_updates(output)[0]
         assert lines[0].startswith("*")
 
     def test_dash_lines_included(self):
         """``-``-prefixed detail lines (e.g. ``- Label:``) are included."""
         output = "- Label: macOS 15.4\n"
-        lines = _parse_update_lines(output)
+        lines = _parse_updates(output)[0]
         assert any("macOS 15.4" in l for l in lines)
 
     def test_bare_dash_excluded(self):
@@ -69,17 +104,17 @@ class TestParseUpdateLines:
         separators.  Including them in the output would confuse the report.
         """
         output = "- \n* macOS 15.4\n"
-        lines = _parse_update_lines(output)
+        lines = _parse_updates(output)[0]
         assert "-" not in lines
 
     def test_no_updates_returns_empty(self):
-        """The "No new software available" banner → empty list (no updates pending)."""
+        """The "No new software available" banner → no update lines (no updates pending)."""
         output = "No new software available.\n"
-        assert _parse_update_lines(output) == []
+        assert _parse_updates(output)[0] == ()
 
     def test_empty_output_returns_empty(self):
-        """Empty string input (e.g. command timed out) → empty list."""
-        assert _parse_update_lines("") == []
+        """Empty string input (e.g. command timed out) → no update lines."""
+        assert _parse_updates("")[0] == ()
 
     def test_multiple_updates_all_captured(self):
         """Three ``*``-prefixed updates → all three returned."""
@@ -88,7 +123,299 @@ class TestParseUpdateLines:
             "* Safari 18.3\n"
             "* XProtect Remediator 1.2.3\n"
         )
-        assert len(_parse_update_lines(output)) == 3
+        assert len(_parse_updates(output)[0]) == 3
+
+    def test_security_flag_set_in_same_pass(self):
+        """A ``Recommended: YES`` detail line sets the security flag."""
+        output = "* Label: Safari 18.3\n\tTitle: Safari, Recommended: YES\n"
+        lines, has_security = _parse_updates(output)
+        assert lines == ("* Label: Safari 18.3",)
+        assert has_security
+
+    def test_security_flag_clear_for_plain_updates(self):
+        """No security or recommended marker → flag is ``False``."""
+        assert _parse_updates("* Label: Numbers 14.2\n")[1] is False
+
+
+# ── softwareupdate prefetch ───────────────────────────────────────────────────
+
+class TestSoftwareUpdatePrefetch:
+    """The scan-start ``softwareupdate -l`` is reused, not run twice."""
+
+    def _proc(self):
+        """A finished fake ``Popen`` with one pending update."""
+        proc = MagicMock(returncode=0)
+        proc.communicate.return_value = ("* Safari 18.0\n", None)
+        return proc
+
+    def test_fetch_collects_prefetched_process(self):
+        """A prefetch followed by a fetch launches one process."""
+        with patch.object(system, "_start_software_update_list",
+                          return_value=self._proc()) as start:
+            prefetch_software_updates()
+            assert _fetch_software_updates() == (0, "* Safari 18.0\n")
+        start.assert_called_once()
+        assert system._prefetched_updates is None
+
+    def test_fetch_without_prefetch_starts_process(self):
+        """With no prefetch the fetch starts ``softwareupdate`` itself."""
+        with patch.object(system, "_start_software_update_list",
+                          return_value=self._proc()) as start:
+            assert _fetch_software_updates()[0] == 0
+        start.assert_called_once()
+
+    def test_cancel_kills_prefetched_process(self):
+        """Cancelling reaps the background process and clears the slot."""
+        proc = self._proc()
+        with patch.object(system, "_start_software_update_list", return_value=proc):
+            prefetch_software_updates()
+            cancel_software_update_prefetch()
+        proc.kill.assert_called_once()
+        assert system._prefetched_updates is None
+
+    def test_cancel_without_prefetch_is_noop(self):
+        """With nothing prefetched, cancelling does nothing."""
+        cancel_software_update_prefetch()
+        assert system._prefetched_updates is None
+
+
+# ── AutoUpdateCheck ───────────────────────────────────────────────────────────
+
+class TestAutoUpdateCheck:
+    """``com.apple.SoftwareUpdate`` keys read from a plist in ``tmp_path``."""
+
+    def _run(self, tmp_path, prefs: dict | bytes):
+        """Run the check against a SoftwareUpdate plist holding *prefs*."""
+        plist = tmp_path / "com.apple.SoftwareUpdate.plist"
+        plist.write_bytes(prefs if isinstance(prefs, bytes) else plistlib.dumps(prefs))
+        check = AutoUpdateCheck()
+        with patch.object(system, "_SOFTWARE_UPDATE_PLIST", plist), \
+             patch.object(check, "shell", return_value=(1, "", "")) as shell:
+            return check.run(), shell
+
+    def test_missing_keys_pass_without_forking(self, tmp_path):
+        """Absent keys default to on, and ``defaults`` is never run."""
+        result, shell = self._run(tmp_path, {"LastSuccessfulDate": "x"})
+        assert result.status == "pass"
+        shell.assert_not_called()
+
+    def test_disabled_keys_reported(self, tmp_path):
+        """Explicit ``False`` / ``0`` values are each flagged."""
+        result, _ = self._run(
+            tmp_path,
+            {"AutomaticCheckEnabled": False, "CriticalUpdateInstall": 0,
+             "ConfigDataInstall": True},
+        )
+        assert result.data["disabled_keys"] == [
+            "Check for updates", "Install security responses",
+        ]
+
+    def test_corrupt_plist_falls_back_to_defaults(self, tmp_path):
+        """An unparseable plist → one ``defaults read`` per key."""
+        _, shell = self._run(tmp_path, b"not a plist")
+        assert shell.call_count == 3
+
+
+# ── ScreenLockCheck ───────────────────────────────────────────────────────────
+
+class TestScreenLockCheck:
+    """``com.apple.screensaver`` keys read from a plist in ``tmp_path``."""
+
+    def _run(self, tmp_path, prefs: dict):
+        """Run the check against a screensaver plist holding *prefs*."""
+        plist = tmp_path / "com.apple.screensaver.plist"
+        plist.write_bytes(plistlib.dumps(prefs))
+        check = ScreenLockCheck()
+        with patch.object(system, "_SCREENSAVER_PLIST", plist), \
+             patch.object(check, "shell") as shell:
+            result = check.run()
+        shell.assert_not_called()
+        return result
+
+    def test_password_not_required_warns(self, tmp_path):
+        """``askForPassword`` set to 0 → warning."""
+        result = self._run(tmp_path, {"askForPassword": 0})
+        assert result.data == {"password_required": False}
+
+    def test_absent_keys_use_immediate_default(self, tmp_path):
+        """No keys → the secure system default, pass."""
+        assert self._run(tmp_path, {}).status == "pass"
+
+    def test_long_delay_warns(self, tmp_path):
+        """A one-hour delay → warning carrying the delay."""
+        result = self._run(tmp_path, {"askForPassword": 1, "askForPasswordDelay": 3600.0})
+        assert result.status == "warning"
+        assert result.data["delay_seconds"] == 3600
+
+
+# ── FirewallCheck / FirewallStealthCheck ──────────────────────────────────────
+
+class TestFirewallBinaryProbe:
+    """The ``socketfilterfw`` presence check is shared by both firewall checks."""
+
+    def test_missing_binary_stat_once(self, tmp_path):
+        """Both checks skip, and the path is stat-ed only once per scan."""
+        absent = str(tmp_path / "socketfilterfw")
+        with patch.object(system, "_FIREWALL", absent), \
+             patch.object(system_info.os, "stat", side_effect=FileNotFoundError) as st:
+            assert FirewallCheck().run().status == "skip"
+            assert FirewallStealthCheck().run().status == "skip"
+        st.assert_called_once_with(absent)
+
+
+# ── _EXE — tool paths resolved at import ──────────────────────────────────────
+
+class TestResolvedExecutables:
+    """System tools are invoked by absolute path, never via a PATH search."""
+
+    def test_all_paths_absolute(self):
+        """Every entry resolves to an absolute path, found or fallback."""
+        assert all(path.startswith("/") for path in system._EXE.values())
+
+    def test_check_uses_resolved_path(self):
+        """SIPCheck passes the resolved ``csrutil`` path to ``shell()``."""
+        check = SIPCheck()
+        with patch.object(check, "shell", return_value=(0, "", "")) as sh:
+            check.run()
+        assert sh.call_args[0][0][0] == system._EXE["csrutil"]
+
+
+# ── _status_words() — shared status keyword scan ─────────────────────────────
+
+class TestStatusWords:
+    """One regex pass yields every status keyword the checks branch on."""
+
+    def test_keywords_lower_cased(self):
+        """Matches are case-insensitive and normalised to lower case."""
+        words = _status_words("Firewall is enabled. (State = 1)")
+        assert words == {"enabled", "state = 1"}
+
+    def test_sip_full_and_custom_distinct(self):
+        """The fully-enabled sentence does not also count as plain ``enabled``."""
+        full = _status_words("System Integrity Protection status: enabled.")
+        custom = _status_words(
+            "System Integrity Protection status: enabled (Custom Configuration)."
+        )
+        assert full == {"status: enabled."}
+        assert custom == {"enabled", "custom"}
+
+    def test_whole_words_only(self):
+        """``is on`` inside a longer word is not a status keyword."""
+        assert _status_words("Stealth mode is only partly configured") == frozenset()
+
+    @pytest.mark.parametrize("stdout, status", [
+        ("System Integrity Protection status: enabled.", "pass"),
+        ("System Integrity Protection status: enabled (Custom Configuration).", "warning"),
+        ("System Integrity Protection status: disabled.", "warning"),
+    ])
+    def test_sip_branches(self, stdout, status):
+        """SIPCheck maps each ``csrutil status`` form to the expected status."""
+        check = SIPCheck()
+        with patch.object(check, "shell", return_value=(0, stdout, "")):
+            assert check.run().status == status
+
+
+# ── RosettaCheck ──────────────────────────────────────────────────────────────
+
+class TestRosettaCheck:
+    """Rosetta detection from ``_ROSETTA_PATHS`` with the ``arch`` fallback."""
+
+    def _run(self, paths, arch_rc: int = 1):
+        """Run on Apple Silicon with *paths* as the runtime indicators."""
+        check = RosettaCheck()
+        with patch.object(system, "IS_APPLE_SILICON", True), \
+             patch.object(system, "_ROSETTA_PATHS", paths), \
+             patch.object(check, "shell", return_value=(arch_rc, "", "")) as shell:
+            return check.run(), shell
+
+    def test_runtime_on_disk_passes_without_fork(self, tmp_path):
+        """An existing runtime file answers without running ``arch``."""
+        runtime = tmp_path / "translate"
+        runtime.write_text("")
+        result, shell = self._run((tmp_path / "absent", runtime))
+        assert result.status == "pass"
+        shell.assert_not_called()
+
+    def test_no_runtime_and_arch_fails_is_info(self, tmp_path):
+        """No files and a failing ``arch`` → not installed."""
+        result, shell = self._run((tmp_path / "absent",))
+        assert result.data == {"rosetta_installed": False}
+        shell.assert_called_once()
+
+
+# ── TimeMachineCheck ──────────────────────────────────────────────────────────
+
+class TestTimeMachineCheck:
+    """Backup age parsed from the ``YYYY-MM-DD-HHMMSS`` folder name."""
+
+    def _run(self, path: str):
+        """Run the check with ``tmutil latestbackup`` printing *path*."""
+        check = TimeMachineCheck()
+        with patch.object(check, "shell", return_value=(0, path + "\n", "")):
+            return check.run()
+
+    def _folder(self, days_ago: int) -> str:
+        """A backup folder name stamped *days_ago* days before now."""
+        stamp = datetime.now(timezone.utc) - timedelta(days=days_ago, minutes=5)
+        return stamp.strftime("%Y-%m-%d-%H%M%S")
+
+    def test_full_timestamp_parsed(self):
+        """A 17-character folder name yields the backup age in days."""
+        result = self._run(f"/Volumes/TM/Backups.backupdb/mac/{self._folder(3)}")
+        assert result.status == "info"
+        assert result.data == {"backup_age_days": 3}
+
+    def test_backup_suffix_tolerated(self):
+        """APFS ``.backup`` suffixes after the timestamp are ignored."""
+        result = self._run(f"/Volumes/.timemachine/x/{self._folder(10)}.backup")
+        assert result.status == "warning"
+
+    @pytest.mark.parametrize("days, status", [
+        (0, "pass"), (1, "pass"), (2, "info"), (7, "info"), (8, "warning"),
+    ])
+    def test_age_bands(self, days, status):
+        """Band edges: ≤1 day pass, ≤7 days info, older warning."""
+        assert self._run(f"/Volumes/TM/{self._folder(days)}").status == status
+
+    def test_malformed_name_falls_back(self):
+        """A folder that is not a timestamp → info echoing the path."""
+        assert self._run("/Volumes/TM/Latest").message == "Last backup: /Volumes/TM/Latest"
+
+
+# ── SecureBootCheck (Intel T2) ────────────────────────────────────────────────
+
+_SPIBRIDGE = (
+    "Controller Information:\n\n"
+    "      Model Name: Apple T2 Security Chip\n"
+    "      Firmware Version: 20.16.3045.0.0,0\n"
+    "      Boot UUID: 1A2B\n"
+    "      Secure Boot: {}\n"
+)
+
+
+class TestSecureBootT2:
+    """``SecureBootCheck`` on Intel reads the ``Secure Boot:`` row."""
+
+    def _run(self, stdout: str):
+        """Run the Intel branch against *stdout* from ``system_profiler``."""
+        check = SecureBootCheck()
+        with patch.object(system, "IS_APPLE_SILICON", False), \
+             patch.object(check, "shell", return_value=(0, stdout, "")):
+            return check.run()
+
+    def test_full_security_passes(self):
+        """``Full Security`` → pass, value reported verbatim."""
+        result = self._run(_SPIBRIDGE.format("Full Security"))
+        assert result.status == "pass"
+        assert result.message == "Secure Boot: Full Security"
+
+    def test_medium_security_info(self):
+        """Anything else → info."""
+        assert self._run(_SPIBRIDGE.format("Medium Security")).status == "info"
+
+    def test_row_missing_skips(self):
+        """No ``Secure Boot`` row → skip."""
+        assert self._run("Controller Information:\n").status == "skip"
 
 
 # ── MacOSVersionCheck.execute() — gate layer ─────────────────────────────────
@@ -128,6 +455,21 @@ class TestMacOSVersionCheck:
         check = MacOSVersionCheck()
         assert check.requires_tool is None
 
+    def test_macos_update_detected_case_insensitively(self):
+        """An ``MACOS``/``OS X`` update line in any case → warning."""
+        output = "Software Update found:\n* Label: MACOS Sequoia 15.4-24E248\n"
+        with patch.object(system, "_fetch_software_updates", return_value=(0, output)):
+            result = MacOSVersionCheck().run()
+        assert result.data["update_available"] is True
+
+    def test_unsupported_major_skips_softwareupdate(self):
+        """An EOL major version warns without fetching the update list."""
+        with patch.object(system, "_MACOS_EOL", True), \
+             patch.object(system, "_fetch_software_updates") as fetch:
+            result = MacOSVersionCheck().run()
+        fetch.assert_not_called()
+        assert "no longer supported" in result.message
+
     def test_execute_returns_checkresult(self):
         """``execute()`` returns a ``CheckResult`` with a valid status string."""
         from macaudit.checks.base import CheckResult
@@ -3,8 +3,10 @@ Tests for macaudit.config — config loading and check suppression.
 
 Covers:
     - ``load_config()`` with a missing file, valid TOML, empty list, malformed
-      TOML, wrong value types, a missing ``suppress`` key, TOML comments, and
-      an unreadable file (mode 000).
+      TOML, wrong value types, non-string list entries, a missing
+      ``suppress`` key, TOML comments, and an unreadable file (mode 000).
+    - The per-path cache: the file is parsed once and the shared
+      ``suppress`` set is immutable.
     - ``TestSuppressionIntegration``: end-to-end flow from config load through
       check splitting to final health score, using synthetic ``BaseCheck``
       subclasses to keep the test hermetic.
@@ -25,9 +27,18 @@ from pathlib import Path
 import pytest
 
 from macaudit.checks.base import CheckResult, calculate_health_score
+from macaudit import config
 from macaudit.config import load_config
 
 
+@pytest.fixture(autouse=True)
+def _clear_config_cache():
+    """Start every test with an empty ``_load_suppress`` cache."""
+    config._load_suppress.cache_clear()
+    yield
+    config._load_suppress.cache_clear()
+
+
 class TestLoadConfig:
     """Unit tests for ``load_config()`` covering the full input space.
 
@@ -84,6 +95,13 @@ class TestLoadConfig:
         result = load_config(path=cfg)
         assert result == {"suppress": set()}
 
+    def test_non_string_entries_dropped(self, tmp_path):
+        """Non-string list entries are ignored; string IDs are kept as-is."""
+        cfg = tmp_path / "config.toml"
+        cfg.write_text('suppress = ["filevault", 42, true]\n')
+        result = load_config(path=cfg)
+        assert result == {"suppress": {"filevault"}}
+
     def test_missing_suppress_key_returns_empty(self, tmp_path):
         """Valid TOML without a ``suppress`` key → empty set (no checks suppressed)."""
         cfg = tmp_path / "config.toml"
@@ -101,6 +119,26 @@ class TestLoadConfig:
         result = load_config(path=cfg)
         assert result == {"suppress": {"filevault"}}
 
+    def test_parsed_once_per_path(self, tmp_path, monkeypatch):
+        """A second call for the same path reuses the cached result."""
+        cfg = tmp_path / "config.toml"
+        cfg.write_text('suppress = ["filevault"]\n')
+        calls = []
+        real_load = config._tomllib.load
+        monkeypatch.setattr(
+            config._tomllib, "load", lambda f: calls.append(f) or real_load(f)
+        )
+        first = load_config(path=cfg)
+        second = load_config(path=cfg)
+        assert len(calls) == 1
+        assert first["suppress"] is second["suppress"]
+
+    def test_suppress_is_immutable(self, tmp_path):
+        """The shared ``suppress`` set is a ``frozenset``."""
+        cfg = tmp_path / "config.toml"
+        cfg.write_text('suppress = ["filevault"]\n')
+        assert isinstance(load_config(path=cfg)["suppress"], frozenset)
+
     def test_unreadable_file_returns_empty(self, tmp_path):
         """File with mode 000 (no read permission) → graceful fallback.
 
@@ -2,17 +2,22 @@
 Tests for macaudit/diff.py — pure diff logic.
 
 Covers:
-    - Identical scans → ``None`` (no diff output generated).
+    - Identical scans → ``None`` (no diff output generated), including the
+      order-independent fast path and a same-score status swap it must
+      not mistake for "no change".
     - Score delta calculation: positive, negative, and zero.
     - Status-change classification: ``improved`` (lower severity) and
       ``regressed`` (higher severity).
     - New / removed check detection when checks appear or disappear.
     - Schema version mismatch → ``None`` (incompatible history file rejected).
-    - Mixed changes in a single diff (simultaneous improve + regress).
+    - Change entries are returned as plain, JSON-serialisable dicts.
+    - Mixed changes in a single diff (simultaneous improve + regress), and
+      ID ordering of every change list from unsorted input.
     - Filter-mismatch suppression: when ``>50%`` of checks are new or removed,
       the ``new_checks`` / ``removed_checks`` sections are suppressed to avoid
       noise after a profile switch.
     - ``is_empty_diff()`` edge cases.
+    - ``_STATUS_SEVERITY`` ranks statuses in the declared order.
 
 Design:
     ``compute_diff`` operates entirely on plain dicts, so no macaudit imports
@@ -21,7 +26,9 @@ Design:
     used by ``history._build_payload()``.
 """
 
-from macaudit.diff import compute_diff, is_empty_diff
+import json
+
+from macaudit.diff import _STATUS_SEVERITY, compute_diff, is_empty_diff
 
 
 # ── Helpers ──────────────────────────────────────────────────────────────────
@@ -97,6 +104,21 @@ class TestIdenticalScans:
                         scan_time="2026-02-26T10:00:00+00:00")
         assert compute_diff(curr, prev) is None
 
+    def test_reordered_identical_results_return_none(self):
+        """Result order does not matter to the identical-scan fast path."""
+        prev = _payload([_check("sip", "pass"), _check("filevault", "warning")])
+        curr = _payload([_check("filevault", "warning"), _check("sip", "pass")])
+        assert compute_diff(curr, prev) is None
+
+    def test_swapped_statuses_same_score_not_identical(self):
+        """Two checks trading statuses at an unchanged score is still a diff."""
+        prev = _payload([_check("sip", "pass"), _check("filevault", "warning")])
+        curr = _payload([_check("sip", "warning"), _check("filevault", "pass")])
+        diff = compute_diff(curr, prev)
+        assert diff is not None
+        assert [d["id"] for d in diff["improved"]] == ["filevault"]
+        assert [d["id"] for d in diff["regressed"]] == ["sip"]
+
 
 # ── Score delta ──────────────────────────────────────────────────────────────
 
@@ -155,6 +177,17 @@ class TestStatusChanges:
         assert diff["improved"][0]["before_status"] == "warning"
         assert diff["improved"][0]["after_status"] == "info"
 
+    def test_entries_are_plain_json_dicts(self):
+        """Entries leave ``compute_diff`` as dicts, so JSON output keeps key names."""
+        prev = _payload([_check("filevault", "critical")])
+        curr = _payload([_check("filevault", "pass")])
+        entry = compute_diff(curr, prev)["improved"][0]
+        assert type(entry) is dict
+        assert json.loads(json.dumps(entry)) == entry
+        assert list(entry) == [
+            "id", "name", "category", "before_status", "after_status", "message",
+        ]
+
 
 # ── New / removed checks ────────────────────────────────────────────────────
 
@@ -219,6 +252,18 @@ class TestMixedChanges:
         assert diff["improved"][0]["id"] == "filevault"
         assert diff["regressed"][0]["id"] == "screen_lock"
 
+    def test_entries_sorted_by_id_regardless_of_input_order(self):
+        """Every change list is ordered by check ID even from unsorted results."""
+        ids = ["sip", "filevault", "gatekeeper", "auto_update", "firewall", "ssh"]
+        prev = _payload([_check(i, "critical") for i in ids]
+                        + [_check("zz_gone"), _check("aa_gone")])
+        curr = _payload([_check(i, "pass") for i in reversed(ids)]
+                        + [_check("zz_new"), _check("aa_new")])
+        diff = compute_diff(curr, prev)
+        assert [d["id"] for d in diff["improved"]] == sorted(ids)
+        assert [d["id"] for d in diff["new_checks"]] == ["aa_new", "zz_new"]
+        assert [d["id"] for d in diff["removed_checks"]] == ["aa_gone", "zz_gone"]
+
 
 # ── Filter mismatch suppression ─────────────────────────────────────────────
 
@@ -291,3 +336,14 @@ class TestIsEmptyDiff:
             "new_checks": [],
             "removed_checks": [],
         }) is False
+
+
+# ── Severity ranking ─────────────────────────────────────────────────────────
+
+class TestSeverityRanking:
+    """``_STATUS_SEVERITY`` is derived from the declared ranking order."""
+
+    def test_ranks_follow_declared_order(self):
+        """pass < info < skip < warning < error < critical, by plain string."""
+        order = ["pass", "info", "skip", "warning", "error", "critical"]
+        assert [_STATUS_SEVERITY[s] for s in order] == list(range(len(order)))
@@ -3,13 +3,18 @@ Tests for fixer/executor.py — the three fix-dispatch strategies.
 
 Covers:
     - ``run_auto_fix``: missing ``fix_command`` (no-op), successful command,
-      non-zero exit, live stdout streaming, ``shell=False`` invariant, and
-      list-form command passing (injection safety).
+      non-zero exit, live stdout streaming (including lines and characters
+      split across pipe reads), ``shell=False`` invariant, and list-form
+      command passing (injection safety).
+    - ``run_auto_sudo_fix``: backslashes and double quotes are escaped for
+      the AppleScript string literal.
     - ``run_instructions_fix``: with explicit steps, fallback to
       ``recommendation``, empty steps + empty recommendation (no-op).
     - ``run_guided_fix``: missing URL (no-op), successful deep-link open,
       fallback to System Settings when the deep link fails, step text printed
       before opening.
+    - ``format_command``: shell quoting of ``fix_command`` lists, memoised
+      per distinct command.
 
 Design:
     ``_console()`` creates a Rich ``Console`` backed by a ``StringIO`` buffer
@@ -29,7 +34,7 @@ Note:
     guaranteed to be on ``$PATH`` in any POSIX environment.
 """
 
-from io import StringIO
+from io import BytesIO, StringIO
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -37,7 +42,9 @@ from rich.console import Console
 
 from macaudit.checks.base import CheckResult
 from macaudit.fixer.executor import (
+    format_command,
     run_auto_fix,
+    run_auto_sudo_fix,
     run_guided_fix,
     run_instructions_fix,
 )
@@ -92,6 +99,22 @@ def _result(**kwargs) -> CheckResult:
     return CheckResult(**defaults)
 
 
+# ── format_command ────────────────────────────────────────────────────────────
+
+class TestFormatCommand:
+    """Tests for ``format_command`` — the shared display string of a command."""
+
+    def test_quotes_arguments(self):
+        """Arguments needing quotes are quoted exactly as ``shlex.join`` does."""
+        assert format_command(["echo", "a b", "it's"]) == "echo 'a b' 'it'\"'\"'s'"
+
+    def test_memoised_per_command(self):
+        """Equal commands share one cached string, even from separate lists."""
+        first = format_command(["brew", "cleanup", "--prune=all"])
+        second = format_command(["brew", "cleanup", "--prune=all"])
+        assert first is second
+
+
 # ── run_auto_fix ──────────────────────────────────────────────────────────────
 
 class TestRunAutoFix:
@@ -122,12 +145,27 @@ class TestRunAutoFix:
         run_auto_fix(_result(fix_command=["echo", "mactuner_test_output"]), con)
         assert "mactuner_test_output" in buf.getvalue()
 
+    def test_output_split_across_reads(self):
+        """Lines and UTF-8 characters split between pipe reads are reassembled."""
+        con, buf = _console()
+        data = "first ✅ line\r\nprogress 50%\rprogress 100%\nlast".encode()
+        split = data.index("✅".encode()) + 1  # cut inside the emoji
+        with patch("subprocess.Popen") as mock_popen:
+            mock_proc = MagicMock()
+            mock_proc.stdout.read1.side_effect = [data[:split], data[split:], b""]
+            mock_proc.returncode = 0
+            mock_popen.return_value = mock_proc
+            run_auto_fix(_result(fix_command=["echo", "hello"]), con)
+        lines = [line.strip() for line in buf.getvalue().splitlines()]
+        for expected in ("first ✅ line", "progress 50%", "progress 100%", "last"):
+            assert expected in lines
+
     def test_uses_shell_false(self):
         """Verify shell=False is used to avoid command-injection surface."""
         con, _ = _console()
         with patch("subprocess.Popen") as mock_popen:
             mock_proc = MagicMock()
-            mock_proc.stdout = iter(["line1\n"])
+            mock_proc.stdout = BytesIO(b"line1\n")
             mock_proc.returncode = 0
             mock_proc.wait.return_value = 0
             mock_popen.return_value = mock_proc
@@ -142,7 +180,7 @@ class TestRunAutoFix:
         con, _ = _console()
         with patch("subprocess.Popen") as mock_popen:
             mock_proc = MagicMock()
-            mock_proc.stdout = iter([])
+            mock_proc.stdout = BytesIO(b"")
             mock_proc.returncode = 0
             mock_proc.wait.return_value = 0
             mock_popen.return_value = mock_proc
@@ -155,6 +193,24 @@ class TestRunAutoFix:
             assert "brew" in cmd
 
 
+# ── run_auto_sudo_fix ─────────────────────────────────────────────────────────
+
+class TestRunAutoSudoFix:
+    """Tests for ``run_auto_sudo_fix`` — the osascript privilege wrapper."""
+
+    def test_applescript_escaping(self):
+        """Backslashes and double quotes are escaped inside the AppleScript string."""
+        con, _ = _console()
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
+            run_auto_sudo_fix(_result(fix_command=["echo", 'say "hi"', "a\\b"]), con)
+        script = mock_run.call_args.args[0][2]
+        assert script == (
+            'do shell script "echo \'say \\"hi\\"\' \'a\\\\b\'" '
+            "with administrator privileges"
+        )
+
+
 # ── run_instructions_fix ──────────────────────────────────────────────────────
 
 class TestRunInstructionsFix:
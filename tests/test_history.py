@@ -3,14 +3,22 @@ Tests for macaudit/history.py — scan history persistence.
 
 Covers:
     - ``save_scan()``: creates a valid JSON file with the expected schema;
-      filename is ISO-8601 with hyphens (filesystem-safe, no colons).
+      filename is ISO-8601 with hyphens (filesystem-safe, no colons).  A
+      write that fails part-way leaves no partial or temporary file.
     - ``load_previous_scan()``: returns ``None`` for an empty or absent
       directory; returns the most recent file (lexicographic = chronological);
       handles corrupt JSON gracefully.
     - ``prune_history()``: removes the oldest files when the count exceeds
-      ``_MAX_SCANS``; does nothing when at or below the limit.
+      ``_MAX_SCANS``; does nothing when at or below the limit.  A
+      load → save → prune cycle lists the directory only once, and only
+      visible ``*.json`` regular files are listed.
     - ``save_scan`` → ``load_previous_scan`` roundtrip: data survives
-      serialise → write → read → parse intact.
+      serialise → write → read → parse intact, with the optional ``orjson``
+      codec and with the stdlib ``json`` fallback, which write identical
+      files.
+    - ``_build_payload()``: each result serialises to the same fields
+      ``dataclasses.asdict()`` would produce, without deep-copying; the
+      ``summary`` counts each status.
 
 Design:
     ``_patch_history_dir`` uses ``monkeypatch.setattr`` to redirect
@@ -24,8 +32,11 @@ Note:
     so the signature is consistent across the test suite.
 """
 
+import dataclasses
 import json
 
+import pytest
+
 import macaudit.history as history_mod
 from macaudit.checks.base import CheckResult
 from macaudit.history import load_previous_scan, prune_history, save_scan
@@ -79,6 +90,12 @@ def _patch_history_dir(monkeypatch, tmp_path):
     monkeypatch.setattr(history_mod, "_HISTORY_DIR", tmp_path / "history")
 
 
+@pytest.fixture(autouse=True)
+def _fresh_listing(monkeypatch):
+    """Start every test without a shared history listing from an earlier test."""
+    monkeypatch.setattr(history_mod, "_listing", None)
+
+
 # ── Tests ────────────────────────────────────────────────────────────────────
 
 class TestSaveScan:
@@ -105,6 +122,26 @@ class TestSaveScan:
         assert "T" in stem
         assert ":" not in stem  # colons replaced with hyphens
 
+    def test_failed_encode_leaves_no_file(self, tmp_path, monkeypatch):
+        """An encoding error mid-write leaves neither a partial nor a temp file."""
+        _patch_history_dir(monkeypatch, tmp_path)
+        monkeypatch.setattr(history_mod, "_orjson", None)
+        with pytest.raises(TypeError):
+            save_scan([_result(data={"bad": object()})])
+        assert list((tmp_path / "history").iterdir()) == []
+
+    def test_failed_write_returns_none_and_cleans_up(self, tmp_path, monkeypatch):
+        """An ``OSError`` during the write → ``None``, no file left behind."""
+        _patch_history_dir(monkeypatch, tmp_path)
+
+        def fail(*args, **kwargs):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(history_mod.os, "replace", fail)
+        assert save_scan([_result()]) is None
+        assert list((tmp_path / "history").iterdir()) == []
+        assert load_previous_scan() is None
+
 
 class TestLoadPreviousScan:
     """Tests for ``load_previous_scan()`` — reading and selecting the most recent history file."""
@@ -168,6 +205,40 @@ class TestPruneHistory:
         assert "2026-02-23T10-00-00" in stems
         assert "2026-02-24T10-00-00" in stems
 
+    def test_load_save_prune_lists_once(self, tmp_path, monkeypatch):
+        """The listing from ``load_previous_scan`` is reused by save and prune."""
+        _patch_history_dir(monkeypatch, tmp_path)
+        monkeypatch.setattr(history_mod, "_MAX_SCANS", 2)
+        hist = tmp_path / "history"
+        hist.mkdir(parents=True)
+        for day in (20, 21):
+            (hist / f"2026-02-{day}T10-00-00.json").write_text("{}")
+
+        calls = []
+        real_scandir = history_mod.os.scandir
+        monkeypatch.setattr(
+            history_mod.os, "scandir",
+            lambda path: calls.append(path) or real_scandir(path),
+        )
+        load_previous_scan()
+        path = save_scan([_result()])
+
+        assert len(calls) == 1
+        remaining = sorted(hist.glob("*.json"))
+        assert [f.name for f in remaining] == ["2026-02-21T10-00-00.json", path.name]
+        assert history_mod._history_files() == remaining
+
+    def test_listing_skips_non_history_entries(self, tmp_path, monkeypatch):
+        """Only visible ``*.json`` regular files count as history."""
+        _patch_history_dir(monkeypatch, tmp_path)
+        hist = tmp_path / "history"
+        hist.mkdir(parents=True)
+        (hist / "2026-02-26T10-00-00.json").write_text("{}")
+        (hist / ".partial.json").write_text("{}")
+        (hist / "notes.txt").write_text("")
+        (hist / "dir.json").mkdir()
+        assert history_mod._history_files() == [hist / "2026-02-26T10-00-00.json"]
+
     def test_prune_noop_when_under_limit(self, tmp_path, monkeypatch):
         """Prune does nothing when count ≤ _MAX_SCANS."""
         _patch_history_dir(monkeypatch, tmp_path)
@@ -201,3 +272,55 @@ class TestSaveLoadRoundtrip:
         assert len(loaded["results"]) == 2
         ids = {r["id"] for r in loaded["results"]}
         assert ids == {"sip", "filevault"}
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_roundtrip_each_codec(self, tmp_path, monkeypatch, use_orjson):
+        """Both codecs write the same indented JSON and read it back."""
+        if use_orjson:
+            pytest.importorskip("orjson")
+        else:
+            monkeypatch.setattr(history_mod, "_orjson", None)
+        _patch_history_dir(monkeypatch, tmp_path)
+        path = save_scan([_result(id="sip", fix_steps=("a", "b"), data={1: "x"})])
+        text = path.read_text(encoding="utf-8")
+        assert text == json.dumps(json.loads(text), indent=2, ensure_ascii=False)
+        loaded = load_previous_scan()
+        entry = loaded["results"][0]
+        assert entry["fix_steps"] == ["a", "b"]
+        assert entry["data"] == {"1": "x"}
+
+    def test_corrupt_file_with_orjson_returns_none(self, tmp_path, monkeypatch):
+        """orjson's decode error is caught like the stdlib one."""
+        pytest.importorskip("orjson")
+        _patch_history_dir(monkeypatch, tmp_path)
+        hist = tmp_path / "history"
+        hist.mkdir(parents=True)
+        (hist / "2026-02-26T10-00-00.json").write_text("not json{{{")
+        assert load_previous_scan() is None
+
+
+class TestBuildPayload:
+    """``_build_payload`` projects results onto flat, JSON-ready dicts."""
+
+    def test_matches_asdict_fields(self):
+        """Each entry has the same keys and values as ``dataclasses.asdict``."""
+        r = _result(fix_steps=("Open Settings", "Click Lock"), data={"n": [1, 2]})
+        entry = history_mod._build_payload([r])["results"][0]
+        expected = dataclasses.asdict(r)
+        expected["min_macos"] = list(expected["min_macos"])
+        assert entry == expected
+        assert entry["min_macos"] == list(r.min_macos)
+
+    def test_nested_values_not_copied(self):
+        """Nested fields are shared with the result rather than deep-copied."""
+        r = _result(data={"n": [1, 2]})
+        entry = history_mod._build_payload([r])["results"][0]
+        assert entry["data"] is r.data
+
+    def test_summary_counts_statuses(self):
+        """``summary`` is a plain dict of per-status counts."""
+        results = [_result(status="pass"), _result(status="warning"),
+                   _result(status="pass")]
+        summary = history_mod._build_payload(results)["summary"]
+        assert type(summary) is dict
+        assert summary == {"pass": 2, "warning": 1}
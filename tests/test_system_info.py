@@ -0,0 +1,408 @@
+"""
+Tests for system_info.py.
+
+Covers:
+    - ``get_launchd_jobs()``: parsing of ``launchctl list`` output into a
+      label-keyed snapshot, caching across callers, and the empty-dict
+      result when ``launchctl`` fails.
+    - ``get_remote_login()``: SSH state from launchd's override plist, and
+      the ``systemsetup`` fallback when the plist is unreadable.
+    - ``stat_path()``: one ``os.stat`` per path per scan, ``None`` for
+      missing paths.
+    - ``get_system_info()``: the three hardware sysctl keys are read by one
+      ``sysctl`` process and matched by name, so a missing key cannot
+      misalign the others (or read in-process via ``sysctlbyname``); the
+      model name comes from ``ioreg``'s ``product-name`` before falling
+      back to ``system_profiler``.
+    - ``_read_macos_version()``: ``SystemVersion.plist`` first, then
+      ``platform.mac_ver()``.
+    - ``_macos_name()``: marketing names, numbers for unnamed future
+      majors inside and beyond the lookup table, ``"Unknown"`` for old ones.
+    - ``_run()``: bytes are captured and decoded once; errors give ``""``.
+    - ``scan_cache`` / ``clear_scan_caches()``: scan-scoped memoization that
+      is invalidated for every registered fetcher at once, fetches once
+      even when worker threads miss concurrently, and never makes a hit or
+      another key wait on a fetch in flight.
+
+Design:
+    ``_run()`` is patched so no subprocess is spawned; it already converts
+    every execution error into ``""``, so an empty string stands in for any
+    failure mode.  The autouse fixture in ``conftest.py`` clears the
+    scan caches between tests.
+"""
+
+import plistlib
+import subprocess
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+
+from macaudit import system_info
+from macaudit.system_info import (
+    clear_scan_caches,
+    get_launchd_jobs,
+    get_remote_login,
+    scan_cache,
+    stat_path,
+)
+
+
+_LAUNCHCTL_OUTPUT = (
+    "PID\tStatus\tLabel\n"
+    "412\t0\tcom.apple.screensharing\n"
+    "-\t0\tcom.apple.smbd"
+)
+
+
+# ── get_launchd_jobs() ────────────────────────────────────────────────────────
+
+class TestGetLaunchdJobs:
+    """Tests for the cached ``launchctl list`` snapshot."""
+
+    def test_rows_indexed_by_label(self):
+        """Each row maps its label to ``(pid, status)``; the header is skipped."""
+        with patch.object(system_info, "_run", return_value=_LAUNCHCTL_OUTPUT):
+            jobs = get_launchd_jobs()
+        assert jobs == {
+            "com.apple.screensharing": ("412", "0"),
+            "com.apple.smbd": ("-", "0"),
+        }
+
+    def test_launchctl_runs_once_per_scan(self):
+        """Repeated lookups reuse the cached snapshot."""
+        with patch.object(system_info, "_run", return_value=_LAUNCHCTL_OUTPUT) as mock_run:
+            get_launchd_jobs()
+            get_launchd_jobs()
+        assert mock_run.call_count == 1
+
+    def test_failure_returns_empty_dict(self):
+        """``launchctl`` failing (``_run`` returns ``""``) → empty dict."""
+        with patch.object(system_info, "_run", return_value=""):
+            assert get_launchd_jobs() == {}
+
+
+# ── get_system_info() ─────────────────────────────────────────────────────────
+
+def _fake_run(sysctl_out: str, profiler_out: str = "", ioreg_out: str = ""):
+    """Return a ``_run`` stand-in that answers sysctl, ioreg and system_profiler."""
+    outputs = {"sysctl": sysctl_out, "ioreg": ioreg_out,
+               "system_profiler": profiler_out}
+
+    def run(cmd, timeout=5):
+        return outputs[cmd[0]]
+    return run
+
+
+def _ioreg_plist(product_name: bytes | None) -> str:
+    """Build ``ioreg -a`` output for one platform device."""
+    device = {"IOObjectClass": "IOPlatformExpertDevice"}
+    if product_name is not None:
+        device["product-name"] = product_name
+    return plistlib.dumps([device]).decode()
+
+
+class TestGetSystemInfo:
+    """Tests for the hardware fields of ``get_system_info()``."""
+
+    @pytest.fixture(autouse=True)
+    def _no_libc_sysctl(self):
+        """Take the ``sysctl`` process path even where libc is loadable."""
+        with patch.object(system_info, "_sysctlbyname", None):
+            yield
+
+    def test_one_sysctl_for_all_keys(self):
+        """Model, CPU and RAM come from a single ``sysctl`` invocation."""
+        out = (
+            "hw.model: MacBookPro18,3\n"
+            "machdep.cpu.brand_string: Apple M1 Pro\n"
+            "hw.memsize: 34359738368"
+        )
+        with patch.object(system_info, "_run",
+                          side_effect=_fake_run(out, "      Model Name: MacBook Pro")) as run:
+            info = system_info.get_system_info()
+        assert (info["model_name"], info["cpu_brand"], info["ram_gb"]) == (
+            "MacBook Pro", "Apple M1 Pro", 32,
+        )
+        assert [c.args[0][0] for c in run.call_args_list].count("sysctl") == 1
+
+    def test_ioreg_product_name_skips_system_profiler(self):
+        """Apple Silicon's ``product-name`` is used; system_profiler never runs."""
+        run = _fake_run(
+            "hw.model: Mac14,5",
+            ioreg_out=_ioreg_plist(b"MacBook Pro (14-inch, 2023)\x00"),
+        )
+        with patch.object(system_info, "_run", side_effect=run) as mock_run:
+            info = system_info.get_system_info()
+        assert info["model_name"] == "MacBook Pro (14-inch, 2023)"
+        assert "system_profiler" not in [c.args[0][0] for c in mock_run.call_args_list]
+
+    def test_no_product_name_falls_back_to_system_profiler(self):
+        """Without ``product-name`` (Intel), system_profiler supplies the name."""
+        run = _fake_run(
+            "hw.model: MacBookPro16,1",
+            profiler_out="      Model Name: MacBook Pro",
+            ioreg_out=_ioreg_plist(None),
+        )
+        with patch.object(system_info, "_run", side_effect=run):
+            assert system_info.get_system_info()["model_name"] == "MacBook Pro"
+
+    def test_missing_key_does_not_shift_values(self):
+        """An unknown brand-string key leaves the other values on their keys."""
+        out = "hw.model: MacBookPro18,3\nhw.memsize: 17179869184"
+        with patch.object(system_info, "_run", side_effect=_fake_run(out)):
+            info = system_info.get_system_info()
+        assert info["model_name"] == "MacBookPro18,3"
+        assert info["cpu_brand"] == "Apple Silicon (MacBookPro18,3)"
+        assert info["ram_gb"] == 16
+
+    def test_libc_sysctl_spawns_no_sysctl_process(self):
+        """With ``sysctlbyname`` available, the keys are read in-process."""
+        raw = {
+            "hw.model": b"MacBookPro18,3\x00",
+            "hw.memsize": (34359738368).to_bytes(8, sys.byteorder),
+        }
+        with patch.object(system_info, "_sysctlbyname", object()), \
+             patch.object(system_info, "_read_sysctl", side_effect=raw.get), \
+             patch.object(system_info, "_run", side_effect=_fake_run("")) as run:
+            info = system_info.get_system_info()
+        assert (info["model_name"], info["cpu_brand"], info["ram_gb"]) == (
+            "MacBookPro18,3", "Apple Silicon (MacBookPro18,3)", 32,
+        )
+        assert "sysctl" not in [c.args[0][0] for c in run.call_args_list]
+
+    def test_sysctl_failure_defaults(self):
+        """No sysctl output → ``"Mac"``, ``"Unknown CPU"`` and ``0`` GB."""
+        with patch.object(system_info, "_run", return_value=""):
+            info = system_info.get_system_info()
+        assert (info["model_name"], info["cpu_brand"], info["ram_gb"]) == (
+            "Mac", "Unknown CPU", 0,
+        )
+
+
+class TestReadMacosVersion:
+    """Tests for ``_read_macos_version()``."""
+
+    def test_reads_product_version_from_plist(self, tmp_path):
+        """``ProductVersion`` comes straight from ``SystemVersion.plist``."""
+        plist = tmp_path / "SystemVersion.plist"
+        plist.write_bytes(plistlib.dumps({"ProductVersion": "15.4.1"}))
+        with patch.object(system_info, "_SYSTEM_VERSION_PLIST", str(plist)), \
+             patch.object(system_info.platform, "mac_ver") as mac_ver:
+            assert system_info._read_macos_version() == "15.4.1"
+        mac_ver.assert_not_called()
+
+    def test_unreadable_plist_falls_back_to_platform(self, tmp_path):
+        """A missing plist defers to ``platform.mac_ver()``."""
+        with patch.object(system_info, "_SYSTEM_VERSION_PLIST", str(tmp_path / "none")), \
+             patch.object(system_info.platform, "mac_ver",
+                          return_value=("14.6", ("", "", ""), "arm64")):
+            assert system_info._read_macos_version() == "14.6"
+
+
+class TestMacosName:
+    """Tests for ``_macos_name()``."""
+
+    @pytest.mark.parametrize("major, name", [
+        (13, "Ventura"), (16, "Tahoe"), (17, "17"), (30, "30"), (42, "42"),
+        (12, "Unknown"),
+    ])
+    def test_name_for_major(self, major, name):
+        """Named majors map to names, later ones to their number, older to Unknown."""
+        assert system_info._macos_name(major) == name
+
+
+class TestRun:
+    """Tests for the ``_run()`` subprocess helper."""
+
+    def test_decodes_captured_bytes_once(self):
+        """stdout is captured as bytes, then decoded and stripped."""
+        done = subprocess.CompletedProcess([], 0, stdout="Café\n".encode(), stderr=b"")
+        with patch.object(system_info.subprocess, "run", return_value=done) as run:
+            assert system_info._run(["echo"]) == "Café"
+        assert "text" not in run.call_args.kwargs
+
+    def test_error_returns_empty_string(self):
+        """A missing executable yields ``""`` rather than raising."""
+        with patch.object(system_info.subprocess, "run", side_effect=FileNotFoundError):
+            assert system_info._run(["nope"]) == ""
+
+
+# ── get_remote_login() ────────────────────────────────────────────────────────
+
+@pytest.fixture
+def overrides(tmp_path):
+    """Redirect launchd's override plist into ``tmp_path``.
+
+    Yields a ``write(doc)`` helper that serialises *doc* to that file.
+    """
+    path = tmp_path / "disabled.plist"
+
+    def write(doc: dict) -> None:
+        path.write_bytes(plistlib.dumps(doc))
+
+    with patch.object(system_info, "_LAUNCHD_OVERRIDES", str(path)):
+        yield write
+
+
+class TestGetRemoteLogin:
+    """Tests for the shared Remote Login state lookup."""
+
+    def test_enabled_override(self, overrides):
+        """``com.openssh.sshd: False`` (not disabled) → on, no subprocess."""
+        overrides({"com.openssh.sshd": False})
+        with patch.object(system_info, "_run") as run:
+            assert get_remote_login() is True
+        run.assert_not_called()
+
+    def test_disabled_override(self, overrides):
+        """``com.openssh.sshd: True`` → off."""
+        overrides({"com.openssh.sshd": True})
+        assert get_remote_login() is False
+
+    def test_absent_label_is_default_off(self, overrides):
+        """No override entry → sshd's shipped ``Disabled`` default → off."""
+        overrides({"com.apple.smbd": False})
+        assert get_remote_login() is False
+
+    def test_unreadable_plist_falls_back_to_systemsetup(self, overrides):
+        """Missing plist → ``systemsetup -getremotelogin`` output decides."""
+        with patch.object(system_info, "_run", return_value="Remote Login: On") as run:
+            assert get_remote_login() is True
+            get_remote_login()
+        run.assert_called_once_with(["systemsetup", "-getremotelogin"])
+
+    def test_systemsetup_refusal_is_unknown(self, overrides):
+        """A non-answer from ``systemsetup`` (needs admin) → ``None``."""
+        with patch.object(
+            system_info, "_run",
+            return_value="You need administrator access to run this tool... exiting!",
+        ):
+            assert get_remote_login() is None
+
+
+# ── stat_path() ───────────────────────────────────────────────────────────────
+
+class TestStatPath:
+    """Tests for the scan-scoped ``os.stat`` cache."""
+
+    def test_existing_path_stats_once(self, tmp_path):
+        """Repeated probes of one path share a single ``os.stat`` call."""
+        target = tmp_path / "f"
+        target.write_text("x")
+        with patch.object(system_info.os, "stat", wraps=system_info.os.stat) as st:
+            assert stat_path(target).st_size == 1
+            assert stat_path(target) is not None
+        assert st.call_count == 1
+
+    def test_missing_path_is_none(self, tmp_path):
+        """A path that does not exist → ``None``, not an exception."""
+        assert stat_path(tmp_path / "absent") is None
+
+
+# ── scan_cache / clear_scan_caches() ──────────────────────────────────────────
+
+class TestScanCache:
+    """Tests for the scan-scoped cache registry."""
+
+    def test_memoizes_within_a_scan(self):
+        """Repeated calls between clears run the fetcher once."""
+        calls = []
+
+        @scan_cache()
+        def fetch():
+            calls.append(1)
+            return "data"
+
+        assert fetch() == fetch() == "data"
+        assert len(calls) == 1
+
+    def test_concurrent_misses_fetch_once(self):
+        """Threads that miss together share one fetch instead of racing."""
+        calls = []
+        release = threading.Event()
+
+        @scan_cache()
+        def fetch():
+            calls.append(1)
+            release.wait(1)
+            return "data"
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            futures = [pool.submit(fetch) for _ in range(4)]
+            release.set()
+            assert [f.result() for f in futures] == ["data"] * 4
+        assert len(calls) == 1
+
+    def test_slow_miss_does_not_block_other_keys(self):
+        """A fetch in flight for one key never holds up hits or other keys."""
+        started, release = threading.Event(), threading.Event()
+
+        @scan_cache(maxsize=4)
+        def fetch(key):
+            if key == "slow":
+                started.set()
+                release.wait(5)
+            return key
+
+        assert fetch("cached") == "cached"
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            slow = pool.submit(fetch, "slow")
+            assert started.wait(1)
+            try:
+                assert pool.submit(fetch, "cached").result(timeout=1) == "cached"
+                assert pool.submit(fetch, "other").result(timeout=1) == "other"
+            finally:
+                release.set()
+            assert slow.result() == "slow"
+
+    def test_cached_none_is_a_hit(self):
+        """A ``None`` result is cached like any other value."""
+        calls = []
+
+        @scan_cache()
+        def fetch():
+            calls.append(1)
+
+        assert fetch() is fetch() is None
+        assert len(calls) == 1
+
+    def test_evicts_oldest_beyond_maxsize(self):
+        """Only the *maxsize* most recently stored keys stay cached."""
+        calls = []
+
+        @scan_cache(maxsize=2)
+        def fetch(key):
+            calls.append(key)
+            return key
+
+        for key in ("a", "b", "c", "c", "a"):
+            fetch(key)
+        assert calls == ["a", "b", "c", "a"]
+
+    def test_clear_invalidates_every_registered_cache(self):
+        """One ``clear_scan_caches()`` call forces a fresh read everywhere."""
+        with patch.object(system_info, "_run", return_value=_LAUNCHCTL_OUTPUT) as run:
+            get_launchd_jobs()
+            clear_scan_caches()
+            get_launchd_jobs()
+        assert run.call_count == 2
+
+    def test_check_module_fetchers_are_registered(self):
+        """Shared fetchers in the check modules opt into scan scoping."""
+        from macaudit.checks import hardware, security, system
+
+        for fn in (
+            hardware._get_power_data,
+            security._loginwindow_prefs,
+            security._read_authorized_keys,
+            security._read_sshd_config,
+            get_remote_login,
+            system._fetch_software_updates,
+            system._read_plist,
+            get_launchd_jobs,
+            stat_path,
+        ):
+            assert fn in system_info._SCAN_CACHES